@@ -31,6 +31,7 @@ class EmailMonitor:
         """
         self.config = config
         self.callback = callback
+        self.status_callback = None
         self.running = False
         self.monitor_thread = None
         self.filter_date = None
@@ -49,6 +50,26 @@ class EmailMonitor:
         self.callback = callback
         logger.debug("Email monitor callback set")
     
+    def set_status_callback(self, callback: Callable[[bool], None]) -> None:
+        """
+        Set the function to be called when monitoring starts or stops.
+        
+        Args:
+            callback: Function to call with the new running state
+        """
+        self.status_callback = callback
+        logger.debug("Email monitor status callback set")
+    
+    def _notify_status(self) -> None:
+        """
+        Report the current running state to the status callback.
+        """
+        if self.status_callback:
+            try:
+                self.status_callback(self.running)
+            except Exception as e:
+                logger.error(f"Error in status callback: {str(e)}")
+    
     def is_monitoring(self) -> bool:
         """
         Check if email monitoring is currently active.
@@ -159,6 +180,7 @@ class EmailMonitor:
         self.monitor_thread.start()
         
         logger.info(f"Email monitoring started with {interval}s interval")
+        self._notify_status()
         return True
     
     def _monitoring_loop(self, interval: int) -> None:
@@ -200,6 +222,7 @@ class EmailMonitor:
                 logger.warning("Monitor thread did not terminate cleanly")
             
         logger.info("Email monitoring stopped")
+        self._notify_status()
     
     def check_new_emails(self) -> List[Dict[str, Any]]:
         """
@@ -10,11 +10,40 @@ against predefined keywords and patterns.
 import re
 import logging
 import datetime
-from typing import Dict, List, Any, Optional, Tuple, Set
+import functools
+from typing import Dict, List, Any, Optional, Tuple, Set, Pattern, Sequence
 
 # Logger setup
 logger = logging.getLogger(__name__)
 
+# Separators replaced with spaces, and whitespace runs collapsed, by normalize_content
+_SEPARATOR_PATTERN = re.compile(r'[_\-:;,\.\n\r\t]')
+_WHITESPACE_PATTERN = re.compile(r'\s+')
+
+# Labels that introduce a company name, tried in order
+_COMPANY_LABEL_PATTERNS = tuple(re.compile(pattern, re.IGNORECASE) for pattern in (
+    r'company[:\s]+([^,\n\r]+)',
+    r'organization[:\s]+([^,\n\r]+)',
+    r'client[:\s]+([^,\n\r]+)',
+    r'customer[:\s]+([^,\n\r]+)'
+))
+
+# Incident reference formats, tried in order of preference
+_INCIDENT_REFERENCE_PATTERNS = tuple(re.compile(pattern, re.IGNORECASE) for pattern in (
+    r'incident[:\s#]+(\w+-\d+-\d+)',  # INC-2025-001
+    r'incident[:\s#]+(\w+-\d+)',      # INC-001
+    r'reference[:\s#]+(\w+-\d+-\d+)',
+    r'reference[:\s#]+(\w+-\d+)',
+    r'ref[:\s#]+(\w+-\d+-\d+)',
+    r'ref[:\s#]+(\w+-\d+)',
+    r'case[:\s#]+(\w+-\d+-\d+)',
+    r'case[:\s#]+(\w+-\d+)',
+    r'ticket[:\s#]+(\w+-\d+-\d+)',
+    r'ticket[:\s#]+(\w+-\d+)',
+    r'(\w+-\d+-\d+)',  # Standalone reference like INC-2025-001
+    r'(\w+-\d+)'       # Standalone reference like INC-001
+))
+
 def parse_email_content(email_content: str, keywords: List[str]) -> Dict[str, Any]:
     """
     Parse email content and extract information based on keywords.
@@ -63,10 +92,10 @@ def normalize_content(content: str) -> str:
     normalized = content.lower()
     
     # Replace common separators with spaces
-    normalized = re.sub(r'[_\-:;,\.\n\r\t]', ' ', normalized)
+    normalized = _SEPARATOR_PATTERN.sub(' ', normalized)
     
     # Remove extra whitespace
-    normalized = re.sub(r'\s+', ' ', normalized)
+    normalized = _WHITESPACE_PATTERN.sub(' ', normalized)
     
     return normalized
 
@@ -106,13 +135,37 @@ def extract_value_for_keyword(content: str, keyword: str) -> Optional[str]:
     
     return None
 
-def extract_company_name(email_content: str, company_names: List[str]) -> Optional[str]:
+def compile_company_pattern(company_names: Sequence[str]) -> Optional[Pattern[str]]:
+    """
+    Compile the known company names into a single word-boundary pattern.
+    
+    The pattern is a lookahead, so one scan reports every (possibly
+    overlapping) standalone mention; longer names are tried first at each
+    position.
+    
+    Args:
+        company_names: List of known company names to match
+        
+    Returns:
+        Compiled pattern, or None if there are no company names
+    """
+    if not company_names:
+        return None
+    
+    sorted_companies = sorted(company_names, key=len, reverse=True)
+    alternation = '|'.join(re.escape(company) for company in sorted_companies)
+    return re.compile(rf'(?=\b({alternation})\b)', re.IGNORECASE)
+
+def extract_company_name(email_content: str, company_names: Sequence[str],
+                         company_pattern: Optional[Pattern[str]] = None) -> Optional[str]:
     """
     Extract company name from email content.
     
     Args:
         email_content: The email content to parse
         company_names: List of known company names to match
+        company_pattern: Optional pattern from compile_company_pattern for the
+            same company names, reused across emails
         
     Returns:
         Extracted company name or None if not found
@@ -122,15 +175,8 @@ def extract_company_name(email_content: str, company_names: List[str]) -> Option
     sorted_companies = sorted(company_names, key=len, reverse=True)
     
     # First try to find exact matches with common label patterns
-    company_patterns = [
-        r'company[:\s]+([^,\n\r]+)',
-        r'organization[:\s]+([^,\n\r]+)',
-        r'client[:\s]+([^,\n\r]+)',
-        r'customer[:\s]+([^,\n\r]+)'
-    ]
-    
-    for pattern in company_patterns:
-        match = re.search(pattern, email_content, re.IGNORECASE)
+    for pattern in _COMPANY_LABEL_PATTERNS:
+        match = pattern.search(email_content)
         if match:
             company_text = match.group(1).strip()
             # Check if this matches any known company
@@ -139,7 +185,17 @@ def extract_company_name(email_content: str, company_names: List[str]) -> Option
                     logger.debug(f"Found company name with pattern: {company}")
                     return company
     
-    # If no match found with patterns, try direct matching
+    # If no match found with patterns, try direct matching in a single pass
+    if company_pattern is not None:
+        found = {match.group(1).lower() for match in company_pattern.finditer(email_content)}
+        for company in sorted_companies:
+            if company.lower() in found:
+                logger.debug(f"Found company name with direct match: {company}")
+                return company
+        
+        logger.debug("No company name found in email content")
+        return None
+    
     for company in sorted_companies:
         if company.lower() in email_content.lower():
             # Check if it's a standalone mention, not part of another word
@@ -161,24 +217,9 @@ def extract_incident_reference(email_content: str) -> Optional[str]:
     Returns:
         Extracted incident reference or None if not found
     """
-    # Common patterns for incident references
-    patterns = [
-        r'incident[:\s#]+(\w+-\d+-\d+)',  # INC-2025-001
-        r'incident[:\s#]+(\w+-\d+)',      # INC-001
-        r'reference[:\s#]+(\w+-\d+-\d+)',
-        r'reference[:\s#]+(\w+-\d+)',
-        r'ref[:\s#]+(\w+-\d+-\d+)',
-        r'ref[:\s#]+(\w+-\d+)',
-        r'case[:\s#]+(\w+-\d+-\d+)',
-        r'case[:\s#]+(\w+-\d+)',
-        r'ticket[:\s#]+(\w+-\d+-\d+)',
-        r'ticket[:\s#]+(\w+-\d+)',
-        r'(\w+-\d+-\d+)',  # Standalone reference like INC-2025-001
-        r'(\w+-\d+)'       # Standalone reference like INC-001
-    ]
-    
-    for pattern in patterns:
-        match = re.search(pattern, email_content, re.IGNORECASE)
+    # Try the labelled formats before standalone references
+    for pattern in _INCIDENT_REFERENCE_PATTERNS:
+        match = pattern.search(email_content)
         if match:
             reference = match.group(1).upper()  # Convert to uppercase for consistency
             logger.debug(f"Found incident reference: {reference}")
@@ -187,6 +228,24 @@ def extract_incident_reference(email_content: str) -> Optional[str]:
     logger.debug("No incident reference found in email content")
     return None
 
+@functools.lru_cache(maxsize=32)
+def _compile_keyword_pattern(keywords: Tuple[str, ...]) -> Pattern[str]:
+    """
+    Compile lowercase keywords into a single whole-word pattern.
+    
+    The pattern is a lookahead, so one scan visits every position; at each
+    position the longest matching keyword is captured.
+    
+    Args:
+        keywords: Distinct lowercase keywords
+        
+    Returns:
+        Compiled pattern
+    """
+    sorted_keywords = sorted(keywords, key=len, reverse=True)
+    alternation = '|'.join(re.escape(keyword) for keyword in sorted_keywords)
+    return re.compile(rf'(?=\b({alternation})\b)')
+
 def match_predefined_keywords(email_content: str, keywords: Dict[str, List[str]]) -> Dict[str, List[str]]:
     """
     Match predefined keywords in email content.
@@ -203,13 +262,24 @@ def match_predefined_keywords(email_content: str, keywords: Dict[str, List[str]]
     # Normalize content for better matching
     normalized_content = normalize_content(email_content)
     
+    # Find all keywords in one scan of the content
+    lowered = frozenset(keyword.lower() for keyword_list in keywords.values() for keyword in keyword_list)
+    if not lowered:
+        return results
+    pattern = _compile_keyword_pattern(tuple(sorted(lowered)))
+    found = {match.group(1) for match in pattern.finditer(normalized_content)}
+    
     for category, keyword_list in keywords.items():
         matches = []
         for keyword in keyword_list:
-            # Try to match the keyword as a whole word
-            pattern = rf'\b{re.escape(keyword.lower())}\b'
-            if re.search(pattern, normalized_content):
+            normalized_keyword = keyword.lower()
+            if normalized_keyword in found:
                 matches.append(keyword)
+            elif any(other.startswith(normalized_keyword) for other in found):
+                # A longer keyword may have been captured at the same position,
+                # so check this one on its own as a whole word
+                if re.search(rf'\b{re.escape(normalized_keyword)}\b', normalized_content):
+                    matches.append(keyword)
         
         if matches:
             results[category] = matches
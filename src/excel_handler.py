@@ -9,12 +9,182 @@ including loading data, appending new data, and saving changes.
 
 import os
 import logging
+import functools
+from collections import deque
 from typing import Dict, List, Any, Optional, Tuple
 import pandas as pd
 
 # Logger setup
 logger = logging.getLogger(__name__)
 
+# Engine for read-only workbook access; the Rust-based calamine engine is much
+# faster when installed, but pandas only supports it from 2.2 on. Writes
+# always go through openpyxl
+try:
+    import python_calamine  # noqa: F401
+    _PANDAS_VERSION = tuple(int(part) for part in pd.__version__.split('.')[:2])
+    READ_ENGINE = 'calamine' if _PANDAS_VERSION >= (2, 2) else 'openpyxl'
+except ImportError:
+    READ_ENGINE = 'openpyxl'
+
+@functools.lru_cache(maxsize=16)
+def _read_sheet_names(excel_path: str, mtime: float) -> Tuple[str, ...]:
+    """
+    Read the sheet names of a workbook; cached per path and modification time.
+    
+    Args:
+        excel_path: Path to the Excel file
+        mtime: Modification time of the file, used as part of the cache key
+        
+    Returns:
+        Tuple of sheet names
+    """
+    from openpyxl import load_workbook
+    
+    workbook = load_workbook(excel_path, read_only=True)
+    try:
+        return tuple(workbook.sheetnames)
+    finally:
+        workbook.close()
+
+def _name_columns(header: List[Any]) -> List[Any]:
+    """
+    Name header cells the way pandas does when it reads a sheet.
+    
+    Blank cells become 'Unnamed: i' and repeated names get a '.1', '.2', ...
+    suffix, with named columns taking precedence over unnamed ones.
+    
+    Args:
+        header: Header cell values, None for blank cells
+        
+    Returns:
+        List of column names
+    """
+    columns = [f"Unnamed: {i}" if col is None else col for i, col in enumerate(header)]
+    
+    # Deduplicate named columns first, then the unnamed ones
+    order = [i for i, col in enumerate(header) if col is not None] + [i for i, col in enumerate(header) if col is None]
+    counts: Dict[Any, int] = {}
+    for i in order:
+        col = old_col = columns[i]
+        cur_count = counts.get(col, 0)
+        while cur_count > 0:
+            counts[old_col] = cur_count + 1
+            col = f"{old_col}.{cur_count}"
+            cur_count = cur_count + 1 if col in columns else counts.get(col, 0)
+        columns[i] = col
+        counts[col] = cur_count + 1
+    
+    return columns
+
+@functools.lru_cache(maxsize=8)
+def _read_sheet_tail(excel_path: str, mtime: float, sheet_name: str, num_rows: int) -> Tuple[Tuple[Any, ...], ...]:
+    """
+    Stream a sheet with openpyxl in read-only mode, keeping the header and last n rows.
+    
+    Like reading the sheet into a DataFrame, the first row is the header,
+    blank and duplicate header cells are named as pandas names them, and
+    columns are kept up to the last one with a value in the header or in
+    any of the kept rows.
+    
+    Results are cached per path, modification time, sheet and row count.
+    
+    Args:
+        excel_path: Path to the Excel file
+        mtime: Modification time of the file, used as part of the cache key
+        sheet_name: Name of the sheet to read
+        num_rows: Number of trailing non-empty rows to keep
+        
+    Returns:
+        Tuple of tuples containing the header row followed by up to n data rows
+    """
+    from openpyxl import load_workbook
+    
+    workbook = load_workbook(excel_path, read_only=True, data_only=True)
+    try:
+        if sheet_name not in workbook.sheetnames:
+            raise KeyError(f"Worksheet named '{sheet_name}' not found")
+        
+        # Ignore the stored dimensions, which may be missing or stale
+        worksheet = workbook[sheet_name]
+        worksheet.reset_dimensions()
+        
+        rows = worksheet.iter_rows(values_only=True)
+        header = list(next(rows, ()))
+        
+        # Keep only the last n non-empty rows while streaming
+        tail = deque(maxlen=num_rows)
+        for row in rows:
+            if any(value is not None for value in row):
+                tail.append(row)
+    finally:
+        workbook.close()
+    
+    # Keep every column with a value in the header or in one of the kept rows
+    width = 0
+    for row in [header, *tail]:
+        for i in range(len(row) - 1, width - 1, -1):
+            if row[i] is not None:
+                width = i + 1
+                break
+    
+    header = _name_columns((header + [None] * width)[:width])
+    padding = (None,) * width
+    
+    return (tuple(header),) + tuple(tuple(row[:width]) + padding[len(row):] for row in tail)
+
+@functools.lru_cache(maxsize=16)
+def _read_sheet_info(excel_path: str, mtime: float) -> Tuple[Tuple[str, int], ...]:
+    """
+    Count the data rows of every sheet in a workbook; cached per path and modification time.
+    
+    Sheets are streamed with openpyxl in read-only mode. Like reading each
+    sheet into a DataFrame, the first row is the header, even when it is
+    blank, and trailing blank rows are not counted.
+    
+    Args:
+        excel_path: Path to the Excel file
+        mtime: Modification time of the file, used as part of the cache key
+        
+    Returns:
+        Tuple of (sheet name, row count) pairs
+    """
+    from openpyxl import load_workbook
+    
+    workbook = load_workbook(excel_path, read_only=True, data_only=True)
+    try:
+        sheet_info = []
+        for worksheet in workbook.worksheets:
+            # Ignore the stored dimensions, which may be missing or stale
+            worksheet.reset_dimensions()
+            
+            # Every row after the header up to the last non-empty one is a data row
+            last = 0
+            for index, row in enumerate(worksheet.iter_rows(values_only=True)):
+                if any(value is not None for value in row):
+                    last = index
+            sheet_info.append((worksheet.title, last))
+        return tuple(sheet_info)
+    finally:
+        workbook.close()
+
+class ExcelLockedError(OSError):
+    """
+    Error recorded or raised when the Excel file is open in another program.
+    """
+
+def _is_locked_error(error: OSError) -> bool:
+    """
+    Check whether an OS error means the Excel file is locked by another program.
+    
+    Args:
+        error: Error raised while opening the file
+        
+    Returns:
+        True if the file is locked, False otherwise
+    """
+    return isinstance(error, PermissionError) or "being used by another process" in str(error)
+
 class ExcelHandler:
     def __init__(self, excel_config: Dict[str, Any], populate_config: Dict[str, Any]):
         """
@@ -29,7 +199,9 @@ class ExcelHandler:
         self.populate_config = populate_config
         self.sheet_mapping = populate_config  # Initialize sheet_mapping from populate_config
         self._excel_file = None
+        self._loaded_key = None
         self._dataframes = {}
+        self.last_error: Optional[Exception] = None
         
         # Check if Excel file exists
         if self.excel_path and os.path.exists(self.excel_path):
@@ -37,11 +209,24 @@ class ExcelHandler:
         else:
             logger.warning(f"Excel file not found at {self.excel_path}")
         
+    @property
+    def is_locked(self) -> bool:
+        """
+        Whether the last file operation failed because the file is open in another program.
+        """
+        return isinstance(self.last_error, ExcelLockedError)
+    
+    @property
+    def is_loaded(self) -> bool:
+        """Whether the Excel file is currently open."""
+        return self._excel_file is not None
+    
     def close(self):
         """Close any open Excel file handles."""
         if self._excel_file is not None:
             self._excel_file.close()
             self._excel_file = None
+            self._loaded_key = None
             logger.debug("Closed Excel file")
             
     def __del__(self):
@@ -52,31 +237,41 @@ class ExcelHandler:
         """
         Load Excel file and verify it exists.
         
+        Calling this again for the same, unmodified file is a no-op.
+        
         Returns:
             bool: True if successful, False otherwise
         """
-        # Close any existing file handle
-        self.close()
+        self.last_error = None
         
         if not self.excel_path or not os.path.exists(self.excel_path):
+            self.close()
             logger.error(f"Excel file not found: {self.excel_path}")
             return False
+        
+        # Skip reloading when the same file hasn't changed since the last load
+        loaded_key = (self.excel_path, os.path.getmtime(self.excel_path))
+        if self._excel_file is not None and self._loaded_key == loaded_key:
+            logger.debug(f"Excel file already loaded: {self.excel_path}")
+            return True
+        
+        # Close any existing file handle
+        self.close()
             
         try:
             try:
                 # Try to open the file to check if it's locked
                 with open(self.excel_path, 'rb') as f:
                     # Try to read the Excel file directly
-                    self._excel_file = pd.ExcelFile(self.excel_path, engine='openpyxl')
-            except PermissionError:
+                    self._excel_file = pd.ExcelFile(self.excel_path, engine=READ_ENGINE)
+            except OSError as e:
+                if not _is_locked_error(e):
+                    raise
+                self.last_error = ExcelLockedError(str(e))
                 logger.error(f"Cannot access Excel file: File is open in another program")
                 return False
-            except OSError as e:
-                if "being used by another process" in str(e):
-                    logger.error(f"Cannot access Excel file: File is open in another program")
-                    return False
-                raise
                 
+            self._loaded_key = loaded_key
             logger.info(f"Successfully loaded Excel file")
             return True
             
@@ -95,6 +290,8 @@ class ExcelHandler:
         Returns:
             List of lists containing the header row and the last n rows of data
         """
+        self.last_error = None
+        
         sheet_name = sheet_name or self.selected_sheet
         
         try:
@@ -106,17 +303,15 @@ class ExcelHandler:
             try:
                 # Try to open the file to check if it's locked
                 with open(self.excel_path, 'rb') as f:
-                    # Read the sheet directly using openpyxl engine
+                    # Read the sheet directly with the read engine
                     logger.info(f"Reading sheet '{sheet_name}' from {self.excel_path}")
-                    df = pd.read_excel(self.excel_path, sheet_name=sheet_name, engine='openpyxl')
-            except PermissionError:
+                    df = pd.read_excel(self.excel_path, sheet_name=sheet_name, engine=READ_ENGINE)
+            except OSError as e:
+                if not _is_locked_error(e):
+                    raise
+                self.last_error = ExcelLockedError(str(e))
                 logger.error(f"Cannot access Excel file: File is open in another program")
                 return None
-            except OSError as e:
-                if "being used by another process" in str(e):
-                    logger.error(f"Cannot access Excel file: File is open in another program")
-                    return None
-                raise
             
             if df.empty:
                 logger.warning(f"Sheet '{sheet_name}' is empty")
@@ -138,6 +333,48 @@ class ExcelHandler:
             logger.error(f"Error reading sheet '{sheet_name}': {str(e)}")
             return None
             
+    def peek_tail(self, sheet_name: Optional[str] = None, num_rows: int = 5) -> Optional[List[List[Any]]]:
+        """
+        Get the header and the last n rows of a sheet without building a DataFrame.
+        
+        The sheet is streamed with openpyxl in read-only mode and only the
+        last n non-empty rows are kept in memory.
+        
+        Args:
+            sheet_name: Name of the sheet to preview (defaults to selected_sheet)
+            num_rows: Number of rows to preview (default: 5)
+            
+        Returns:
+            List of lists containing the header row and the last n rows of data,
+            or None if the sheet can't be read or has no data rows
+        """
+        self.last_error = None
+        
+        sheet_name = sheet_name or self.selected_sheet
+        
+        try:
+            if not self.excel_path or not os.path.exists(self.excel_path):
+                logger.warning(f"Excel file not found: {self.excel_path}")
+                return None
+            
+            try:
+                preview = self.read_sheet_tail(self.excel_path, sheet_name, num_rows)
+            except ExcelLockedError as e:
+                self.last_error = e
+                logger.error(f"Cannot access Excel file: File is open in another program")
+                return None
+            
+            if len(preview) < 2:
+                logger.warning(f"Sheet '{sheet_name}' is empty")
+                return None
+            
+            logger.info(f"Successfully read {len(preview) - 1} rows from sheet '{sheet_name}'")
+            return preview
+            
+        except Exception as e:
+            logger.error(f"Error reading sheet '{sheet_name}': {str(e)}")
+            return None
+            
     def populate_data(self, data_type: str, data: List[List[Any]]) -> bool:
         """
         Populate data to Excel based on the populate_config mapping.
@@ -149,6 +386,8 @@ class ExcelHandler:
         Returns:
             bool: True if successful, False otherwise
         """
+        self.last_error = None
+        
         if not self.excel_path:
             logger.error("Excel file path not set")
             return False
@@ -192,14 +431,12 @@ class ExcelHandler:
                     logger.info(f"Successfully populated {len(data)-1} rows to sheet '{sheet_name}'")
                     return True
                     
-            except PermissionError:
+            except OSError as e:
+                if not _is_locked_error(e):
+                    raise
+                self.last_error = ExcelLockedError(str(e))
                 logger.error(f"Cannot access Excel file: File is open in another program")
                 return False
-            except OSError as e:
-                if "being used by another process" in str(e):
-                    logger.error(f"Cannot access Excel file: File is open in another program")
-                    return False
-                raise
                 
         except Exception as e:
             logger.error(f"Error populating data: {str(e)}")
@@ -216,9 +453,22 @@ class ExcelHandler:
         Returns:
             True if successful, False otherwise
         """
+        return self.append_rows(data_type, [data]) == 1
+    
+    def append_rows(self, data_type: str, rows: List[Dict[str, Any]]) -> int:
+        """
+        Append several rows to the specified sheet with a single concatenation.
+        
+        Args:
+            data_type: Type of data to append (must be in populate_config)
+            rows: Dictionaries of data to append
+            
+        Returns:
+            Number of rows appended
+        """
         if data_type not in self.populate_config:
             logger.error(f"Unknown data type: {data_type}")
-            return False
+            return 0
         
         mapping = self.populate_config[data_type]
         sheet_name = mapping.get('sheet_name', self.selected_sheet)
@@ -228,20 +478,43 @@ class ExcelHandler:
         if sheet_name not in self._dataframes:
             self._dataframes[sheet_name] = pd.DataFrame(columns=column_mapping.values())
         
-        # Validate the data before appending
-        valid_data, row_data = self._validate_and_format_data(data_type, data)
-        if not valid_data:
-            logger.error(f"Invalid data for {data_type}")
-            return False
+        # Validate the rows before appending
+        new_rows = []
+        for data in rows:
+            valid_data, row_data = self._validate_and_format_data(data_type, data)
+            if not valid_data:
+                logger.error(f"Invalid data for {data_type}")
+                continue
+            new_rows.append(row_data)
+        
+        if not new_rows:
+            return 0
         
         # Append the data
         self._dataframes[sheet_name] = pd.concat([
             self._dataframes[sheet_name], 
-            pd.DataFrame([row_data])
+            pd.DataFrame(new_rows)
         ], ignore_index=True)
         
-        logger.debug(f"Appended data to {sheet_name}")
-        return True
+        logger.debug(f"Appended {len(new_rows)} rows to {sheet_name}")
+        return len(new_rows)
+    
+    def get_sheet_data(self, data_type: str) -> Optional[pd.DataFrame]:
+        """
+        Get the in-memory data for the sheet mapped to a data type.
+        
+        Args:
+            data_type: Type of data (must be in populate_config)
+            
+        Returns:
+            DataFrame holding the sheet's rows, or None if nothing is loaded
+        """
+        if data_type not in self.populate_config:
+            logger.error(f"Unknown data type: {data_type}")
+            return None
+        
+        sheet_name = self.populate_config[data_type].get('sheet_name', self.selected_sheet)
+        return self._dataframes.get(sheet_name)
     
     def _validate_and_format_data(self, data_type: str, data: Dict[str, Any]) -> Tuple[bool, Dict[str, Any]]:
         """
@@ -436,11 +709,59 @@ class ExcelHandler:
             logger.error(f"Error saving Excel file: {str(e)}")
             return False
 
+    @staticmethod
+    def read_sheet_tail(excel_path: str, sheet_name: str, num_rows: int = 5) -> List[List[Any]]:
+        """
+        Read the header and the last n rows of a sheet by streaming it.
+        
+        Results are cached until the file is modified. Unlike peek_tail,
+        errors are raised to the caller so it can fall back to another reader;
+        a file that is open in another program raises ExcelLockedError. No
+        handler state is touched, so this is safe to call from worker threads.
+        
+        Args:
+            excel_path: Path to the Excel file
+            sheet_name: Name of the sheet to read
+            num_rows: Number of rows to read (default: 5)
+            
+        Returns:
+            List of lists containing the header row followed by up to n data rows
+        """
+        try:
+            preview = _read_sheet_tail(excel_path, os.path.getmtime(excel_path), sheet_name, num_rows)
+        except OSError as e:
+            if not _is_locked_error(e):
+                raise
+            raise ExcelLockedError(str(e)) from e
+        return [list(row) for row in preview]
+    
+    @staticmethod
+    def get_sheet_names(excel_path: str) -> List[str]:
+        """
+        Get the sheet names of an Excel file.
+        
+        Names are cached until the file is modified.
+        
+        Args:
+            excel_path: Path to the Excel file
+            
+        Returns:
+            List of sheet names, empty if the file can't be read
+        """
+        try:
+            return list(_read_sheet_names(excel_path, os.path.getmtime(excel_path)))
+        except Exception as e:
+            logger.error(f"Error reading sheet names from {excel_path}: {str(e)}")
+            return []
+    
     @staticmethod
     def get_excel_sheet_info(excel_path: str) -> Dict[str, int]:
         """
         Get information about sheets in an Excel file.
         
+        Row counts are cached until the file is modified, so repeated
+        lookups for the same file do not reopen the workbook.
+        
         Args:
             excel_path: Path to the Excel file
             
@@ -454,16 +775,8 @@ class ExcelHandler:
                 logger.warning(f"Excel file does not exist: {excel_path}")
                 return sheet_info
             
-            # Load Excel file
-            # Explicitly use openpyxl engine for .xlsx files
-            excel_file = pd.ExcelFile(excel_path, engine='openpyxl')
-            
             # Get sheet names and row counts
-            for sheet_name in excel_file.sheet_names:
-                # Read the sheet to get row count
-                # Explicitly use openpyxl engine for .xlsx files
-                df = pd.read_excel(excel_file, sheet_name=sheet_name, engine='openpyxl')
-                sheet_info[sheet_name] = len(df)
+            sheet_info = dict(_read_sheet_info(excel_path, os.path.getmtime(excel_path)))
                 
             logger.debug(f"Found {len(sheet_info)} sheets in {excel_path}")
             return sheet_info
@@ -14,9 +14,14 @@ import shutil
 from datetime import datetime
 from typing import Dict, List, Any, Optional, Union, Tuple
 
+from src.utils.json_io import encode_config
+
 # Logger setup
 logger = logging.getLogger(__name__)
 
+# Buffer size used when copying backups without copy_file_range
+_COPY_BUFSIZE = 1 << 20
+
 def load_json_config(file_path: str) -> Optional[Dict[str, Any]]:
     """
     Load a JSON configuration file.
@@ -48,6 +53,9 @@ def save_json_config(file_path: str, config: Dict[str, Any]) -> bool:
     """
     Save a configuration to a JSON file.
     
+    The file is written to a temporary file next to it and moved into place,
+    so readers never see a partially written configuration.
+    
     Args:
         file_path: Path to save the JSON file
         config: Dictionary containing the configuration
@@ -63,8 +71,19 @@ def save_json_config(file_path: str, config: Dict[str, Any]) -> bool:
         # Ensure the directory exists
         os.makedirs(os.path.dirname(file_path), exist_ok=True)
         
-        with open(file_path, 'w', encoding='utf-8') as f:
-            json.dump(config, f, indent=4, ensure_ascii=False)
+        # Write a temporary file and atomically replace the original with it
+        data = encode_config(config)
+        tmp_path = f"{file_path}.tmp"
+        try:
+            with open(tmp_path, 'wb') as f:
+                f.write(data)
+                f.flush()
+                os.fsync(f.fileno())
+            os.replace(tmp_path, file_path)
+        except BaseException:
+            if os.path.exists(tmp_path):
+                os.remove(tmp_path)
+            raise
             
         logger.debug(f"Saved configuration to {file_path}")
         return True
@@ -93,13 +112,43 @@ def create_backup(file_path: str) -> bool:
         name, ext = os.path.splitext(filename)
         backup_path = os.path.join(backup_dir, f"{name}_{timestamp}{ext}")
         
-        shutil.copy2(file_path, backup_path)
+        _copy_file(file_path, backup_path)
         logger.debug(f"Created backup: {backup_path}")
         return True
     except Exception as e:
         logger.error(f"Error creating backup: {str(e)}")
         return False
 
+def _copy_file(src: str, dst: str) -> None:
+    """
+    Copy file contents without preserving metadata.
+    
+    The backup filename already carries the timestamp, so the stat/xattr
+    copying done by shutil.copy2 is unnecessary. Uses an in-kernel copy where
+    available and falls back to a buffered content copy.
+    
+    Args:
+        src: Path to the source file
+        dst: Path to the destination file
+    """
+    if hasattr(os, 'copy_file_range'):
+        try:
+            with open(src, 'rb') as fsrc, open(dst, 'wb') as fdst:
+                remaining = os.fstat(fsrc.fileno()).st_size
+                while remaining > 0:
+                    copied = os.copy_file_range(fsrc.fileno(), fdst.fileno(), remaining)
+                    if copied == 0:
+                        break
+                    remaining -= copied
+                if remaining == 0:
+                    return
+        except OSError:
+            pass
+    
+    with open(src, 'rb', buffering=_COPY_BUFSIZE) as fsrc, \
+            open(dst, 'wb', buffering=_COPY_BUFSIZE) as fdst:
+        shutil.copyfileobj(fsrc, fdst, _COPY_BUFSIZE)
+
 def validate_json_config(config: Dict[str, Any], schema: Dict[str, Any]) -> Tuple[bool, List[str]]:
     """
     Validate a JSON configuration against a schema.
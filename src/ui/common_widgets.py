@@ -8,14 +8,14 @@ different parts of the application.
 """
 
 import logging
-from typing import Optional, Callable, List, Dict, Any
+from typing import Optional, Callable, List, Dict, Any, Tuple
 
 from PyQt6.QtWidgets import (
-    QWidget, QHBoxLayout, QVBoxLayout, QLabel, QPushButton,
-    QLineEdit, QComboBox, QFormLayout, QFrame, QSizePolicy
+    QApplication, QWidget, QHBoxLayout, QVBoxLayout, QLabel, QPushButton,
+    QLineEdit, QComboBox, QSizePolicy
 )
-from PyQt6.QtCore import Qt, pyqtSignal, QSize
-from PyQt6.QtGui import QColor, QPalette
+from PyQt6.QtCore import Qt, pyqtSignal, pyqtSlot, QSize
+from PyQt6.QtGui import QColor, QPixmap
 
 # Logger setup
 logger = logging.getLogger(__name__)
@@ -25,6 +25,13 @@ class StatusIndicator(QWidget):
     A widget that shows a status indicator with a label and colored circle.
     """
     
+    # Indicator colors (active - green, inactive - red)
+    _ACTIVE_COLOR = QColor(0, 200, 0)
+    _INACTIVE_COLOR = QColor(200, 0, 0)
+    
+    # Shared (active, inactive) pixmaps, created on first use
+    _pixmap_cache: Optional[Tuple[QPixmap, QPixmap]] = None
+    
     def __init__(self, label_text: str, initial_status: bool = False, parent: Optional[QWidget] = None):
         """
         Initialize the status indicator.
@@ -41,6 +48,29 @@ class StatusIndicator(QWidget):
         # Initialize UI components
         self._init_ui()
     
+    @classmethod
+    def _pixmaps(cls) -> Tuple[QPixmap, QPixmap]:
+        """
+        Get the indicator pixmaps shared by all instances.
+        
+        Pixmaps can only be allocated once a QApplication exists, so they are
+        built on first use rather than at class load.
+        
+        Returns:
+            Tuple of (active pixmap, inactive pixmap)
+        """
+        if cls._pixmap_cache is None:
+            if QApplication.instance() is None:
+                raise RuntimeError("StatusIndicator requires a QApplication")
+            
+            active = QPixmap(12, 12)
+            active.fill(cls._ACTIVE_COLOR)
+            inactive = QPixmap(12, 12)
+            inactive.fill(cls._INACTIVE_COLOR)
+            cls._pixmap_cache = (active, inactive)
+        
+        return cls._pixmap_cache
+    
     def _init_ui(self) -> None:
         """
         Initialize UI components.
@@ -52,10 +82,8 @@ class StatusIndicator(QWidget):
         self.label = QLabel(self.label_text)
         
         # Create status indicator
-        self.indicator = QFrame()
+        self.indicator = QLabel()
         self.indicator.setFixedSize(QSize(12, 12))
-        self.indicator.setFrameShape(QFrame.Shape.Box)
-        self.indicator.setFrameShadow(QFrame.Shadow.Plain)
         self.indicator.setSizePolicy(QSizePolicy.Policy.Fixed, QSizePolicy.Policy.Fixed)
         
         # Set initial status
@@ -70,17 +98,8 @@ class StatusIndicator(QWidget):
         """
         Update the indicator color based on status.
         """
-        palette = self.indicator.palette()
-        
-        if self.status:
-            # Active - green
-            palette.setColor(QPalette.ColorRole.Window, QColor(0, 200, 0))
-        else:
-            # Inactive - red
-            palette.setColor(QPalette.ColorRole.Window, QColor(200, 0, 0))
-        
-        self.indicator.setPalette(palette)
-        self.indicator.setAutoFillBackground(True)
+        active, inactive = self._pixmaps()
+        self.indicator.setPixmap(active if self.status else inactive)
     
     def set_status(self, status: bool) -> None:
         """
@@ -123,25 +142,30 @@ class LabeledInput(QWidget):
         """
         Initialize UI components.
         """
-        layout = QFormLayout(self)
+        layout = QHBoxLayout(self)
         layout.setContentsMargins(0, 0, 0, 0)
         
+        # Create label
+        self.label = QLabel(self.label_text)
+        
         # Create input field
         self.input = QLineEdit()
         self.input.setPlaceholderText(self.placeholder)
-        self.input.textChanged.connect(self._on_text_changed)
+        self.input.editingFinished.connect(self._on_editing_finished)
         
         # Add to layout
-        layout.addRow(self.label_text, self.input)
+        layout.addWidget(self.label)
+        layout.addWidget(self.input, 1)
     
-    def _on_text_changed(self, text: str) -> None:
+    @pyqtSlot()
+    def _on_editing_finished(self) -> None:
         """
-        Handle text changed event.
+        Handle editing finished event.
         
-        Args:
-            text: New text value
+        Emits valueChanged once the user commits the edit rather than on
+        every keystroke.
         """
-        self.valueChanged.emit(text)
+        self.valueChanged.emit(self.input.text())
     
     def get_value(self) -> str:
         """
@@ -188,17 +212,22 @@ class LabeledComboBox(QWidget):
         """
         Initialize UI components.
         """
-        layout = QFormLayout(self)
+        layout = QHBoxLayout(self)
         layout.setContentsMargins(0, 0, 0, 0)
         
+        # Create label
+        self.label = QLabel(self.label_text)
+        
         # Create combo box
         self.combo = QComboBox()
         self.combo.addItems(self.items)
         self.combo.currentTextChanged.connect(self._on_text_changed)
         
         # Add to layout
-        layout.addRow(self.label_text, self.combo)
+        layout.addWidget(self.label)
+        layout.addWidget(self.combo, 1)
     
+    @pyqtSlot(str)
     def _on_text_changed(self, text: str) -> None:
         """
         Handle text changed event.
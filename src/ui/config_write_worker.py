@@ -0,0 +1,60 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+Background configuration writing.
+
+This module provides a QRunnable that writes JSON configuration files
+off the GUI thread and reports the outcome back to it.
+"""
+
+import logging
+from typing import Dict, Any
+
+from PyQt6.QtCore import QObject, QRunnable, pyqtSignal
+
+from src.json_admin import save_json_config
+
+# Logger setup
+logger = logging.getLogger(__name__)
+
+class ConfigWriteWorker(QRunnable):
+    """
+    Runnable that saves one or more configurations to JSON files.
+    """
+    
+    class Signals(QObject):
+        """
+        Signals emitted by the write worker.
+        """
+        writeFinished = pyqtSignal(str, bool)
+        allFinished = pyqtSignal(bool)
+    
+    def __init__(self, configs: Dict[str, Dict[str, Any]]):
+        """
+        Initialize the write worker.
+        
+        Args:
+            configs: Configurations to save, keyed by file path; must not be
+                modified while the worker runs
+        """
+        super().__init__()
+        self.configs = configs
+        self.signals = ConfigWriteWorker.Signals()
+    
+    def run(self) -> None:
+        """
+        Save the configurations, emitting writeFinished for each file and
+        allFinished once all of them have been written.
+        """
+        all_saved = True
+        for file_path, config in self.configs.items():
+            try:
+                success = save_json_config(file_path, config)
+            except Exception as e:
+                logger.error(f"Error writing configuration {file_path}: {str(e)}")
+                success = False
+            
+            all_saved = all_saved and success
+            self.signals.writeFinished.emit(file_path, success)
+        
+        self.signals.allFinished.emit(all_saved)
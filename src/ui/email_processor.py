@@ -0,0 +1,69 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+Background email parsing.
+
+This module provides a QRunnable that parses an incoming email on the
+global thread pool and hands the result back to the GUI thread.
+"""
+
+import logging
+from typing import Dict, Any, Optional, Pattern, Sequence
+
+from PyQt6.QtCore import QObject, QRunnable, pyqtSignal
+
+from src.email_parser import parse_email_content, extract_company_name, extract_incident_reference
+
+# Logger setup
+logger = logging.getLogger(__name__)
+
+class EmailProcessor(QRunnable):
+    """
+    Runnable that extracts keywords, company name and reference from an email.
+    """
+    
+    class Signals(QObject):
+        """
+        Signals emitted by the email processor.
+        """
+        resultReady = pyqtSignal(dict)
+        error = pyqtSignal(str)
+    
+    def __init__(self, email_data: Dict[str, Any], keywords: Sequence[str], companies: Sequence[str],
+                 company_pattern: Optional[Pattern[str]] = None):
+        """
+        Initialize the email processor.
+        
+        Args:
+            email_data: Dictionary containing email data
+            keywords: Keywords to match in the email body
+            companies: Known company names to match in the email body
+            company_pattern: Precompiled pattern for the company names
+        """
+        super().__init__()
+        self.email_data = email_data
+        self.keywords = keywords
+        self.companies = companies
+        self.company_pattern = company_pattern
+        self.signals = EmailProcessor.Signals()
+    
+    def run(self) -> None:
+        """
+        Parse the email and emit the result.
+        
+        The emitted dictionary is the original email data with the
+        'parsed_data', 'company' and 'reference' keys added.
+        """
+        try:
+            body = self.email_data.get('body', '')
+            
+            result = dict(self.email_data)
+            result['parsed_data'] = parse_email_content(body, self.keywords)
+            result['company'] = extract_company_name(body, self.companies, self.company_pattern)
+            result['reference'] = extract_incident_reference(body)
+            
+            self.signals.resultReady.emit(result)
+        
+        except Exception as e:
+            logger.error(f"Error parsing email: {str(e)}")
+            self.signals.error.emit(str(e))
@@ -0,0 +1,67 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+Background Excel preview loading.
+
+This module provides a QRunnable that reads the tail of a sheet on the
+global thread pool and hands the rows back to the GUI thread.
+"""
+
+import logging
+
+from PyQt6.QtCore import QObject, QRunnable, pyqtSignal
+
+from src.excel_handler import ExcelHandler, ExcelLockedError
+
+# Logger setup
+logger = logging.getLogger(__name__)
+
+class ExcelPreviewWorker(QRunnable):
+    """
+    Runnable that reads the header and last rows of a sheet.
+    
+    Only the file path is shared with the GUI thread; no Excel handler
+    state is read or written while the worker runs.
+    """
+    
+    class Signals(QObject):
+        """
+        Signals emitted by the preview worker.
+        """
+        resultReady = pyqtSignal(str, list)
+        error = pyqtSignal(str, bool)
+    
+    def __init__(self, excel_path: str, sheet_name: str, num_rows: int = 5):
+        """
+        Initialize the preview worker.
+        
+        Args:
+            excel_path: Path to the Excel file to read
+            sheet_name: Name of the sheet to preview
+            num_rows: Number of rows to preview (default: 5)
+        """
+        super().__init__()
+        self.excel_path = excel_path
+        self.sheet_name = sheet_name
+        self.num_rows = num_rows
+        self.signals = ExcelPreviewWorker.Signals()
+    
+    def run(self) -> None:
+        """
+        Read the sheet tail and emit it.
+        
+        The emitted list holds the header row followed by the data rows,
+        and is empty if the sheet has no data. On failure the error signal
+        carries the message and whether the file is open in another program.
+        """
+        try:
+            preview_data = ExcelHandler.read_sheet_tail(self.excel_path, self.sheet_name, self.num_rows)
+            self.signals.resultReady.emit(self.sheet_name, preview_data if len(preview_data) > 1 else [])
+        
+        except ExcelLockedError as e:
+            logger.error("Cannot access Excel file: File is open in another program")
+            self.signals.error.emit(str(e), True)
+        
+        except Exception as e:
+            logger.error(f"Error loading Excel preview: {str(e)}")
+            self.signals.error.emit(str(e), False)
@@ -9,28 +9,125 @@ the layout, menus, and event handlers.
 
 import os
 import sys
+import time
 import logging
+import functools
+from collections import deque
 from datetime import datetime
-from typing import Dict, Any, Optional, List
+from typing import Dict, Any, Optional, List, TYPE_CHECKING
 
-from PyQt6.QtCore import Qt, QSize, QTimer
+from PyQt6.QtCore import Qt, QSize, QTimer, QEvent, QCoreApplication, QThreadPool, QFileSystemWatcher, pyqtSlot
 from PyQt6.QtWidgets import (
     QMainWindow, QWidget, QVBoxLayout, QHBoxLayout,
     QPushButton, QLabel, QStatusBar, QTabWidget,
-    QMessageBox, QFileDialog, QTableWidget, QTableWidgetItem,
-    QHeaderView, QTextEdit, QSplitter, QGroupBox
+    QMessageBox, QFileDialog, QTableView,
+    QHeaderView, QPlainTextEdit, QSplitter, QGroupBox
 )
-from PyQt6.QtGui import QIcon, QAction, QCloseEvent
+from PyQt6.QtGui import QIcon, QAction, QCloseEvent, QHideEvent, QShowEvent
 
-from src.ui.settings import SettingsDialog
+from src.excel_handler import ExcelHandler, READ_ENGINE
+from src.json_admin import load_json_config
+from src.utils.config_loader import load_all_configs
 from src.ui.common_widgets import StatusIndicator
-from src.email_monitor import EmailMonitor
-from src.excel_handler import ExcelHandler
-from src.email_parser import parse_email_content, extract_company_name, extract_incident_reference
+from src.ui.excel_preview_worker import ExcelPreviewWorker
+from src.ui.models import TableDataModel, EmailLogModel
+
+if TYPE_CHECKING:
+    from src.email_monitor import EmailMonitor
 
 # Logger setup
 logger = logging.getLogger(__name__)
 
+# Project paths
+_BASE_DIR = os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+_EXCEL_MAPPING_PATH = os.path.join(_BASE_DIR, "config", "excel_sheet_mapping.json")
+
+# Tab positions in the main tab widget
+EMAIL_TAB_INDEX = 0
+EXCEL_TAB_INDEX = 1
+
+# Safety sweep interval (milliseconds) for the status indicators while the
+# window is visible; changes are normally pushed by the email monitor's
+# status callback and the Excel file system watcher
+STATUS_INTERVAL_MS = 60000
+
+# Maximum number of lines kept in the activity log
+MAX_LOG_LINES = 2000
+
+# Delay (milliseconds) used to coalesce activity log writes
+LOG_FLUSH_MS = 100
+
+# Maximum number of emails kept in the email table
+MAX_EMAIL_ROWS = 10000
+
+# Initial widths (pixels) of the fixed-width email table columns; the
+# Subject column stretches to fill the remaining space
+EMAIL_COLUMN_WIDTHS = {0: 140, 1: 200, 3: 160, 4: 120}
+EMAIL_SUBJECT_COLUMN = 2
+
+# pandas engine used for each Excel file extension in the direct-file preview;
+# calamine reads every format when the Excel handler can use it
+_EXCEL_ENGINES = {
+    '.xlsx': 'openpyxl',
+    '.xlsm': 'openpyxl',
+    '.xls': 'xlrd'
+}
+if READ_ENGINE == 'calamine':
+    _EXCEL_ENGINES = dict.fromkeys(_EXCEL_ENGINES, READ_ENGINE)
+
+# Leading bytes of Excel workbooks: ZIP (xlsx/xlsm/xlsb) and OLE2 compound files (xls)
+_EXCEL_SIGNATURES = (b'PK\x03\x04', b'\xd0\xcf\x11\xe0')
+
+# Timestamp format used in the email table and the activity log
+_TS_FMT = '%Y-%m-%d %H:%M:%S'
+
+# Delay (milliseconds) used to coalesce Excel appends and saves after incoming emails
+SAVE_DELAY_MS = 2000
+
+@functools.lru_cache(maxsize=4)
+def _read_excel_mapping(path: str, mtime: float) -> Dict[str, Any]:
+    """
+    Load the Excel sheet mapping; cached per path and modification time.
+    
+    Args:
+        path: Path to the mapping file
+        mtime: Modification time of the file, used as part of the cache key
+        
+    Returns:
+        Mapping configuration, empty if it couldn't be loaded
+    """
+    return load_json_config(path) or {}
+
+@functools.cache
+def _admin_ui_class():
+    """
+    Import the admin UI class on first use.
+    
+    The admin UI is built on tkinter, which is only loaded when it is opened.
+    
+    Returns:
+        The AdminUI class
+    """
+    from src.admin_ui import AdminUI
+    return AdminUI
+
+def _load_excel_mapping() -> Dict[str, Any]:
+    """
+    Get the Excel sheet mapping, re-reading the file only after it changes.
+    
+    The returned dictionary is shared between callers and must not be modified.
+    
+    Returns:
+        Mapping configuration, empty if the file is missing or invalid
+    """
+    try:
+        mtime = os.path.getmtime(_EXCEL_MAPPING_PATH)
+    except OSError:
+        logger.error(f"Configuration file not found: {_EXCEL_MAPPING_PATH}")
+        return {}
+    
+    return _read_excel_mapping(_EXCEL_MAPPING_PATH, mtime)
+
 class MainWindow(QMainWindow):
     """
     Main window of the Report Population Tool application.
@@ -39,7 +136,7 @@ class MainWindow(QMainWindow):
     def __init__(
         self, 
         configs: Dict[str, Any], 
-        email_monitor: Optional[EmailMonitor] = None,
+        email_monitor: Optional['EmailMonitor'] = None,
         excel_handler: Optional[ExcelHandler] = None,
         parent: Optional[QWidget] = None
     ):
@@ -54,17 +151,35 @@ class MainWindow(QMainWindow):
         """
         super().__init__(parent)
         self.configs = configs
+        
+        # Flattened keyword and company lists, rebuilt when configs change
+        self._keywords_cache: tuple = ()
+        self._companies_cache: tuple = ()
+        self._company_pattern = None
+        self._rebuild_config_caches()
         self.email_monitor = email_monitor
         self.excel_handler = excel_handler
         
         # Set up email monitor callback if available
         if self.email_monitor:
             self.email_monitor.set_callback(self._process_email)
+            self.email_monitor.set_status_callback(self._on_monitor_status_changed)
         
-        # Initialize Excel handler if available
-        if self.excel_handler:
+        # Initialize Excel handler if available and not already loaded
+        if self.excel_handler and not self.excel_handler.is_loaded:
             self.excel_handler.load_excel()
         
+        # Watch the Excel file so its status doesn't need polling
+        self._fs_watcher = QFileSystemWatcher(self)
+        self._fs_watcher.fileChanged.connect(self._on_excel_path_changed)
+        self._fs_watcher.directoryChanged.connect(self._on_excel_path_changed)
+        self._excel_exists_cache = False
+        self._watch_excel_file()
+        
+        # Last states pushed to the status indicators
+        self._last_email_status: Optional[bool] = None
+        self._last_excel_status: Optional[bool] = None
+        
         # Set window properties
         self.setWindowTitle("Report Population Tool")
         self.setMinimumSize(QSize(800, 600))
@@ -75,7 +190,22 @@ class MainWindow(QMainWindow):
         # Create update timer
         self.update_timer = QTimer(self)
         self.update_timer.timeout.connect(self._update_status)
-        self.update_timer.start(5000)  # Update every 5 seconds
+        self.update_timer.start(STATUS_INTERVAL_MS)
+        
+        # Create save timer; bursts of emails are written to Excel once
+        self._save_timer = QTimer(self)
+        self._save_timer.setSingleShot(True)
+        self._save_timer.setInterval(SAVE_DELAY_MS)
+        self._save_timer.timeout.connect(self._flush_pending)
+        
+        # Incident rows waiting to be appended and saved in one batch
+        self._pending_excel_rows = []
+        
+        # Number of incident rows already shown in the preview table
+        self._excel_row_cursor = 0
+        
+        # Emails waiting to be added to the email table in one batch
+        self._email_queue = deque()
         
         logger.info("Main window initialized")
         
@@ -122,16 +252,39 @@ class MainWindow(QMainWindow):
         log_group = QGroupBox("Activity Log")
         log_layout = QVBoxLayout(log_group)
         
-        self.log_text = QTextEdit()
+        self.log_text = QPlainTextEdit()
         self.log_text.setReadOnly(True)
+        self.log_text.setMaximumBlockCount(MAX_LOG_LINES)
         log_layout.addWidget(self.log_text)
         
+        # Buffer log lines and write them in one append per flush
+        self._log_buffer = []
+        self._log_ts_sec = -1
+        self._log_ts_str = ""
+        self._log_timer = QTimer(self)
+        self._log_timer.setSingleShot(True)
+        self._log_timer.setInterval(LOG_FLUSH_MS)
+        self._log_timer.timeout.connect(self._flush_log)
+        
         # Create tab widget for different views
         self.tab_widget = QTabWidget()
         
-        # Create tabs
-        self._create_email_tab()
-        self._init_excel_tab()
+        # Create placeholder tabs; contents are built on first activation
+        self._tab_builders = {
+            EMAIL_TAB_INDEX: self._create_email_tab,
+            EXCEL_TAB_INDEX: self._init_excel_tab
+        }
+        self._built_tabs = set()
+        self._excel_dirty = False
+        self._preview_dirty = True
+        self._preview_in_flight = False
+        self._preview_requested = False
+        self._preview_fitted = False
+        self.tab_widget.addTab(QWidget(), "Emails")
+        self.tab_widget.addTab(QWidget(), "Excel Data")
+        self.tab_widget.currentChanged.connect(self._ensure_tab_built)
+        self.tab_widget.currentChanged.connect(self._on_tab_changed)
+        self._ensure_tab_built(self.tab_widget.currentIndex())
         
         # Add components to splitter
         splitter.addWidget(self.tab_widget)
@@ -154,37 +307,74 @@ class MainWindow(QMainWindow):
         # Update status indicators
         self._update_status()
     
-    def _create_email_tab(self) -> None:
+    @pyqtSlot(int)
+    def _ensure_tab_built(self, index: int) -> None:
+        """
+        Build the contents of a tab the first time it is needed.
+        
+        Args:
+            index: Index of the tab to build
+        """
+        if index in self._built_tabs or index not in self._tab_builders:
+            return
+        
+        self._built_tabs.add(index)
+        self._tab_builders[index](self.tab_widget.widget(index))
+    
+    @pyqtSlot(int)
+    def _on_tab_changed(self, index: int) -> None:
+        """
+        Run a deferred Excel refresh when the Excel tab becomes visible.
+        
+        Args:
+            index: Index of the newly selected tab
+        """
+        if index != EXCEL_TAB_INDEX:
+            return
+        
+        # A pending file preview replaces the table, so the next save reloads it in full
+        if self._preview_dirty:
+            self._preview_dirty = False
+            self._excel_dirty = False
+            self._excel_row_cursor = 0
+            self._refresh_preview_table()
+        elif self._excel_dirty:
+            self._refresh_excel_data()
+    
+    def _create_email_tab(self, tab: QWidget) -> None:
         """
         Create the email monitoring tab.
+        
+        Args:
+            tab: Placeholder widget to build the tab contents into
         """
-        tab = QWidget()
         layout = QVBoxLayout(tab)
         
         # Create table for emails
-        self.email_table = QTableWidget(0, 5)
-        self.email_table.setHorizontalHeaderLabels([
-            "Date/Time", "From", "Subject", "Company", "Reference"
-        ])
+        self.email_model = EmailLogModel(
+            ["Date/Time", "From", "Subject", "Company", "Reference"],
+            MAX_EMAIL_ROWS,
+            self
+        )
+        self.email_table = QTableView()
+        self.email_table.setModel(self.email_model)
         
-        # Set column widths
+        # Set column widths; fixed initial widths avoid measuring every row
         header = self.email_table.horizontalHeader()
-        header.setSectionResizeMode(0, QHeaderView.ResizeMode.ResizeToContents)
-        header.setSectionResizeMode(1, QHeaderView.ResizeMode.ResizeToContents)
-        header.setSectionResizeMode(2, QHeaderView.ResizeMode.Stretch)
-        header.setSectionResizeMode(3, QHeaderView.ResizeMode.ResizeToContents)
-        header.setSectionResizeMode(4, QHeaderView.ResizeMode.ResizeToContents)
+        for column, width in EMAIL_COLUMN_WIDTHS.items():
+            header.setSectionResizeMode(column, QHeaderView.ResizeMode.Interactive)
+            header.resizeSection(column, width)
+        header.setSectionResizeMode(EMAIL_SUBJECT_COLUMN, QHeaderView.ResizeMode.Stretch)
         
         layout.addWidget(self.email_table)
-        
-        # Add tab to tab widget
-        self.tab_widget.addTab(tab, "Emails")
     
-    def _init_excel_tab(self):
+    def _init_excel_tab(self, tab: QWidget) -> None:
         """
         Initialize the Excel data tab.
+        
+        Args:
+            tab: Placeholder widget to build the tab contents into
         """
-        tab = QWidget()
         layout = QVBoxLayout(tab)
         
         # Create Excel preview group
@@ -192,76 +382,178 @@ class MainWindow(QMainWindow):
         preview_layout = QVBoxLayout(preview_group)
         
         # Create preview table
-        self.preview_table = QTableWidget()
-        self.preview_table.horizontalHeader().setSectionResizeMode(QHeaderView.ResizeMode.Stretch)
+        self.preview_model = TableDataModel(self)
+        self.preview_table = QTableView()
+        self.preview_table.setModel(self.preview_model)
+        self.preview_table.horizontalHeader().setSectionResizeMode(QHeaderView.ResizeMode.Interactive)
+        self.preview_table.horizontalHeader().setStretchLastSection(True)
         self.preview_table.setMinimumHeight(200)  # Set minimum height to ensure visibility
         preview_layout.addWidget(self.preview_table)
         
         layout.addWidget(preview_group)
         
-        # Add refresh button
+        # Add refresh and auto-fit buttons
+        button_layout = QHBoxLayout()
+        
         refresh_button = QPushButton("Refresh Excel Preview")
         refresh_button.clicked.connect(self._refresh_preview_table)
-        layout.addWidget(refresh_button)
+        button_layout.addWidget(refresh_button)
         
-        # Add tab to tab widget
-        self.tab_widget.addTab(tab, "Excel Data")
+        fit_button = QPushButton("Auto-fit Columns")
+        fit_button.clicked.connect(self.preview_table.resizeColumnsToContents)
+        button_layout.addWidget(fit_button)
         
-        return tab
+        layout.addLayout(button_layout)
     
     def _create_menu_bar(self) -> None:
         """
         Create the menu bar.
         """
-        # File menu
-        file_menu = self.menuBar().addMenu("&File")
+        # Menu layout: (menu title, [(action label, slot), ...]); None adds a separator
+        menus = [
+            ("&File", [
+                ("Open Excel File", self._on_open_excel),
+                ("Admin UI", self._on_admin_ui),
+                ("Settings", self._on_settings_clicked),
+                None,
+                ("Exit", self.close),
+            ]),
+            ("&Help", [
+                ("Excel Diagnostics", self._test_excel_access),
+                ("About", self._on_about),
+            ]),
+        ]
+        
+        for title, entries in menus:
+            menu = self.menuBar().addMenu(title)
+            for entry in entries:
+                if entry is None:
+                    menu.addSeparator()
+                    continue
+                
+                label, slot = entry
+                action = QAction(label, self)
+                action.triggered.connect(slot)
+                menu.addAction(action)
+    
+    def _on_monitor_status_changed(self, running: bool) -> None:
+        """
+        Update the status indicators when the email monitor starts or stops.
         
-        # Open Excel action
-        open_excel_action = QAction("Open Excel File", self)
-        open_excel_action.triggered.connect(self._on_open_excel)
-        file_menu.addAction(open_excel_action)
+        Args:
+            running: Whether the email monitor is now running
+        """
+        self._update_status()
+    
+    @pyqtSlot()
+    def _update_status(self) -> None:
+        """
+        Update status indicators.
+        """
+        # Email monitor status
+        email_running = bool(self.email_monitor and self.email_monitor.is_running())
         
-        # Admin UI action
-        admin_action = QAction("Admin UI", self)
-        admin_action.triggered.connect(self._on_admin_ui)
-        file_menu.addAction(admin_action)
+        # Excel status - just check if file exists
+        excel_exists = self._excel_exists_cache
         
-        # Settings action
-        settings_action = QAction("Settings", self)
-        settings_action.triggered.connect(self._on_settings_clicked)
-        file_menu.addAction(settings_action)
+        # Only touch the indicators when a state actually changed
+        if email_running != self._last_email_status:
+            self._last_email_status = email_running
+            self.email_status.set_status(email_running)
         
-        file_menu.addSeparator()
+        if excel_exists != self._last_excel_status:
+            self._last_excel_status = excel_exists
+            self.excel_status.set_status(excel_exists)
+    
+    def _watch_excel_file(self) -> None:
+        """
+        Point the file system watcher at the current Excel file.
         
-        # Exit action
-        exit_action = QAction("Exit", self)
-        exit_action.triggered.connect(self.close)
-        file_menu.addAction(exit_action)
+        Both the file and its directory are watched, so deleting, recreating
+        or replacing the file (as Excel does when saving) is noticed.
+        """
+        watched = self._fs_watcher.files() + self._fs_watcher.directories()
+        if watched:
+            self._fs_watcher.removePaths(watched)
+        
+        excel_path = self.excel_handler.excel_path if self.excel_handler else None
+        if excel_path:
+            excel_dir = os.path.dirname(os.path.abspath(excel_path))
+            if os.path.isdir(excel_dir):
+                self._fs_watcher.addPath(excel_dir)
+            if os.path.exists(excel_path):
+                self._fs_watcher.addPath(excel_path)
+        
+        self._excel_exists_cache = bool(excel_path and os.path.exists(excel_path))
+    
+    @pyqtSlot(str)
+    def _on_excel_path_changed(self, path: str) -> None:
+        """
+        Refresh the cached Excel file state after a watched path changes.
         
-        # Help menu
-        help_menu = self.menuBar().addMenu("&Help")
+        Args:
+            path: File or directory that changed
+        """
+        excel_path = self.excel_handler.excel_path if self.excel_handler else None
+        self._excel_exists_cache = bool(excel_path and os.path.exists(excel_path))
         
-        # About action
-        about_action = QAction("About", self)
-        about_action.triggered.connect(self._on_about)
-        help_menu.addAction(about_action)
+        # The watcher drops files that were removed or replaced; watch it again
+        if self._excel_exists_cache and excel_path not in self._fs_watcher.files():
+            self._fs_watcher.addPath(excel_path)
+        
+        self._update_status()
     
-    def _update_status(self) -> None:
+    def _pause_status_updates(self) -> None:
         """
-        Update status indicators.
+        Stop the status timer while nothing is on screen.
         """
-        # Update email monitor status
-        if self.email_monitor:
-            self.email_status.set_status(self.email_monitor.is_running())
-        else:
-            self.email_status.set_status(False)
+        if hasattr(self, 'update_timer'):
+            self.update_timer.stop()
+    
+    def _resume_status_updates(self) -> None:
+        """
+        Restart the status timer and refresh the indicators immediately.
+        """
+        if hasattr(self, 'update_timer') and not self.update_timer.isActive():
+            self.update_timer.start(STATUS_INTERVAL_MS)
+            self._update_status()
+    
+    def changeEvent(self, event: QEvent) -> None:
+        """
+        Pause status updates while the window is minimized.
         
-        # Excel status - just check if file exists
-        excel_exists = False
-        if self.excel_handler and self.excel_handler.excel_path:
-            excel_exists = os.path.exists(self.excel_handler.excel_path)
-        self.excel_status.set_status(excel_exists)
+        Args:
+            event: Change event
+        """
+        if event.type() == QEvent.Type.WindowStateChange:
+            if self.windowState() & Qt.WindowState.WindowMinimized:
+                self._pause_status_updates()
+            else:
+                self._resume_status_updates()
+        
+        super().changeEvent(event)
     
+    def hideEvent(self, event: QHideEvent) -> None:
+        """
+        Pause status updates while the window is hidden.
+        
+        Args:
+            event: Hide event
+        """
+        self._pause_status_updates()
+        super().hideEvent(event)
+    
+    def showEvent(self, event: QShowEvent) -> None:
+        """
+        Resume status updates when the window is shown.
+        
+        Args:
+            event: Show event
+        """
+        self._resume_status_updates()
+        super().showEvent(event)
+    
+    @pyqtSlot()
     def _on_start_clicked(self) -> None:
         """
         Handle start button click.
@@ -281,15 +573,13 @@ class MainWindow(QMainWindow):
             self.stop_button.setEnabled(True)
             self.settings_button.setEnabled(False)
             
-            # Update status indicator
-            self.email_status.set_status(True)
-            
             self.log_message("Email monitoring started")
             self.status_bar.showMessage("Email monitoring started")
         else:
             self.log_message("Failed to start email monitoring")
             QMessageBox.critical(self, "Error", "Failed to start email monitoring")
     
+    @pyqtSlot()
     def _on_stop_clicked(self) -> None:
         """
         Handle stop button click.
@@ -307,31 +597,45 @@ class MainWindow(QMainWindow):
             self.stop_button.setEnabled(False)
             self.settings_button.setEnabled(True)
             
-            # Update status indicator
-            self.email_status.set_status(False)
-            
             self.log_message("Email monitoring stopped")
             self.status_bar.showMessage("Email monitoring stopped")
         else:
             self.log_message("Failed to stop email monitoring")
             QMessageBox.critical(self, "Error", "Failed to stop email monitoring")
     
+    @pyqtSlot()
     def _on_settings_clicked(self) -> None:
         """
         Handle settings button click.
         """
         logger.info("Settings clicked")
+        from src.ui.settings import SettingsDialog
         dialog = SettingsDialog(self.configs, self)
         if dialog.exec():
             logger.info("Settings updated")
             self.status_bar.showMessage("Settings updated")
             
             # Reload configurations
-            from src.utils.config_loader import load_all_configs
             self.configs = load_all_configs()
+            self._rebuild_config_caches()
             
             self.log_message("Settings updated")
     
+    def _rebuild_config_caches(self) -> None:
+        """
+        Precompute the keyword and company lists used for every email.
+        """
+        keywords = []
+        for category_keywords in self.configs.get('keywords', {}).get('categories', {}).values():
+            keywords.extend(category_keywords)
+        self._keywords_cache = tuple(keywords)
+        
+        self._companies_cache = tuple(self.configs.get('company_names', {}).get('companies', []))
+        
+        from src.email_parser import compile_company_pattern
+        self._company_pattern = compile_company_pattern(self._companies_cache)
+    
+    @pyqtSlot()
     def _on_open_excel(self) -> None:
         """
         Handle open Excel file action.
@@ -346,46 +650,47 @@ class MainWindow(QMainWindow):
         if file_path:
             logger.info(f"Opening Excel file: {file_path}")
             
-            # Update Excel handler
+            # Create the Excel handler if needed, otherwise point it at the new file
             if self.excel_handler:
                 self.excel_handler.excel_path = file_path
-                if self.excel_handler.load_excel():
-                    self.log_message(f"Opened Excel file: {file_path}")
-                    self.status_bar.showMessage(f"Opened Excel file: {file_path}")
-                    
-                    # Update status indicator
-                    self.excel_status.set_status(True)
-                    
-                    # Refresh Excel data
-                    self._refresh_excel_data()
-                    
-                    # Refresh preview table separately
-                    self._refresh_preview_table()
-                else:
-                    self.log_message(f"Failed to open Excel file: {file_path}")
-                    QMessageBox.critical(self, "Error", f"Failed to open Excel file: {file_path}")
             else:
-                # Create new Excel handler
-                from src.excel_handler import ExcelHandler
-                excel_config = self.configs.get('excel_mapping', {})
-                self.excel_handler = ExcelHandler(file_path, excel_config)
-                
-                if self.excel_handler.load_excel():
-                    self.log_message(f"Opened Excel file: {file_path}")
-                    self.status_bar.showMessage(f"Opened Excel file: {file_path}")
-                    
-                    # Update status indicator
-                    self.excel_status.set_status(True)
-                    
-                    # Refresh Excel data
-                    self._refresh_excel_data()
-                    
-                    # Refresh preview table separately
-                    self._refresh_preview_table()
-                else:
-                    self.log_message(f"Failed to open Excel file: {file_path}")
-                    QMessageBox.critical(self, "Error", f"Failed to open Excel file: {file_path}")
+                excel_config = dict(self.configs.get('excel_sheet_mapping', {}), file_path=file_path)
+                self.excel_handler = ExcelHandler(excel_config, self.configs.get('populate_data_excel', {}))
+            
+            self._apply_opened_excel(file_path)
     
+    def _apply_opened_excel(self, file_path: str) -> bool:
+        """
+        Load a newly selected Excel file and update the UI once.
+        
+        Args:
+            file_path: Path of the opened Excel file
+            
+        Returns:
+            True if the file was loaded, False otherwise
+        """
+        self._watch_excel_file()
+        
+        if not self.excel_handler.load_excel():
+            self.log_message(f"Failed to open Excel file: {file_path}")
+            QMessageBox.critical(self, "Error", f"Failed to open Excel file: {file_path}")
+            return False
+        
+        self.log_message(f"Opened Excel file: {file_path}")
+        self.status_bar.showMessage(f"Opened Excel file: {file_path}")
+        
+        # Update status indicator
+        self._update_status()
+        
+        # Refresh the preview now if it is visible, otherwise when its tab is shown;
+        # both refresh paths fill the same table, so one is enough
+        if self.tab_widget.currentIndex() == EXCEL_TAB_INDEX:
+            self._refresh_preview_table()
+        else:
+            self._preview_dirty = True
+        return True
+    
+    @pyqtSlot()
     def _on_admin_ui(self) -> None:
         """
         Handle admin UI action.
@@ -393,14 +698,13 @@ class MainWindow(QMainWindow):
         logger.info("Admin UI clicked")
         
         # Get the config directory
-        base_dir = os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
-        config_dir = os.path.join(base_dir, 'config')
+        config_dir = os.path.join(_BASE_DIR, 'config')
         
-        # Import and run admin UI
-        from src.admin_ui import AdminUI
-        admin_ui = AdminUI(config_dir)
+        # Run admin UI
+        admin_ui = _admin_ui_class()(config_dir)
         admin_ui.run()
     
+    @pyqtSlot()
     def _on_about(self) -> None:
         """
         Handle about action.
@@ -416,29 +720,38 @@ class MainWindow(QMainWindow):
         """
         Process an email received from the email monitor.
         
+        This may be called from the monitor's thread, so parsing is handed to
+        the global thread pool and the results come back to _on_email_parsed
+        on the GUI thread.
+        
         Args:
             email_data: Dictionary containing email data
         """
+        from src.ui.email_processor import EmailProcessor
+        
+        logger.info(f"Processing email: {email_data.get('subject', 'No Subject')}")
+        
+        processor = EmailProcessor(email_data, self._keywords_cache, self._companies_cache, self._company_pattern)
+        processor.signals.resultReady.connect(self._on_email_parsed)
+        processor.signals.error.connect(self._on_email_parse_failed)
+        QThreadPool.globalInstance().start(processor)
+    
+    @pyqtSlot(dict)
+    def _on_email_parsed(self, result: Dict[str, Any]) -> None:
+        """
+        Show a parsed email and queue it for Excel.
+        
+        Args:
+            result: Email data with 'parsed_data', 'company' and 'reference' added
+        """
         try:
-            logger.info(f"Processing email: {email_data.get('subject', 'No Subject')}")
-            
             # Extract data from email
-            from_address = email_data.get('sender', 'Unknown')
-            subject = email_data.get('subject', 'No Subject')
-            body = email_data.get('body', '')
-            received_time = email_data.get('received_time', datetime.now())
-            
-            # Parse email content
-            keywords = []
-            if 'keywords' in self.configs:
-                for category, category_keywords in self.configs['keywords'].get('categories', {}).items():
-                    keywords.extend(category_keywords)
-            
-            parsed_data = parse_email_content(body, keywords)
-            
-            # Extract company name and reference
-            company = extract_company_name(body, self.configs.get('company_names', {}).get('companies', []))
-            reference = extract_incident_reference(body)
+            from_address = result.get('sender', 'Unknown')
+            subject = result.get('subject', 'No Subject')
+            received_time = result.get('received_time') or datetime.now()
+            parsed_data = result.get('parsed_data', {})
+            company = result.get('company')
+            reference = result.get('reference')
             
             # Add to email table
             self._add_email_to_table(received_time, from_address, subject, company, reference)
@@ -458,20 +771,61 @@ class MainWindow(QMainWindow):
                     'priority': parsed_data.get('priority', 'Medium')
                 }
                 
-                # Append to Excel
-                if self.excel_handler.append_data('incidents', excel_data):
-                    self.excel_handler.save_excel()
-                    self.log_message(f"Added to Excel: {company} - {reference}")
-                    
-                    # Refresh Excel data
-                    self._refresh_excel_data()
-                else:
-                    self.log_message(f"Failed to add to Excel: {company} - {reference}")
+                # Queue for Excel; appending and saving are batched in _flush_pending
+                self._pending_excel_rows.append(excel_data)
+                if not self._save_timer.isActive():
+                    self._save_timer.start()
             
         except Exception as e:
             logger.error(f"Error processing email: {str(e)}")
             self.log_message(f"Error processing email: {str(e)}")
     
+    @pyqtSlot(str)
+    def _on_email_parse_failed(self, message: str) -> None:
+        """
+        Report an email that could not be parsed.
+        
+        Args:
+            message: Error message from the email processor
+        """
+        self.log_message(f"Error processing email: {message}")
+    
+    @pyqtSlot()
+    def _flush_pending(self) -> None:
+        """
+        Append queued Excel rows, save once and show the new rows in the preview table.
+        """
+        self._save_timer.stop()
+        
+        if not self.excel_handler or not self._pending_excel_rows:
+            return
+        
+        # Append the whole batch with a single concatenation
+        rows = self._pending_excel_rows
+        self._pending_excel_rows = []
+        added = self.excel_handler.append_rows('incidents', rows)
+        self.log_message(f"Added {added} of {len(rows)} incident(s) to Excel")
+        if not added:
+            return
+        
+        if not self.excel_handler.save_excel():
+            self.log_message("Failed to save Excel file")
+            return
+        
+        df = self.excel_handler.get_sheet_data('incidents')
+        if df is None:
+            return
+        
+        # Rebuild the table when it is stale or doesn't already show this sheet
+        if (self._excel_dirty or self._excel_row_cursor == 0
+                or self.preview_model.headers() != [str(col) for col in df.columns]):
+            self._refresh_excel_data()
+            return
+        
+        # Otherwise append only the rows added since the last flush
+        self._populate_preview_table(df.iloc[self._excel_row_cursor:], append=True)
+        self._excel_row_cursor = len(df)
+    
     def _add_email_to_table(self, received_time, from_address, subject, company, reference):
         """
         Add an email to the email table.
@@ -483,72 +837,104 @@ class MainWindow(QMainWindow):
             company: Extracted company name
             reference: Extracted reference
         """
-        row = self.email_table.rowCount()
-        self.email_table.insertRow(row)
-        
         # Format received time
-        if isinstance(received_time, datetime):
-            time_str = received_time.strftime('%Y-%m-%d %H:%M:%S')
-        else:
+        try:
+            time_str = received_time.strftime(_TS_FMT)
+        except AttributeError:
             time_str = str(received_time)
         
-        # Add items to the row
-        self.email_table.setItem(row, 0, QTableWidgetItem(time_str))
-        self.email_table.setItem(row, 1, QTableWidgetItem(from_address))
-        self.email_table.setItem(row, 2, QTableWidgetItem(subject))
-        self.email_table.setItem(row, 3, QTableWidgetItem(company or ""))
-        self.email_table.setItem(row, 4, QTableWidgetItem(reference or ""))
+        # Queue the row; emails arriving in the same event loop pass share one insert
+        if not self._email_queue:
+            QTimer.singleShot(0, self._drain_email_queue)
+        # Intern recurring sender and company strings so the log keeps one copy of each
+        self._email_queue.append((
+            time_str,
+            sys.intern(str(from_address)),
+            subject,
+            sys.intern(company or ""),
+            reference or ""
+        ))
     
+    @pyqtSlot()
+    def _drain_email_queue(self) -> None:
+        """
+        Add all queued emails to the email table in a single batch.
+        """
+        if not self._email_queue:
+            return
+        
+        self._ensure_tab_built(EMAIL_TAB_INDEX)
+        
+        # One insert notification for the whole batch
+        self.email_model.append_rows(self._email_queue)
+        self._email_queue.clear()
+    
+    @pyqtSlot()
     def _refresh_excel_data(self):
         """
         Refresh the Excel data table.
+        
+        While the Excel tab is hidden the refresh is only recorded, and runs
+        when the tab is next shown.
         """
         if not self.excel_handler:
             return
         
-        # Test if we can access the Excel file and sheet
-        self._test_excel_access()
+        if self.tab_widget.currentIndex() != EXCEL_TAB_INDEX:
+            self._excel_dirty = True
+            return
+        
+        self._excel_dirty = False
+        self._ensure_tab_built(EXCEL_TAB_INDEX)
         
         # Clear the table
-        self.preview_table.setRowCount(0)
-        self.preview_table.setColumnCount(0)
+        self.preview_model.clear()
         
         # Get data from Excel
         df = self.excel_handler.get_sheet_data('incidents')
         if df is None:
             return
         
-        # Set column count and headers
-        columns = df.columns.tolist()
-        self.preview_table.setColumnCount(len(columns))
-        self.preview_table.setHorizontalHeaderLabels([str(col) for col in columns])
+        # Fill the table in one batch
+        self._populate_preview_table(df)
+        self._excel_row_cursor = len(df)
         
-        # Add data rows
-        for _, row in df.iterrows():
-            table_row = self.preview_table.rowCount()
-            self.preview_table.insertRow(table_row)
-            
-            for col_index, col_name in enumerate(columns):
-                cell_value = row.get(col_name)
-                value = str(cell_value) if cell_value is not None else ""
-                self.preview_table.setItem(table_row, col_index, QTableWidgetItem(value))
+        self.log_message("Excel data refreshed")
+    
+    def _populate_preview_table(self, df, append: bool = False):
+        """
+        Show a DataFrame in the preview table.
         
-        # Resize columns to fit content
-        self.preview_table.resizeColumnsToContents()
+        The rows are handed to the model as one block; cell text is only
+        produced when the view paints it.
         
-        self.log_message("Excel data refreshed")
+        Args:
+            df: DataFrame whose columns and rows should be shown
+            append: Add the rows after the existing ones instead of replacing them
+        """
+        # Blank out missing cells column-wise, then hand over contiguous rows
+        values = df.astype(object).where(df.notna(), "").to_numpy()
+        rows = list(values)
+        
+        if append:
+            self.preview_model.append_rows(rows)
+        else:
+            self.preview_model.set_data(df.columns.tolist(), rows)
     
+    @pyqtSlot()
     def _test_excel_access(self):
         """
         Test if we can access the Excel file and sheet directly.
-        This is a diagnostic function to help debug issues with Excel access.
+        This is a diagnostic function to help debug issues with Excel access,
+        available from the Help menu.
         """
+        if not self.excel_handler:
+            self.log_message("TEST: No Excel file is open")
+            return
+        
         try:
             # Get the selected sheet from configuration
-            excel_config_path = os.path.join(os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__)))), 
-                                           "config", "excel_sheet_mapping.json")
-            from src.json_admin import load_json_config
-            excel_config = load_json_config(excel_config_path) or {}
+            excel_config = _load_excel_mapping()
             selected_sheet = excel_config.get("selected_sheet", "")
             file_path = excel_config.get("file_path", "")
             
@@ -572,7 +958,7 @@ class MainWindow(QMainWindow):
             try:
                 # Try reading with the path from config
                 if file_path and os.path.exists(file_path):
-                    sheets = pd.ExcelFile(file_path).sheet_names
+                    sheets = ExcelHandler.get_sheet_names(file_path)
                     self.log_message(f"TEST: Successfully read Excel file from config path. Sheets: {sheets}")
                     
                     if selected_sheet in sheets:
@@ -589,7 +975,7 @@ class MainWindow(QMainWindow):
                 
                 # Try reading with the handler path
                 if self.excel_handler.excel_path and os.path.exists(self.excel_handler.excel_path):
-                    sheets = pd.ExcelFile(self.excel_handler.excel_path).sheet_names
+                    sheets = ExcelHandler.get_sheet_names(self.excel_handler.excel_path)
                     self.log_message(f"TEST: Successfully read Excel file from handler path. Sheets: {sheets}")
                     
                     if selected_sheet in sheets:
@@ -602,25 +988,32 @@ class MainWindow(QMainWindow):
         except Exception as e:
             self.log_message(f"TEST: Error in test function: {str(e)}")
     
+    @pyqtSlot()
     def _refresh_preview_table(self):
         """
         Refresh the preview table with the last 5 rows from the selected sheet.
+        
+        The sheet is read on the global thread pool and _on_preview_loaded
+        fills the table on the GUI thread.
         """
+        self._ensure_tab_built(EXCEL_TAB_INDEX)
+        
         # Safety check: ensure the preview table exists and is valid
         if not hasattr(self, 'preview_table') or self.preview_table is None:
             logger.warning("Preview table not initialized, skipping refresh")
             return
             
+        # Don't start overlapping reads; refresh again once the current one finishes
+        if self._preview_in_flight:
+            self._preview_requested = True
+            return
+        
         try:
             # Clear the table
-            self.preview_table.setRowCount(0)
-            self.preview_table.setColumnCount(0)
+            self.preview_model.clear()
             
             # Get the selected sheet from configuration
-            excel_config_path = os.path.join(os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__)))), 
-                                           "config", "excel_sheet_mapping.json")
-            from src.json_admin import load_json_config
-            excel_config = load_json_config(excel_config_path) or {}
+            excel_config = _load_excel_mapping()
             selected_sheet = excel_config.get("selected_sheet", "")
             file_path = excel_config.get("file_path", "")
             
@@ -633,88 +1026,74 @@ class MainWindow(QMainWindow):
             if not file_path or not os.path.exists(file_path):
                 self.log_message(f"Excel file not found: {file_path}")
                 # Show a message in the preview table
-                self.preview_table.setColumnCount(1)
-                self.preview_table.setHorizontalHeaderLabels(["Message"])
-                row_index = self.preview_table.rowCount()
-                self.preview_table.insertRow(row_index)
-                self.preview_table.setItem(row_index, 0, QTableWidgetItem(f"Excel file not found: {file_path}"))
+                self._show_message_in_preview(f"Excel file not found: {file_path}")
                 return
             
-            # Create a simple placeholder preview while loading
-            self.preview_table.setColumnCount(3)
-            self.preview_table.setHorizontalHeaderLabels(["Loading...", "", ""])
-            
-            for i in range(3):
-                row_index = self.preview_table.rowCount()
-                self.preview_table.insertRow(row_index)
-                self.preview_table.setItem(row_index, 0, QTableWidgetItem("Loading data..."))
-                
-            self.log_message("Showing placeholder preview while loading actual data...")
-            
-            # Try to use the Excel handler if available
-            if self.excel_handler and hasattr(self.excel_handler, 'get_sheet_preview'):
-                try:
-                    # Reload Excel file to ensure we have the latest data
-                    if hasattr(self.excel_handler, 'load_excel'):
-                        success = self.excel_handler.load_excel()
-                        if not success:
-                            self.log_message("Failed to load Excel file")
-                            # Show error message in the preview table
-                            self.preview_table.setRowCount(0)
-                            self.preview_table.setColumnCount(1)
-                            self.preview_table.setHorizontalHeaderLabels(["Message"])
-                            row_index = self.preview_table.rowCount()
-                            self.preview_table.insertRow(row_index)
-                            self.preview_table.setItem(row_index, 0, QTableWidgetItem("Failed to load Excel file. Please check if the file is valid."))
-                            return
-                    
-                    # Get preview data using the Excel handler
-                    preview_data = self.excel_handler.get_sheet_preview(selected_sheet, 5)
-                    
-                    if not preview_data:
-                        self.log_message(f"No preview data available for sheet '{selected_sheet}'")
-                        # Try direct file access as a fallback
-                        self._load_excel_preview()
-                        return
-                        
-                    # Clear the placeholder data
-                    self.preview_table.setRowCount(0)
-                    self.preview_table.setColumnCount(0)
-                    
-                    # Set column count and headers (first row contains headers)
-                    self.preview_table.setColumnCount(len(preview_data[0]))
-                    self.preview_table.setHorizontalHeaderLabels([str(col) for col in preview_data[0]])
-                    
-                    # Add data rows (skip the header row)
-                    for row_data in preview_data[1:]:
-                        row_index = self.preview_table.rowCount()
-                        self.preview_table.insertRow(row_index)
-                        
-                        for col_index, cell_value in enumerate(row_data):
-                            value = str(cell_value) if cell_value is not None else ""
-                            self.preview_table.setItem(row_index, col_index, QTableWidgetItem(value))
-                    
-                    # Resize columns to fit content
-                    self.preview_table.resizeColumnsToContents()
-                    
-                    self.log_message(f"Successfully showing preview of last {len(preview_data)-1} rows from sheet '{selected_sheet}'")
-                    return  # Success, exit the function
-                    
-                except Exception as e:
-                    self.log_message(f"Error using Excel handler for preview: {str(e)}")
-                    # Try direct file access as a fallback
+            # Without an Excel handler, read the file directly
+            if not self.excel_handler:
+                self._load_excel_preview()
+                return
             
-            # If Excel handler is not available or failed, try direct file access
-            self._load_excel_preview()
+            # Read only the tail of the sheet on the thread pool
+            self._show_message_in_preview(f"Loading preview of sheet '{selected_sheet}'...")
+            self._preview_in_flight = True
+            worker = ExcelPreviewWorker(self.excel_handler.excel_path, selected_sheet, 5)
+            worker.signals.resultReady.connect(self._on_preview_loaded)
+            worker.signals.error.connect(self._on_preview_failed)
+            QThreadPool.globalInstance().start(worker)
         except Exception as e:
             logger.error(f"Error refreshing preview: {str(e)}")
             # Show error message in the preview table
-            self.preview_table.setRowCount(0)
-            self.preview_table.setColumnCount(1)
-            self.preview_table.setHorizontalHeaderLabels(["Error"])
-            row_index = self.preview_table.rowCount()
-            self.preview_table.insertRow(row_index)
-            self.preview_table.setItem(row_index, 0, QTableWidgetItem(f"Error refreshing preview: {str(e)}"))
+            self._show_message_in_preview(f"Error refreshing preview: {str(e)}", header="Error")
+    
+    @pyqtSlot(str, list)
+    def _on_preview_loaded(self, sheet_name: str, preview_data: List[List[Any]]) -> None:
+        """
+        Show the rows read by the preview worker.
+        
+        Args:
+            sheet_name: Name of the previewed sheet
+            preview_data: Header row followed by the data rows, empty if there is no data
+        """
+        if not preview_data:
+            self.log_message(f"No preview data available for sheet '{sheet_name}'")
+            self._show_message_in_preview(f"No preview data available for sheet '{sheet_name}'")
+        else:
+            # First row contains headers
+            self.preview_model.set_data(preview_data[0], preview_data[1:])
+            self.log_message(f"Successfully showing preview of last {len(preview_data)-1} rows from sheet '{sheet_name}'")
+            
+            # Fit the columns to the first preview only; later refreshes keep the widths
+            if not self._preview_fitted:
+                self._preview_fitted = True
+                self.preview_table.resizeColumnsToContents()
+        
+        self._finish_preview_load()
+    
+    @pyqtSlot(str, bool)
+    def _on_preview_failed(self, message: str, locked: bool) -> None:
+        """
+        Report a preview that could not be loaded.
+        
+        Args:
+            message: Error message from the preview worker
+            locked: Whether the file is open in another program
+        """
+        self._show_message_in_preview(f"Error refreshing preview: {message}", header="Error")
+        
+        # Check if it's a file locking issue
+        if locked:
+            self.show_excel_locked_warning()
+        self._finish_preview_load()
+    
+    def _finish_preview_load(self) -> None:
+        """
+        Clear the in-flight flag and run a refresh requested while loading.
+        """
+        self._preview_in_flight = False
+        if self._preview_requested:
+            self._preview_requested = False
+            self._refresh_preview_table()
     
     def _load_excel_preview(self):
         """
@@ -728,10 +1107,7 @@ class MainWindow(QMainWindow):
             
         try:
             # Get the selected sheet from configuration
-            excel_config_path = os.path.join(os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__)))), 
-                                           "config", "excel_sheet_mapping.json")
-            from src.json_admin import load_json_config
-            excel_config = load_json_config(excel_config_path) or {}
+            excel_config = _load_excel_mapping()
             selected_sheet = excel_config.get("selected_sheet", "")
             file_path = excel_config.get("file_path", "")
             
@@ -744,103 +1120,84 @@ class MainWindow(QMainWindow):
                 self.log_message(f"Excel file not found: {file_path}")
                 self._show_message_in_preview(f"Excel file not found: {file_path}")
                 return
+            
+            # Reject files that aren't Excel workbooks before any parser runs
+            with open(file_path, 'rb') as f:
+                signature = f.read(8)
+            if not signature.startswith(_EXCEL_SIGNATURES):
+                self.log_message(f"Not an Excel workbook: {file_path}")
+                self._show_message_in_preview(f"Not an Excel workbook: {file_path}")
+                return
                 
-            # Try to load the Excel file with different engines
+            # Stream only the header and the last rows of the sheet
+            try:
+                preview_data = ExcelHandler.read_sheet_tail(file_path, selected_sheet, 5)
+            except Exception as e:
+                self.log_message(f"Streaming read failed, falling back to pandas: {str(e)}")
+            else:
+                if len(preview_data) < 2:
+                    self.log_message(f"Sheet '{selected_sheet}' is empty")
+                    self._show_message_in_preview(f"Sheet '{selected_sheet}' is empty")
+                    return
+                
+                self.preview_model.set_data(preview_data[0], preview_data[1:])
+                self.log_message(f"Successfully loaded preview of last {len(preview_data)-1} rows from sheet '{selected_sheet}'")
+                return
+            
+            # Pick the engine from the file extension; retry once with the pandas default
             import pandas as pd
-            engines = ['openpyxl', 'xlrd', None]  # None will use the default engine
+            engine = _EXCEL_ENGINES.get(os.path.splitext(file_path)[1].lower(), 'openpyxl')
+            try:
+                excel_file = pd.ExcelFile(file_path, engine=engine)
+            except Exception as e:
+                self.log_message(f"Error reading Excel file with engine {engine}: {str(e)}")
+                engine = None
+                excel_file = pd.ExcelFile(file_path)
             
-            for engine in engines:
-                try:
-                    self.log_message(f"Attempting to read Excel file with engine: {engine}")
-                    
-                    # Try to read the Excel file with current engine
-                    if engine:
-                        excel_file = pd.ExcelFile(file_path, engine=engine)
-                    else:
-                        excel_file = pd.ExcelFile(file_path)
-                        
-                    # Check if the selected sheet exists
-                    if selected_sheet not in excel_file.sheet_names:
-                        self.log_message(f"Sheet '{selected_sheet}' not found in Excel file. Available sheets: {excel_file.sheet_names}")
-                        
-                        # If there are any sheets, use the first one as a fallback
-                        if excel_file.sheet_names:
-                            selected_sheet = excel_file.sheet_names[0]
-                            self.log_message(f"Using first available sheet: {selected_sheet}")
-                        else:
-                            continue  # Try next engine
-                    
-                    # Read the sheet
-                    df = pd.read_excel(excel_file, sheet_name=selected_sheet)
-                    
-                    # Check if dataframe is empty
-                    if df.empty:
-                        self.log_message(f"Sheet '{selected_sheet}' is empty")
-                        continue
-                    
-                    # Clear the table
-                    self.preview_table.setRowCount(0)
-                    self.preview_table.setColumnCount(0)
-                    
-                    # Set column count and headers
-                    columns = df.columns.tolist()
-                    self.preview_table.setColumnCount(len(columns))
-                    self.preview_table.setHorizontalHeaderLabels([str(col) for col in columns])
-                    
-                    # Get the last 5 rows (or all rows if fewer than 5)
-                    if len(df) <= 5:
-                        last_rows = df
-                    else:
-                        last_rows = df.tail(5)
+            with excel_file:
+                # Check if the selected sheet exists
+                if selected_sheet not in excel_file.sheet_names:
+                    self.log_message(f"Sheet '{selected_sheet}' not found in Excel file. Available sheets: {excel_file.sheet_names}")
                     
-                    # Add data rows
-                    for _, row in last_rows.iterrows():
-                        row_index = self.preview_table.rowCount()
-                        self.preview_table.insertRow(row_index)
-                        
-                        for col_index, col_name in enumerate(columns):
-                            cell_value = row.get(col_name)
-                            value = str(cell_value) if cell_value is not None else ""
-                            self.preview_table.setItem(row_index, col_index, QTableWidgetItem(value))
-                    
-                    # Resize columns to fit content
-                    self.preview_table.resizeColumnsToContents()
-                    
-                    self.log_message(f"Successfully loaded preview of last {len(last_rows)} rows from sheet '{selected_sheet}' with engine {engine}")
-                    return
-                except Exception as e:
-                    self.log_message(f"Error loading Excel preview with engine {engine}: {str(e)}")
-                    continue
+                    # If there are any sheets, use the first one as a fallback
+                    if not excel_file.sheet_names:
+                        self._show_message_in_preview("The Excel file contains no sheets")
+                        return
+                    selected_sheet = excel_file.sheet_names[0]
+                    self.log_message(f"Using first available sheet: {selected_sheet}")
+                
+                # Read the sheet
+                df = pd.read_excel(excel_file, sheet_name=selected_sheet)
+            
+            # Check if dataframe is empty
+            if df.empty:
+                self.log_message(f"Sheet '{selected_sheet}' is empty")
+                self._show_message_in_preview(f"Sheet '{selected_sheet}' is empty")
+                return
             
-            self.log_message("Failed to load Excel preview with all engines")
-            self._show_message_in_preview("Failed to load Excel preview. The file may be corrupted or in an unsupported format.")
+            # Add the last 5 rows (or all rows if fewer than 5)
+            last_rows = df.tail(5)
+            self._populate_preview_table(last_rows)
+            
+            self.log_message(f"Successfully loaded preview of last {len(last_rows)} rows from sheet '{selected_sheet}' with engine {engine}")
             
         except Exception as e:
             logger.error(f"Error loading Excel preview: {str(e)}")
             self._show_message_in_preview(f"Error loading Excel preview: {str(e)}")
             
-    def _show_message_in_preview(self, message):
+    def _show_message_in_preview(self, message, header: str = "Message"):
         """
         Show a message in the preview table.
         
         Args:
             message: Message to display
+            header: Column header shown above the message
         """
         if not hasattr(self, 'preview_table') or self.preview_table is None:
             return
             
-        # Clear the table
-        self.preview_table.setRowCount(0)
-        self.preview_table.setColumnCount(1)
-        self.preview_table.setHorizontalHeaderLabels(["Message"])
-        
-        # Add the message
-        row_index = self.preview_table.rowCount()
-        self.preview_table.insertRow(row_index)
-        self.preview_table.setItem(row_index, 0, QTableWidgetItem(message))
-        
-        # Resize column to fit content
-        self.preview_table.resizeColumnsToContents()
+        # Replace the table contents with the message
+        self.preview_model.set_data([header], [[message]])
     
     def log_message(self, message: str):
         """
@@ -849,8 +1206,26 @@ class MainWindow(QMainWindow):
         Args:
             message: Message to log
         """
-        timestamp = datetime.now().strftime('%Y-%m-%d %H:%M:%S')
-        self.log_text.append(f"[{timestamp}] {message}")
+        # Reuse the formatted timestamp for messages logged within the same second
+        now = int(time.time())
+        if now != self._log_ts_sec:
+            self._log_ts_sec = now
+            self._log_ts_str = time.strftime(_TS_FMT, time.localtime(now))
+        
+        self._log_buffer.append(f"[{self._log_ts_str}] {message}")
+        if not self._log_timer.isActive():
+            self._log_timer.start()
+    
+    @pyqtSlot()
+    def _flush_log(self) -> None:
+        """
+        Write buffered log lines to the activity log.
+        """
+        if not self._log_buffer:
+            return
+        
+        self.log_text.appendPlainText("\n".join(self._log_buffer))
+        self._log_buffer.clear()
     
     def closeEvent(self, event: QCloseEvent) -> None:
         """
@@ -860,17 +1235,26 @@ class MainWindow(QMainWindow):
             event: Close event
         """
         try:
+            # Stop email monitor so no new emails arrive
+            if self.email_monitor and self.email_monitor.is_running():
+                self.email_monitor.stop_monitoring()
+                logger.info("Stopped email monitor")
+            
+            # Finish parsing emails on the thread pool and deliver their queued results
+            QThreadPool.globalInstance().waitForDone()
+            QCoreApplication.sendPostedEvents(self, QEvent.Type.MetaCall)
+            
+            # Write any Excel rows still waiting on the save timer
+            self._flush_pending()
+            
             # Close Excel file handles
             if self.excel_handler:
                 self.excel_handler.close()
                 logger.info("Closed Excel file handles")
             
-            # Stop email monitor
-            if self.email_monitor:
-                self.email_monitor.stop()
-                logger.info("Stopped email monitor")
-            
-            # Save any pending changes or configurations here
+            # Write out buffered activity log lines
+            self._log_timer.stop()
+            self._flush_log()
             
             logger.info("Application closing")
             
@@ -890,63 +1274,28 @@ class MainWindow(QMainWindow):
             "1. Close the Excel file if you have it open\n"
             "2. Make sure no other users or programs are accessing it\n"
             "3. Try again",
-            QMessageBox.Ok
+            QMessageBox.StandardButton.Ok
         )
         
-    def get_last_error(self) -> str:
-        """Get the last error message from the log handler."""
-        # Get the last error message from the logger
-        for handler in logging.getLogger().handlers:
-            if isinstance(handler, logging.StreamHandler):
-                return handler.formatter.format(handler.buffer[-1]) if handler.buffer else ""
-        return ""
-        
     def _load_excel_data(self):
         """Load data from Excel file."""
         try:
             if not self.excel_handler.load_excel():
                 # Check if it's a file locking issue
-                if "File is open in another program" in self.get_last_error():
+                if self.excel_handler.is_locked:
                     self.show_excel_locked_warning()
                 return
             
             # Update preview if available
             if hasattr(self, 'preview_table'):
-                self.update_preview()
+                self._refresh_preview_table()
                 
         except Exception as e:
             logger.error(f"Error loading data: {str(e)}")
             
     def update_preview(self):
         """Update the preview table with latest data."""
-        try:
-            sheet_name = self.excel_handler.sheet_mapping.get('selected_sheet', 'Health Check Details')
-            data = self.excel_handler.get_sheet_preview(sheet_name)
-            
-            if data is None:
-                # Check if it's a file locking issue
-                if "File is open in another program" in self.get_last_error():
-                    self.show_excel_locked_warning()
-                return
-                
-            if not data:
-                return
-                
-            # Update table with data
-            headers = data[0]
-            rows = data[1:]
-            
-            self.preview_table.setRowCount(len(rows))
-            self.preview_table.setColumnCount(len(headers))
-            self.preview_table.setHorizontalHeaderLabels(headers)
-            
-            for i, row in enumerate(rows):
-                for j, value in enumerate(row):
-                    item = QTableWidgetItem(str(value))
-                    self.preview_table.setItem(i, j, item)
-                    
-        except Exception as e:
-            logger.error(f"Error updating preview: {str(e)}")
+        self._refresh_preview_table()
 
     def save_data(self, data_type: str, data: List[List[Any]]):
         """Save data to Excel file."""
@@ -971,7 +1320,7 @@ class MainWindow(QMainWindow):
         
         if not success:
             # Check if it's a file locking issue
-            if "File is open in another program" in self.get_last_error():
+            if self.excel_handler.is_locked:
                 self.show_excel_locked_warning()
             else:
                 QMessageBox.critical(
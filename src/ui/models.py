@@ -0,0 +1,208 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+Item models for table views.
+
+This module provides lightweight Qt models that serve table data on demand
+instead of allocating a QTableWidgetItem per cell.
+"""
+
+import logging
+from collections import deque
+from typing import Any, List, MutableSequence, Optional, Sequence
+
+from PyQt6.QtCore import Qt, QAbstractTableModel, QModelIndex, QObject
+
+# Logger setup
+logger = logging.getLogger(__name__)
+
+class TableDataModel(QAbstractTableModel):
+    """
+    Read-only table model backed by a header list and a list of row sequences.
+    
+    Rows may be any indexable sequence, such as lists or the rows of
+    ``DataFrame.to_numpy()``; cells are converted to strings only when
+    the view asks for them.
+    """
+    
+    def __init__(self, parent: Optional[QObject] = None):
+        """
+        Initialize an empty model.
+        
+        Args:
+            parent: Optional parent object
+        """
+        super().__init__(parent)
+        self._headers: List[str] = []
+        self._rows: MutableSequence[Sequence[Any]] = []
+    
+    def rowCount(self, parent: QModelIndex = QModelIndex()) -> int:
+        """
+        Get the number of rows.
+        
+        Args:
+            parent: Parent index (unused for table models)
+        
+        Returns:
+            Number of rows
+        """
+        if parent.isValid():
+            return 0
+        return len(self._rows)
+    
+    def columnCount(self, parent: QModelIndex = QModelIndex()) -> int:
+        """
+        Get the number of columns.
+        
+        Args:
+            parent: Parent index (unused for table models)
+        
+        Returns:
+            Number of columns
+        """
+        if parent.isValid():
+            return 0
+        return len(self._headers)
+    
+    def data(self, index: QModelIndex, role: int = Qt.ItemDataRole.DisplayRole) -> Any:
+        """
+        Get the display text for a cell.
+        
+        Args:
+            index: Cell index
+            role: Requested data role
+        
+        Returns:
+            Cell text for the display role, otherwise None
+        """
+        if role != Qt.ItemDataRole.DisplayRole or not index.isValid():
+            return None
+        
+        row = self._rows[index.row()]
+        if index.column() >= len(row):
+            return ""
+        
+        value = row[index.column()]
+        return str(value) if value is not None else ""
+    
+    def headerData(self, section: int, orientation: Qt.Orientation, role: int = Qt.ItemDataRole.DisplayRole) -> Any:
+        """
+        Get the header text for a section.
+        
+        Args:
+            section: Column or row number
+            orientation: Header orientation
+            role: Requested data role
+        
+        Returns:
+            Column name for horizontal headers, row number for vertical headers
+        """
+        if role != Qt.ItemDataRole.DisplayRole:
+            return None
+        
+        if orientation == Qt.Orientation.Horizontal:
+            return self._headers[section] if section < len(self._headers) else None
+        
+        return str(section + 1)
+    
+    def headers(self) -> List[str]:
+        """
+        Get the current column names.
+        
+        Returns:
+            List of column names
+        """
+        return list(self._headers)
+    
+    def set_data(self, headers: Sequence[Any], rows: Sequence[Sequence[Any]]) -> None:
+        """
+        Replace the model contents with a single reset notification.
+        
+        Args:
+            headers: Column names
+            rows: Row sequences, one value per column
+        """
+        self.beginResetModel()
+        self._headers = [str(header) for header in headers]
+        self._rows = list(rows)
+        self.endResetModel()
+    
+    def append_rows(self, rows: Sequence[Sequence[Any]]) -> None:
+        """
+        Append rows after the existing ones.
+        
+        Args:
+            rows: Row sequences, one value per column
+        """
+        if len(rows) == 0:
+            return
+        
+        first = len(self._rows)
+        self.beginInsertRows(QModelIndex(), first, first + len(rows) - 1)
+        self._rows.extend(rows)
+        self.endInsertRows()
+    
+    def clear(self) -> None:
+        """
+        Remove all rows and columns.
+        """
+        self.set_data([], [])
+
+class EmailLogModel(TableDataModel):
+    """
+    Append-only table model for received emails, bounded to a maximum row count.
+    
+    When the limit is reached the oldest rows are dropped, so memory stays
+    flat during long monitoring sessions.
+    """
+    
+    def __init__(self, headers: Sequence[str], max_rows: int = 10000, parent: Optional[QObject] = None):
+        """
+        Initialize an empty email log.
+        
+        Args:
+            headers: Column names
+            max_rows: Maximum number of rows kept
+            parent: Optional parent object
+        """
+        super().__init__(parent)
+        self._max_rows = max_rows
+        self._headers = [str(header) for header in headers]
+        self._rows = deque(maxlen=max_rows)
+    
+    def set_data(self, headers: Sequence[Any], rows: Sequence[Sequence[Any]]) -> None:
+        """
+        Replace the model contents, keeping at most the newest max_rows rows.
+        
+        Args:
+            headers: Column names
+            rows: Row sequences, one value per column
+        """
+        self.beginResetModel()
+        self._headers = [str(header) for header in headers]
+        self._rows = deque(rows, maxlen=self._max_rows)
+        self.endResetModel()
+    
+    def append_rows(self, rows: Sequence[Sequence[Any]]) -> None:
+        """
+        Append rows, dropping the oldest ones beyond max_rows.
+        
+        Args:
+            rows: Row sequences, one value per column
+        """
+        rows = list(rows)[-self._max_rows:]
+        if not rows:
+            return
+        
+        # Remove the rows that will fall off the front first
+        overflow = len(self._rows) + len(rows) - self._max_rows
+        if overflow > 0:
+            self.beginRemoveRows(QModelIndex(), 0, overflow - 1)
+            for _ in range(overflow):
+                self._rows.popleft()
+            self.endRemoveRows()
+        
+        first = len(self._rows)
+        self.beginInsertRows(QModelIndex(), first, first + len(rows) - 1)
+        self._rows.extend(rows)
+        self.endInsertRows()
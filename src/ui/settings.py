@@ -8,8 +8,12 @@ different aspects of the application.
 """
 
 import os
+import re
+import copy
 import logging
-from typing import Dict, Any, Optional, List
+from collections import defaultdict
+from concurrent.futures import Future, ThreadPoolExecutor
+from typing import Dict, Any, Callable, Iterable, Optional, List, Sequence, Set, Tuple
 
 from PyQt6.QtWidgets import (
     QDialog, QWidget, QVBoxLayout, QHBoxLayout, QTabWidget,
@@ -17,25 +21,420 @@ from PyQt6.QtWidgets import (
     QMessageBox, QGroupBox, QComboBox, QTableWidget, QTableWidgetItem,
     QHeaderView, QFileDialog, QDialogButtonBox
 )
-from PyQt6.QtCore import QSize, Qt
-from PyQt6.QtGui import QIcon
+from PyQt6.QtCore import QSize, Qt, QCoreApplication, QEvent, QObject, QSignalBlocker, QThreadPool, QTimer, pyqtSignal, pyqtSlot
+from PyQt6.QtGui import QIcon, QCloseEvent
 
-from src.json_admin import (
-    load_json_config, save_json_config, add_company_name,
-    add_incident_ref_code, add_predefined_keyword, update_excel_mapping,
-    remove_company_name, remove_incident_ref_code, remove_predefined_keyword,
-    remove_keyword_category, remove_excel_mapping
-)
+from src.json_admin import load_json_config, save_json_config
 from src.excel_handler import ExcelHandler
+from src.ui.config_write_worker import ConfigWriteWorker
 
 # Logger setup
 logger = logging.getLogger(__name__)
 
+# Project paths
+_CONFIG_DIR = os.path.join(os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__)))), "config")
+
+# Configuration files edited by the dialog: company, incident codes, keywords, Excel mapping
+CONFIG_FILE_NAMES = ("company_name.json", "incident_ref_code.json", "pre_defined_keywords.json", "excel_sheet_mapping.json")
+
+# Selectable fields for each data type on the Excel tab
+_EMAIL_FIELDS = ("Date Received", "Body", "Subject")
+_COMPANY_FIELDS = ("Name",)
+_INCIDENT_FIELDS = ("Code",)
+
+# Mapping key, default sheet and selectable fields for each data type on the Excel tab
+DATA_TYPE_SPEC = {
+    "Email Field": {"key": "email_mappings", "sheet": "Email Data", "fields": _EMAIL_FIELDS},
+    "Company": {"key": "company_mappings", "sheet": "Companies", "fields": _COMPANY_FIELDS},
+    "Incident Code": {"key": "incident_mappings", "sheet": "Incidents", "fields": _INCIDENT_FIELDS},
+}
+
+# Check for at least one non-whitespace character without building a stripped copy
+_NONBLANK = re.compile(r"\S").search
+
+# Fixed row height for the settings tables, so rows are never measured
+TABLE_ROW_HEIGHT = 22
+
+# Quiet period before pending configuration edits are written to disk
+CONFIG_WRITE_DELAY_MS = 500
+
+# Item flags for display-only table cells (no edit delegate)
+_READ_ONLY_FLAGS = Qt.ItemFlag.ItemIsSelectable | Qt.ItemFlag.ItemIsEnabled
+
+def _table_item(text: str, flags: Optional[Qt.ItemFlag] = None) -> QTableWidgetItem:
+    """
+    Create a table cell, optionally with fixed item flags.
+    
+    Args:
+        text: Cell text
+        flags: Item flags to set, or None for the default editable cell
+        
+    Returns:
+        Table widget item
+    """
+    item = QTableWidgetItem(text)
+    if flags is not None:
+        item.setFlags(flags)
+    return item
+
+def _fill_table(table: QTableWidget, rows: Sequence[Sequence[str]], flags: Optional[Qt.ItemFlag] = None) -> None:
+    """
+    Replace the contents of a table widget in a single pass.
+    
+    The row count is set once and sorting, repaints and the table's signals
+    are suspended while the cells are filled, avoiding the per-row layout
+    work and signals of insertRow.
+    
+    Args:
+        table: Table widget to fill
+        rows: Cell texts for each row
+        flags: Item flags for every cell, or None for editable cells
+    """
+    sorting_enabled = table.isSortingEnabled()
+    table.setSortingEnabled(False)
+    table.setUpdatesEnabled(False)
+    try:
+        with QSignalBlocker(table):
+            table.setRowCount(len(rows))
+            
+            # Bind the per-cell calls once before the loop
+            set_item = table.setItem
+            make_item = _table_item
+            cells = ((row, column, value) for row, values in enumerate(rows) for column, value in enumerate(values))
+            for row, column, value in cells:
+                set_item(row, column, make_item(value, flags))
+    finally:
+        table.setUpdatesEnabled(True)
+        table.setSortingEnabled(sorting_enabled)
+
+def _selected_row(table: QTableWidget) -> int:
+    """
+    Get the row to act on for a table widget's selection.
+    
+    Uses the current row rather than selectedItems(), which would wrap
+    every selected cell in a Python object. In tables that allow extended
+    selection the current row may not be selected; the first selected
+    cell's row is used then, as selectedItems()[0] would give.
+    
+    Args:
+        table: Table widget to query
+        
+    Returns:
+        Selected row, or -1 if nothing is selected
+    """
+    selection_model = table.selectionModel()
+    if not selection_model.hasSelection():
+        return -1
+    
+    row = table.currentRow()
+    if row >= 0 and selection_model.rowIntersectsSelection(row):
+        return row
+    return selection_model.selectedIndexes()[0].row()
+
+def _file_mtime(path: str) -> Optional[float]:
+    """
+    Get the modification time of a file.
+    
+    Args:
+        path: Path to the file
+        
+    Returns:
+        Modification time, or None if the file does not exist
+    """
+    try:
+        return os.stat(path).st_mtime
+    except OSError:
+        return None
+
+def _snapshot_table(table: QTableWidget, column_count: int) -> List[Tuple[str, ...]]:
+    """
+    Read the cell texts of a table widget in one pass.
+    
+    Args:
+        table: Table widget to read
+        column_count: Number of leading columns to read
+        
+    Returns:
+        Cell texts for each row, with empty strings for missing cells
+    """
+    # Bind the accessors once; they are called for every cell
+    get_item = table.item
+    columns = range(column_count)
+    rows = []
+    append = rows.append
+    for row in range(table.rowCount()):
+        cells = [get_item(row, column) for column in columns]
+        append(tuple(item.text() if item is not None else "" for item in cells))
+    return rows
+
+class _DebouncedJsonWriter(QObject):
+    """
+    Coalesces writes to JSON configuration files.
+    
+    Each configuration is loaded once and kept in memory, and only reloaded
+    if the file is changed by someone else. Edits are applied to that copy
+    and written out after the file has seen no further edits for the write
+    delay, so a burst of edits costs a single write. Files whose content
+    matches what was last loaded or written are not written at all. Delayed
+    writes run on a background thread and report through writeFinished.
+    """
+    
+    writeFinished = pyqtSignal(str, bool)
+    
+    def __init__(self, delay_ms: int = CONFIG_WRITE_DELAY_MS, parent: Optional[QObject] = None):
+        """
+        Initialize the writer.
+        
+        Args:
+            delay_ms: Quiet period in milliseconds before a write
+            parent: Optional parent object
+        """
+        super().__init__(parent)
+        self._delay_ms = delay_ms
+        self._configs: Dict[str, Dict[str, Any]] = {}
+        self._timers: Dict[str, QTimer] = {}
+        self._dirty: Set[str] = set()
+        self._writing: Dict[str, Dict[str, Any]] = {}
+        self._saved: Dict[str, Optional[Dict[str, Any]]] = {}
+        self._mtimes: Dict[str, Optional[float]] = {}
+        self._pending_loads: Dict[str, Future] = {}
+        
+        # A single writer thread keeps writes to the same file in order
+        self._pool = QThreadPool(self)
+        self._pool.setMaxThreadCount(1)
+    
+    def prefetch(self, paths: Iterable[str]) -> None:
+        """
+        Start loading configurations in the background.
+        
+        The files are read concurrently; config() waits for a pending read
+        instead of reading the file again.
+        
+        Args:
+            paths: Paths to the JSON files
+        """
+        executor = ThreadPoolExecutor(max_workers=4)
+        for path in paths:
+            if path not in self._configs and path not in self._pending_loads:
+                self._pending_loads[path] = executor.submit(load_json_config, path)
+        executor.shutdown(wait=False)
+    
+    def config(self, path: str, default: Optional[Dict[str, Any]] = None) -> Dict[str, Any]:
+        """
+        Get the in-memory configuration for a file, loading it on first use.
+        
+        Args:
+            path: Path to the JSON file
+            default: Configuration to use if the file is missing or invalid
+            
+        Returns:
+            Dictionary containing the configuration
+        """
+        # Reuse the cached copy unless the file changed outside the dialog
+        if path in self._configs:
+            if path in self._dirty or path in self._writing or _file_mtime(path) == self._mtimes[path]:
+                return self._configs[path]
+            logger.debug("Reloading changed configuration %s", path)
+        
+        future = self._pending_loads.pop(path, None)
+        self._mtimes[path] = _file_mtime(path)
+        config = future.result() if future is not None else load_json_config(path)
+        self._saved[path] = copy.deepcopy(config)
+        self._configs[path] = config or (default if default is not None else {})
+        return self._configs[path]
+    
+    def schedule(self, path: str, mutator: Callable[[Dict[str, Any]], Optional[bool]],
+                 default: Optional[Dict[str, Any]] = None) -> None:
+        """
+        Apply an edit to a configuration and schedule it to be written.
+        
+        Args:
+            path: Path to the JSON file
+            mutator: Function that updates the configuration in place and
+                returns False if it made no change
+            default: Configuration to use if the file is missing or invalid
+        """
+        if mutator(self.config(path, default)) is False:
+            return
+        
+        # Restart the quiet period for this file
+        timer = self._timers.get(path)
+        if timer is None:
+            timer = QTimer(self)
+            timer.setSingleShot(True)
+            timer.setInterval(self._delay_ms)
+            timer.timeout.connect(lambda path=path: self._write_async(path))
+            self._timers[path] = timer
+        
+        self._dirty.add(path)
+        timer.start()
+    
+    def flush(self, path: str) -> bool:
+        """
+        Write a configuration now if it has pending edits.
+        
+        Args:
+            path: Path to the JSON file
+            
+        Returns:
+            True if nothing was pending or the write succeeded, False otherwise
+        """
+        # Let background writes finish so they cannot overwrite this one
+        self._wait_for_writes()
+        if path not in self._dirty or not self._drop_unchanged([path]):
+            return True
+        
+        self._timers[path].stop()
+        if not save_json_config(path, self._configs[path]):
+            self.writeFinished.emit(path, False)
+            return False
+        
+        self._mark_saved(path)
+        self.writeFinished.emit(path, True)
+        return True
+    
+    def flush_all(self) -> bool:
+        """
+        Write every configuration that has pending edits.
+        
+        Returns:
+            True if all writes succeeded, False otherwise
+        """
+        self._wait_for_writes()
+        paths = self._drop_unchanged(list(self._dirty))
+        if len(paths) <= 1:
+            return all(self.flush(path) for path in paths)
+        
+        # Submit every write at once and wait for them together; the files
+        # are distinct, so they can be written in parallel
+        for path in paths:
+            self._timers[path].stop()
+        with ThreadPoolExecutor(max_workers=len(paths)) as executor:
+            results = list(executor.map(lambda path: save_json_config(path, self._configs[path]), paths))
+        
+        for path, success in zip(paths, results):
+            if success:
+                self._mark_saved(path)
+            self.writeFinished.emit(path, success)
+        return all(results)
+    
+    def flush_all_async(self, on_finished: Callable[[bool], None]) -> None:
+        """
+        Write every configuration that has pending edits on the writer thread.
+        
+        Args:
+            on_finished: Called on the GUI thread with True if all writes
+                succeeded, False otherwise
+        """
+        paths = self._drop_unchanged(list(self._dirty))
+        if not paths:
+            on_finished(True)
+            return
+        
+        for path in paths:
+            self._timers[path].stop()
+        self._start_write(paths, on_finished)
+    
+    def _wait_for_writes(self) -> None:
+        """
+        Wait for background writes and handle their results right away.
+        
+        Their writeFinished signals are queued to the GUI thread; handling
+        them now stops a finished write from recording its older snapshot
+        as saved after a newer synchronous write.
+        """
+        self._pool.waitForDone()
+        QCoreApplication.sendPostedEvents(self, QEvent.Type.MetaCall)
+    
+    def _write_async(self, path: str) -> None:
+        """
+        Write a configuration with pending edits on the writer thread.
+        
+        Args:
+            path: Path to the JSON file
+        """
+        if path in self._dirty and self._drop_unchanged([path]):
+            self._start_write([path])
+    
+    def _drop_unchanged(self, paths: List[str]) -> List[str]:
+        """
+        Clear pending edits that leave a configuration as it is on disk.
+        
+        Args:
+            paths: Paths to the JSON files with pending edits
+            
+        Returns:
+            Paths whose configuration differs from the file and needs writing
+        """
+        changed = []
+        for path in paths:
+            on_disk = self._writing[path] if path in self._writing else self._saved.get(path)
+            if self._configs[path] == on_disk:
+                self._dirty.discard(path)
+                self._timers[path].stop()
+            else:
+                changed.append(path)
+        
+        if len(changed) < len(paths):
+            logger.debug("Skipped writing %d unchanged configuration file(s)", len(paths) - len(changed))
+        return changed
+    
+    def _mark_saved(self, path: str) -> None:
+        """
+        Record that a configuration was written synchronously.
+        
+        Args:
+            path: Path to the JSON file
+        """
+        self._dirty.discard(path)
+        self._saved[path] = copy.deepcopy(self._configs[path])
+        self._mtimes[path] = _file_mtime(path)
+    
+    def _start_write(self, paths: List[str], on_finished: Optional[Callable[[bool], None]] = None) -> None:
+        """
+        Hand configurations to a background write worker.
+        
+        Args:
+            paths: Paths to the JSON files with pending edits
+            on_finished: Optional callback for the overall result
+        """
+        # The worker gets snapshots so later edits cannot race the write
+        snapshots = {path: copy.deepcopy(self._configs[path]) for path in paths}
+        self._dirty.difference_update(paths)
+        self._writing.update(snapshots)
+        worker = ConfigWriteWorker(snapshots)
+        worker.signals.writeFinished.connect(self._on_write_finished)
+        if on_finished is not None:
+            worker.signals.allFinished.connect(on_finished)
+        self._pool.start(worker)
+    
+    @pyqtSlot(str, bool)
+    def _on_write_finished(self, path: str, success: bool) -> None:
+        """
+        Handle the end of a background write.
+        
+        Args:
+            path: Path to the JSON file
+            success: Whether the write succeeded
+        """
+        # Keep failed edits pending so the next flush retries them
+        snapshot = self._writing.pop(path, None)
+        if success:
+            self._saved[path] = snapshot
+            self._mtimes[path] = _file_mtime(path)
+        else:
+            self._dirty.add(path)
+        
+        self.writeFinished.emit(path, success)
+
 class SettingsDialog(QDialog):
     """
     Settings dialog with tabs for different configuration categories.
     """
     
+    # Tab indices
+    _COMPANY_TAB, _INCIDENT_TAB, _KEYWORD_TAB, _EXCEL_TAB = range(4)
+    
     def __init__(self, configs: Dict[str, Any], parent: Optional[QWidget] = None):
         """
         Initialize the settings dialog.
@@ -46,14 +445,41 @@ class SettingsDialog(QDialog):
         """
         super().__init__(parent)
         self.configs = configs
-        self.config_dir = os.path.join(os.path.dirname(os.path.dirname(os.path.dirname(__file__))), "config")
+        self.config_dir = _CONFIG_DIR
+        self._writer = _DebouncedJsonWriter(parent=self)
+        self._writer.writeFinished.connect(self._on_config_write_finished)
+        
+        # Confirmation box reused by every delete action
+        self._confirm_box = QMessageBox(
+            QMessageBox.Icon.Question,
+            "Confirm Deletion",
+            "",
+            QMessageBox.StandardButton.Yes | QMessageBox.StandardButton.No,
+            self
+        )
+        
+        # Do not lose pending edits if the application quits with the dialog open;
+        # done() disconnects again so closed dialogs are not kept alive
+        self._quit_connection = QCoreApplication.instance().aboutToQuit.connect(self.force_flush)
+        
+        # Paths to the configuration files edited by this dialog
+        self._company_path, self._incident_path, self._keywords_path, self._excel_mapping_path = (
+            os.path.join(self.config_dir, file_name) for file_name in CONFIG_FILE_NAMES
+        )
+        
+        # Start reading the configuration files while the UI is built
+        self._writer.prefetch((self._company_path, self._incident_path, self._keywords_path, self._excel_mapping_path))
         
         # Set dialog properties
         self.setWindowTitle("Settings")
         self.setMinimumSize(QSize(600, 400))
         
-        # Initialize UI components
-        self._init_ui()
+        # Initialize UI components with painting suspended until they all exist
+        self.setUpdatesEnabled(False)
+        try:
+            self._init_ui()
+        finally:
+            self.setUpdatesEnabled(True)
         
         logger.info("Settings dialog initialized")
     
@@ -67,11 +493,19 @@ class SettingsDialog(QDialog):
         # Create tab widget
         self.tab_widget = QTabWidget()
         
-        # Create tabs
-        self._create_company_tab()
-        self._create_incident_code_tab()
-        self._create_keyword_tab()
-        self._create_excel_tab()
+        # Create empty tabs; their contents are built when first shown
+        self._tab_builders = {
+            self._COMPANY_TAB: self._create_company_tab,
+            self._INCIDENT_TAB: self._create_incident_code_tab,
+            self._KEYWORD_TAB: self._create_keyword_tab,
+            self._EXCEL_TAB: self._create_excel_tab,
+        }
+        self._tabs_built = set()
+        for title in ("Companies", "Incident Codes", "Keywords", "Excel Mapping"):
+            self.tab_widget.addTab(QWidget(), title)
+        
+        self._on_tab_changed(self.tab_widget.currentIndex())
+        self.tab_widget.currentChanged.connect(self._on_tab_changed)
         
         # Add tab widget to layout
         main_layout.addWidget(self.tab_widget)
@@ -94,16 +528,36 @@ class SettingsDialog(QDialog):
         # Add buttons to layout
         main_layout.addLayout(button_layout)
     
-    def _create_company_tab(self) -> None:
+    @pyqtSlot(int)
+    def _on_tab_changed(self, index: int) -> None:
+        """
+        Build a tab's contents the first time it is shown.
+        
+        Args:
+            index: Index of the selected tab
+        """
+        if index < 0 or index in self._tabs_built:
+            return
+        
+        # Lay out and paint the new tab once, after all of its widgets exist
+        self._tabs_built.add(index)
+        self.tab_widget.setUpdatesEnabled(False)
+        try:
+            self._tab_builders[index](self.tab_widget.widget(index))
+        finally:
+            self.tab_widget.setUpdatesEnabled(True)
+    
+    def _create_company_tab(self, tab: QWidget) -> None:
         """
         Create the company names tab.
+        
+        Args:
+            tab: Placeholder widget to build the tab into
         """
-        tab = QWidget()
         layout = QVBoxLayout(tab)
         
         # Load company names
-        company_config_path = os.path.join(self.config_dir, "company_name.json")
-        company_config = load_json_config(company_config_path) or {"companies": []}
+        company_config = self._writer.config(self._company_path, {"companies": []})
         companies = company_config.get("companies", [])
         
         # Create form for setting company name
@@ -129,20 +583,18 @@ class SettingsDialog(QDialog):
         
         # Add components to layout
         layout.addWidget(form_group)
-        
-        # Add tab to tab widget
-        self.tab_widget.addTab(tab, "Companies")
     
-    def _create_incident_code_tab(self) -> None:
+    def _create_incident_code_tab(self, tab: QWidget) -> None:
         """
         Create the incident reference codes tab.
+        
+        Args:
+            tab: Placeholder widget to build the tab into
         """
-        tab = QWidget()
         layout = QVBoxLayout(tab)
         
         # Load incident codes
-        incident_config_path = os.path.join(self.config_dir, "incident_ref_code.json")
-        incident_config = load_json_config(incident_config_path) or {"incident_codes": {}}
+        incident_config = self._writer.config(self._incident_path, {"incident_codes": {}})
         incident_codes = incident_config.get("incident_codes", {})
         
         # Create form for adding new incident code
@@ -166,13 +618,10 @@ class SettingsDialog(QDialog):
         self.incident_table = QTableWidget(0, 2)
         self.incident_table.setHorizontalHeaderLabels(["Reference Code", "Description"])
         self.incident_table.horizontalHeader().setSectionResizeMode(1, QHeaderView.ResizeMode.Stretch)
+        self.incident_table.verticalHeader().setSectionResizeMode(QHeaderView.ResizeMode.Fixed)
+        self.incident_table.verticalHeader().setDefaultSectionSize(TABLE_ROW_HEIGHT)
         
-        row = 0
-        for code, desc in incident_codes.items():
-            self.incident_table.insertRow(row)
-            self.incident_table.setItem(row, 0, QTableWidgetItem(code))
-            self.incident_table.setItem(row, 1, QTableWidgetItem(desc))
-            row += 1
+        _fill_table(self.incident_table, list(incident_codes.items()))
         
         table_layout.addWidget(self.incident_table)
         
@@ -184,20 +633,18 @@ class SettingsDialog(QDialog):
         # Add components to layout
         layout.addWidget(form_group)
         layout.addWidget(table_group)
-        
-        # Add tab to tab widget
-        self.tab_widget.addTab(tab, "Incident Codes")
     
-    def _create_keyword_tab(self) -> None:
+    def _create_keyword_tab(self, tab: QWidget) -> None:
         """
         Create the predefined keywords tab.
+        
+        Args:
+            tab: Placeholder widget to build the tab into
         """
-        tab = QWidget()
         layout = QVBoxLayout(tab)
         
         # Load keywords
-        keywords_config_path = os.path.join(self.config_dir, "pre_defined_keywords.json")
-        keywords_config = load_json_config(keywords_config_path) or {"categories": {}}
+        keywords_config = self._writer.config(self._keywords_path, {"categories": {}})
         categories = keywords_config.get("categories", {})
         
         # Create form for adding new keyword
@@ -206,8 +653,7 @@ class SettingsDialog(QDialog):
         
         self.category_combo = QComboBox()
         self.category_combo.setEditable(True)
-        for category in categories.keys():
-            self.category_combo.addItem(category)
+        self.category_combo.addItems(list(categories))
         
         form_layout.addRow("Category:", self.category_combo)
         
@@ -225,14 +671,12 @@ class SettingsDialog(QDialog):
         self.keywords_table = QTableWidget(0, 2)
         self.keywords_table.setHorizontalHeaderLabels(["Category", "Keyword"])
         self.keywords_table.horizontalHeader().setSectionResizeMode(1, QHeaderView.ResizeMode.Stretch)
+        self.keywords_table.verticalHeader().setSectionResizeMode(QHeaderView.ResizeMode.Fixed)
+        self.keywords_table.verticalHeader().setDefaultSectionSize(TABLE_ROW_HEIGHT)
         
-        row = 0
-        for category, keywords in categories.items():
-            for keyword in keywords:
-                self.keywords_table.insertRow(row)
-                self.keywords_table.setItem(row, 0, QTableWidgetItem(category))
-                self.keywords_table.setItem(row, 1, QTableWidgetItem(keyword))
-                row += 1
+        _fill_table(self.keywords_table, [
+            (category, keyword) for category, keywords in categories.items() for keyword in keywords
+        ])
         
         table_layout.addWidget(self.keywords_table)
         
@@ -244,20 +688,18 @@ class SettingsDialog(QDialog):
         # Add components to layout
         layout.addWidget(form_group)
         layout.addWidget(table_group)
-        
-        # Add tab to tab widget
-        self.tab_widget.addTab(tab, "Keywords")
     
-    def _create_excel_tab(self) -> None:
+    def _create_excel_tab(self, tab: QWidget) -> None:
         """
         Create the Excel sheet mapping tab.
+        
+        Args:
+            tab: Placeholder widget to build the tab into
         """
-        tab = QWidget()
         layout = QVBoxLayout(tab)
         
         # Load Excel mapping
-        excel_config_path = os.path.join(self.config_dir, "excel_sheet_mapping.json")
-        excel_config = load_json_config(excel_config_path) or {}
+        excel_config = self._writer.config(self._excel_mapping_path)
         
         # Create form for Excel file selection
         file_group = QGroupBox("Excel File")
@@ -317,8 +759,7 @@ class SettingsDialog(QDialog):
         
         # Create dropdown for data type
         self.data_type_combo = QComboBox()
-        data_types = ["Email Field", "Company", "Incident Code"]
-        self.data_type_combo.addItems(data_types)
+        self.data_type_combo.addItems(list(DATA_TYPE_SPEC))
         self.data_type_combo.currentIndexChanged.connect(self._on_data_type_changed)
         form_layout.addRow("Data Type:", self.data_type_combo)
         
@@ -351,6 +792,8 @@ class SettingsDialog(QDialog):
         self.mapping_table = QTableWidget(0, 3)
         self.mapping_table.setHorizontalHeaderLabels(["Data Type", "Field", "Excel Column"])
         self.mapping_table.horizontalHeader().setSectionResizeMode(QHeaderView.ResizeMode.Stretch)
+        self.mapping_table.verticalHeader().setSectionResizeMode(QHeaderView.ResizeMode.Fixed)
+        self.mapping_table.verticalHeader().setDefaultSectionSize(TABLE_ROW_HEIGHT)
         self.mapping_table.setSelectionBehavior(QTableWidget.SelectionBehavior.SelectRows)
         self.mapping_table.setSelectionMode(QTableWidget.SelectionMode.SingleSelection)
         self.mapping_table.itemSelectionChanged.connect(self._on_mapping_selection_changed)
@@ -378,9 +821,6 @@ class SettingsDialog(QDialog):
         layout.addWidget(form_group)
         layout.addWidget(mapping_group)
         
-        # Add tab to tab widget
-        self.tab_widget.addTab(tab, "Excel Mapping")
-        
         # Initialize the field dropdown based on the default data type
         self._on_data_type_changed(0)
     
@@ -391,40 +831,44 @@ class SettingsDialog(QDialog):
         Args:
             excel_config: Excel configuration dictionary
         """
-        # Clear the table
-        self.mapping_table.setRowCount(0)
-        
-        row = 0
-        # Add email field mappings
-        if "email_mappings" in excel_config and "columns" in excel_config["email_mappings"]:
-            columns = excel_config["email_mappings"].get("columns", {})
-            for field, column in columns.items():
-                self.mapping_table.insertRow(row)
-                self.mapping_table.setItem(row, 0, QTableWidgetItem("Email Field"))
-                self.mapping_table.setItem(row, 1, QTableWidgetItem(field))
-                self.mapping_table.setItem(row, 2, QTableWidgetItem(column))
-                row += 1
-        
-        # Add company mappings
-        if "company_mappings" in excel_config and "columns" in excel_config["company_mappings"]:
-            columns = excel_config["company_mappings"].get("columns", {})
-            for field, column in columns.items():
-                self.mapping_table.insertRow(row)
-                self.mapping_table.setItem(row, 0, QTableWidgetItem("Company"))
-                self.mapping_table.setItem(row, 1, QTableWidgetItem(field))
-                self.mapping_table.setItem(row, 2, QTableWidgetItem(column))
-                row += 1
-        
-        # Add incident code mappings
-        if "incident_mappings" in excel_config and "columns" in excel_config["incident_mappings"]:
-            columns = excel_config["incident_mappings"].get("columns", {})
-            for field, column in columns.items():
-                self.mapping_table.insertRow(row)
-                self.mapping_table.setItem(row, 0, QTableWidgetItem("Incident Code"))
-                self.mapping_table.setItem(row, 1, QTableWidgetItem(field))
-                self.mapping_table.setItem(row, 2, QTableWidgetItem(column))
-                row += 1
+        # Add the mappings of each data type
+        rows = []
+        for data_type, spec in DATA_TYPE_SPEC.items():
+            columns = excel_config.get(spec["key"], {}).get("columns", {})
+            rows.extend((data_type, field, column) for field, column in columns.items())
+        
+        # Replace the table contents in one pass
+        _fill_table(self.mapping_table, rows, _READ_ONLY_FLAGS)
+    
+    def _update_mapping_row(self, data_type: str, field: str, excel_column: str) -> None:
+        """
+        Show a saved mapping in the table without rebuilding it.
+        
+        An existing row for the field gets the new column; otherwise a row is
+        inserted after the last row of its data type, matching the order
+        _populate_mapping_table produces.
+        
+        Args:
+            data_type: Data type label of the mapping
+            field: Mapped field
+            excel_column: Excel column the field maps to
+        """
+        type_order = {name: order for order, name in enumerate(DATA_TYPE_SPEC)}
+        insert_row = 0
+        for row in range(self.mapping_table.rowCount()):
+            row_type = self.mapping_table.item(row, 0).text()
+            if row_type == data_type and self.mapping_table.item(row, 1).text() == field:
+                self.mapping_table.setItem(row, 2, _table_item(excel_column, _READ_ONLY_FLAGS))
+                return
+            
+            if type_order.get(row_type, 0) <= type_order[data_type]:
+                insert_row = row + 1
+        
+        self.mapping_table.insertRow(insert_row)
+        for column, value in enumerate((data_type, field, excel_column)):
+            self.mapping_table.setItem(insert_row, column, _table_item(value, _READ_ONLY_FLAGS))
     
+    @pyqtSlot(int)
     def _on_data_type_changed(self, index: int) -> None:
         """
         Handle data type selection change.
@@ -435,91 +879,82 @@ class SettingsDialog(QDialog):
         # Clear the field combo box
         self.field_combo.clear()
         
-        # Get the selected data type
-        data_type = self.data_type_combo.currentText().lower().replace(" ", "_")
-        
-        # Set fields based on data type
-        if data_type == "email_field":
-            self.field_combo.addItems(["Date Received", "Body", "Subject"])
-        elif data_type == "company":
-            self.field_combo.addItems(["Name"])
-        elif data_type == "incident_code":
-            self.field_combo.addItems(["Code"])
+        # Set fields based on the selected data type
+        spec = DATA_TYPE_SPEC.get(self.data_type_combo.currentText())
+        if spec:
+            self.field_combo.addItems(spec["fields"])
     
+    @pyqtSlot()
     def _on_clear_excel_form(self) -> None:
         """
         Clear the Excel mapping form.
         """
-        self.data_type_combo.setCurrentIndex(0)
+        # Repopulate the field dropdown once rather than again from the signal
+        with QSignalBlocker(self.data_type_combo):
+            self.data_type_combo.setCurrentIndex(0)
         self._on_data_type_changed(0)
         self.excel_column_edit.clear()
     
+    @pyqtSlot()
     def _on_save_excel_mapping(self) -> None:
         """
         Handle save Excel mapping button click.
         """
         data_type = self.data_type_combo.currentText()
         field = self.field_combo.currentText()
-        excel_column = self.excel_column_edit.text().strip()
+        excel_column = self.excel_column_edit.text()
         
-        if not excel_column:
+        if not _NONBLANK(excel_column):
             QMessageBox.warning(self, "Warning", "Please enter an Excel column.")
             return
-        
-        # Load existing configuration
-        excel_config_path = os.path.join(self.config_dir, "excel_sheet_mapping.json")
-        excel_config = load_json_config(excel_config_path) or {}
+        excel_column = excel_column.strip()
         
         # Determine the mapping key based on data type
-        mapping_key = ""
-        sheet_name = ""
-        
-        if data_type == "Email Field":
-            mapping_key = "email_mappings"
-            sheet_name = "Email Data"
-        elif data_type == "Company":
-            mapping_key = "company_mappings"
-            sheet_name = "Companies"
-        elif data_type == "Incident Code":
-            mapping_key = "incident_mappings"
-            sheet_name = "Incidents"
-        
-        # Create or update column mapping
-        if mapping_key not in excel_config:
-            excel_config[mapping_key] = {
-                "sheet_name": sheet_name,
-                "columns": {}
-            }
-        elif "columns" not in excel_config[mapping_key]:
-            excel_config[mapping_key]["columns"] = {}
-        
-        # Add or update the mapping
-        excel_config[mapping_key]["columns"][field] = excel_column
-        
-        # Save the updated configuration
-        if save_json_config(excel_config_path, excel_config):
-            # Update the table
-            self._populate_mapping_table(excel_config)
+        spec = DATA_TYPE_SPEC[data_type]
+        mapping_key = spec["key"]
+        sheet_name = spec["sheet"]
+        
+        def set_mapping(excel_config: Dict[str, Any]) -> bool:
+            # Nothing to do if the field is already mapped to this column
+            if excel_config.get(mapping_key, {}).get("columns", {}).get(field) == excel_column:
+                return False
             
-            # Clear the form
-            self._on_clear_excel_form()
+            # Create or update column mapping
+            if mapping_key not in excel_config:
+                excel_config[mapping_key] = {
+                    "sheet_name": sheet_name,
+                    "columns": {}
+                }
+            elif "columns" not in excel_config[mapping_key]:
+                excel_config[mapping_key]["columns"] = {}
             
-            QMessageBox.information(self, "Success", f"Mapping for '{data_type}: {field}' saved successfully.")
-            logger.info(f"Saved Excel mapping for {data_type}: {field}")
-        else:
-            QMessageBox.critical(self, "Error", "Failed to save Excel mapping.")
+            # Add or update the mapping
+            excel_config[mapping_key]["columns"][field] = excel_column
+            return True
+        
+        # Update the configuration and schedule the write
+        self._writer.schedule(self._excel_mapping_path, set_mapping)
+        
+        # Update the table
+        self._update_mapping_row(data_type, field, excel_column)
+        
+        # Clear the form
+        self._on_clear_excel_form()
+        
+        QMessageBox.information(self, "Success", f"Mapping for '{data_type}: {field}' saved successfully.")
+        logger.info(f"Saved Excel mapping for {data_type}: {field}")
     
+    @pyqtSlot()
     def _on_edit_excel_mapping(self) -> None:
         """
         Handle edit Excel mapping button click.
         """
-        selected_items = self.mapping_table.selectedItems()
-        if not selected_items:
+        row = _selected_row(self.mapping_table)
+        if row < 0:
             QMessageBox.warning(self, "Warning", "Please select a mapping to edit.")
             return
         
         # Get the data from the selected row
-        row = selected_items[0].row()
         data_type = self.mapping_table.item(row, 0).text()
         field = self.mapping_table.item(row, 1).text()
         excel_column = self.mapping_table.item(row, 2).text()
@@ -527,8 +962,10 @@ class SettingsDialog(QDialog):
         # Set the form fields
         index = self.data_type_combo.findText(data_type)
         if index >= 0:
-            self.data_type_combo.setCurrentIndex(index)
-            # This will trigger _on_data_type_changed to update the field dropdown
+            # Repopulate the field dropdown once rather than again from the signal
+            with QSignalBlocker(self.data_type_combo):
+                self.data_type_combo.setCurrentIndex(index)
+            self._on_data_type_changed(index)
         
         # Set the field after the dropdown has been populated
         index = self.field_combo.findText(field)
@@ -543,207 +980,218 @@ class SettingsDialog(QDialog):
         
         logger.info(f"Loaded mapping for editing: {data_type}: {field} -> {excel_column}")
     
+    @pyqtSlot()
     def _on_delete_excel_mapping(self) -> None:
         """
         Handle delete Excel mapping button click.
         """
-        selected_items = self.mapping_table.selectedItems()
-        if not selected_items:
+        row = _selected_row(self.mapping_table)
+        if row < 0:
             QMessageBox.warning(self, "Warning", "Please select a mapping to delete.")
             return
         
         # Get the data from the selected row
-        row = selected_items[0].row()
         data_type = self.mapping_table.item(row, 0).text()
         field = self.mapping_table.item(row, 1).text()
         
         # Confirm deletion
-        reply = QMessageBox.question(
-            self, 
-            "Confirm Deletion",
-            f"Are you sure you want to delete the mapping for '{data_type}: {field}'?",
-            QMessageBox.StandardButton.Yes | QMessageBox.StandardButton.No
-        )
-        
-        if reply == QMessageBox.StandardButton.Yes:
-            # Load existing configuration
-            excel_config_path = os.path.join(self.config_dir, "excel_sheet_mapping.json")
-            excel_config = load_json_config(excel_config_path) or {}
-            
+        if self._confirm_deletion(f"Are you sure you want to delete the mapping for '{data_type}: {field}'?"):
             # Determine the mapping key based on data type
-            mapping_key = ""
-            
-            if data_type == "Email Field":
-                mapping_key = "email_mappings"
-            elif data_type == "Company":
-                mapping_key = "company_mappings"
-            elif data_type == "Incident Code":
-                mapping_key = "incident_mappings"
+            mapping_key = DATA_TYPE_SPEC[data_type]["key"]
             
             # Find and remove the mapping
             deleted = False
-            if mapping_key in excel_config and "columns" in excel_config[mapping_key]:
-                columns = excel_config[mapping_key].get("columns", {})
-                if field in columns:
-                    del columns[field]
-                    deleted = True
             
-            # Save the updated configuration
-            if deleted and save_json_config(excel_config_path, excel_config):
+            def remove_mapping(excel_config: Dict[str, Any]) -> bool:
+                nonlocal deleted
+                if mapping_key in excel_config and "columns" in excel_config[mapping_key]:
+                    columns = excel_config[mapping_key].get("columns", {})
+                    if field in columns:
+                        del columns[field]
+                        deleted = True
+                return deleted
+            
+            # Update the configuration and schedule the write
+            self._writer.schedule(self._excel_mapping_path, remove_mapping)
+            
+            if deleted:
                 # Remove from table widget
                 self.mapping_table.removeRow(row)
                 logger.info(f"Deleted mapping for {data_type}: {field}")
             else:
                 QMessageBox.critical(self, "Error", "Failed to delete mapping.")
     
+    @pyqtSlot()
     def _on_save_company(self) -> None:
         """
         Handle save company button click.
         """
-        company_name = self.company_name_edit.text().strip()
-        if not company_name:
+        company_name = self.company_name_edit.text()
+        if not _NONBLANK(company_name):
             QMessageBox.warning(self, "Warning", "Please enter a company name.")
             return
+        company_name = company_name.strip()
         
-        # Update configuration
-        company_config_path = os.path.join(self.config_dir, "company_name.json")
-        company_config = load_json_config(company_config_path) or {"companies": []}
+        def set_company(company_config: Dict[str, Any]) -> bool:
+            # Nothing to do if this is already the only company
+            if company_config.get("companies") == [company_name]:
+                return False
+            
+            # Replace existing company or create new list
+            company_config["companies"] = [company_name]
+            return True
         
-        # Replace existing company or create new list
-        company_config["companies"] = [company_name]
+        self._writer.schedule(self._company_path, set_company)
         
-        if save_json_config(company_config_path, company_config):
-            QMessageBox.information(self, "Success", f"Company name set to '{company_name}'.")
-            logger.info(f"Company name set to: {company_name}")
-        else:
-            QMessageBox.critical(self, "Error", "Failed to save company name.")
+        QMessageBox.information(self, "Success", f"Company name set to '{company_name}'.")
+        logger.info(f"Company name set to: {company_name}")
     
+    @pyqtSlot()
     def _on_add_incident(self) -> None:
         """
         Handle add incident code button click.
         """
-        ref_code = self.incident_code_edit.text().strip()
-        description = self.incident_desc_edit.text().strip()
+        ref_code = self.incident_code_edit.text()
         
-        if not ref_code:
+        if not _NONBLANK(ref_code):
             QMessageBox.warning(self, "Warning", "Please enter a reference code.")
             return
+        ref_code = ref_code.strip()
+        description = self.incident_desc_edit.text().strip()
+        
+        def add_code(incident_config: Dict[str, Any]) -> bool:
+            incident_codes = incident_config.setdefault("incident_codes", {})
+            if ref_code in incident_codes:
+                logger.warning(f"Incident code {ref_code} already exists in configuration")
+                return False
+            incident_codes[ref_code] = description
+            return True
         
         # Add to configuration
-        incident_config_path = os.path.join(self.config_dir, "incident_ref_code.json")
-        if add_incident_ref_code(incident_config_path, ref_code, description):
-            # Add to table widget
-            row = self.incident_table.rowCount()
-            self.incident_table.insertRow(row)
-            self.incident_table.setItem(row, 0, QTableWidgetItem(ref_code))
-            self.incident_table.setItem(row, 1, QTableWidgetItem(description))
-            
-            # Clear inputs
-            self.incident_code_edit.clear()
-            self.incident_desc_edit.clear()
-            
-            logger.info(f"Added incident code: {ref_code}")
-        else:
-            QMessageBox.critical(self, "Error", "Failed to add incident code.")
+        self._writer.schedule(self._incident_path, add_code, {"incident_codes": {}})
+        
+        # Add to table widget
+        row = self.incident_table.rowCount()
+        self.incident_table.insertRow(row)
+        self.incident_table.setItem(row, 0, QTableWidgetItem(ref_code))
+        self.incident_table.setItem(row, 1, QTableWidgetItem(description))
+        
+        # Clear inputs
+        self.incident_code_edit.clear()
+        self.incident_desc_edit.clear()
+        
+        logger.info(f"Added incident code: {ref_code}")
     
+    @pyqtSlot()
     def _on_delete_incident(self) -> None:
         """
         Handle delete incident code button click.
         """
-        selected_items = self.incident_table.selectedItems()
-        if not selected_items:
+        row = _selected_row(self.incident_table)
+        if row < 0:
             QMessageBox.warning(self, "Warning", "Please select an incident code to delete.")
             return
         
         # Get the reference code from the first column of the selected row
-        row = selected_items[0].row()
         ref_code = self.incident_table.item(row, 0).text()
         
         # Confirm deletion
-        reply = QMessageBox.question(
-            self, 
-            "Confirm Deletion",
-            f"Are you sure you want to delete the incident code '{ref_code}'?",
-            QMessageBox.StandardButton.Yes | QMessageBox.StandardButton.No
-        )
-        
-        if reply == QMessageBox.StandardButton.Yes:
+        if self._confirm_deletion(f"Are you sure you want to delete the incident code '{ref_code}'?"):
+            def remove_code(incident_config: Dict[str, Any]) -> bool:
+                incident_codes = incident_config.get("incident_codes", {})
+                if ref_code not in incident_codes:
+                    logger.warning(f"Incident code {ref_code} not found in configuration")
+                    return False
+                del incident_codes[ref_code]
+                return True
+            
             # Remove from configuration
-            incident_config_path = os.path.join(self.config_dir, "incident_ref_code.json")
-            if remove_incident_ref_code(incident_config_path, ref_code):
-                # Remove from table widget
-                self.incident_table.removeRow(row)
-                logger.info(f"Deleted incident code: {ref_code}")
-            else:
-                QMessageBox.critical(self, "Error", "Failed to delete incident code.")
+            self._writer.schedule(self._incident_path, remove_code, {"incident_codes": {}})
+            
+            # Remove from table widget
+            self.incident_table.removeRow(row)
+            logger.info(f"Deleted incident code: {ref_code}")
     
+    @pyqtSlot()
     def _on_add_keyword(self) -> None:
         """
         Handle add keyword button click.
         """
-        category = self.category_combo.currentText().strip()
-        keyword = self.keyword_edit.text().strip()
+        category = self.category_combo.currentText()
+        keyword = self.keyword_edit.text()
         
-        if not category:
+        if not _NONBLANK(category):
             QMessageBox.warning(self, "Warning", "Please enter a category.")
             return
         
-        if not keyword:
+        if not _NONBLANK(keyword):
             QMessageBox.warning(self, "Warning", "Please enter a keyword.")
             return
+        category = category.strip()
+        keyword = keyword.strip()
+        
+        def add_keyword(keywords_config: Dict[str, Any]) -> bool:
+            keywords = keywords_config.setdefault("categories", {}).setdefault(category, [])
+            if keyword in keywords:
+                logger.warning(f"Keyword {keyword} already exists in category {category}")
+                return False
+            keywords.append(keyword)
+            return True
         
         # Add to configuration
-        keywords_config_path = os.path.join(self.config_dir, "pre_defined_keywords.json")
-        if add_predefined_keyword(keywords_config_path, category, keyword):
-            # Add to table widget
-            row = self.keywords_table.rowCount()
-            self.keywords_table.insertRow(row)
-            self.keywords_table.setItem(row, 0, QTableWidgetItem(category))
-            self.keywords_table.setItem(row, 1, QTableWidgetItem(keyword))
-            
-            # Add category to combo box if it's new
-            if self.category_combo.findText(category) == -1:
-                self.category_combo.addItem(category)
-            
-            # Clear keyword input
-            self.keyword_edit.clear()
-            
-            logger.info(f"Added keyword '{keyword}' to category '{category}'")
-        else:
-            QMessageBox.critical(self, "Error", "Failed to add keyword.")
+        self._writer.schedule(self._keywords_path, add_keyword, {"categories": {}})
+        
+        # Add to table widget
+        row = self.keywords_table.rowCount()
+        self.keywords_table.insertRow(row)
+        self.keywords_table.setItem(row, 0, QTableWidgetItem(category))
+        self.keywords_table.setItem(row, 1, QTableWidgetItem(keyword))
+        
+        # Add category to combo box if it's new
+        if self.category_combo.findText(category) == -1:
+            self.category_combo.addItem(category)
+        
+        # Clear keyword input
+        self.keyword_edit.clear()
+        
+        logger.info(f"Added keyword '{keyword}' to category '{category}'")
     
+    @pyqtSlot()
     def _on_delete_keyword(self) -> None:
         """
         Handle delete keyword button click.
         """
-        selected_items = self.keywords_table.selectedItems()
-        if not selected_items:
+        row = _selected_row(self.keywords_table)
+        if row < 0:
             QMessageBox.warning(self, "Warning", "Please select a keyword to delete.")
             return
         
         # Get the category and keyword from the selected row
-        row = selected_items[0].row()
         category = self.keywords_table.item(row, 0).text()
         keyword = self.keywords_table.item(row, 1).text()
         
         # Confirm deletion
-        reply = QMessageBox.question(
-            self, 
-            "Confirm Deletion",
-            f"Are you sure you want to delete the keyword '{keyword}' from category '{category}'?",
-            QMessageBox.StandardButton.Yes | QMessageBox.StandardButton.No
-        )
-        
-        if reply == QMessageBox.StandardButton.Yes:
+        if self._confirm_deletion(f"Are you sure you want to delete the keyword '{keyword}' from category '{category}'?"):
+            def remove_keyword(keywords_config: Dict[str, Any]) -> bool:
+                categories = keywords_config.get("categories", {})
+                if keyword not in categories.get(category, []):
+                    logger.warning(f"Keyword {keyword} not found in category {category}")
+                    return False
+                categories[category].remove(keyword)
+                
+                # Remove the category if it's empty
+                if not categories[category]:
+                    del categories[category]
+                return True
+            
             # Remove from configuration
-            keywords_config_path = os.path.join(self.config_dir, "pre_defined_keywords.json")
-            if remove_predefined_keyword(keywords_config_path, category, keyword):
-                # Remove from table widget
-                self.keywords_table.removeRow(row)
-                logger.info(f"Deleted keyword '{keyword}' from category '{category}'")
-            else:
-                QMessageBox.critical(self, "Error", "Failed to delete keyword.")
+            self._writer.schedule(self._keywords_path, remove_keyword, {"categories": {}})
+            
+            # Remove from table widget
+            self.keywords_table.removeRow(row)
+            logger.info(f"Deleted keyword '{keyword}' from category '{category}'")
     
+    @pyqtSlot()
     def _on_browse_excel(self) -> None:
         """
         Handle browse Excel file button click.
@@ -760,11 +1208,8 @@ class SettingsDialog(QDialog):
             logger.info(f"Selected Excel file: {file_path}")
             
             # Save the file path to configuration
-            excel_config_path = os.path.join(self.config_dir, "excel_sheet_mapping.json")
-            excel_config = load_json_config(excel_config_path) or {}
-            excel_config["file_path"] = file_path
-            save_json_config(excel_config_path, excel_config)
-            logger.debug(f"Saved Excel file path: {file_path}")
+            self._writer.schedule(self._excel_mapping_path, lambda config: config.update(file_path=file_path))
+            logger.debug("Saved Excel file path: %s", file_path)
             
             # Load sheet information
             self._load_excel_sheet_info(file_path)
@@ -789,14 +1234,14 @@ class SettingsDialog(QDialog):
             return
         
         # Add sheets to the dropdown
-        for sheet_name in sheet_info.keys():
-            self.sheet_combo.addItem(sheet_name)
+        self.sheet_combo.addItems(list(sheet_info))
         
         # Select the first sheet
         if self.sheet_combo.count() > 0:
             self.sheet_combo.setCurrentIndex(0)
             # This will trigger _on_sheet_selected
     
+    @pyqtSlot(int)
     def _on_sheet_selected(self, index: int) -> None:
         """
         Handle sheet selection change.
@@ -820,15 +1265,13 @@ class SettingsDialog(QDialog):
         if sheet_name in sheet_info:
             row_count = sheet_info[sheet_name]
             self.row_count_display.setText(str(row_count))
-            logger.debug(f"Selected sheet '{sheet_name}' with {row_count} rows")
+            logger.debug("Selected sheet '%s' with %d rows", sheet_name, row_count)
             
             # Save the selected sheet to configuration
-            excel_config_path = os.path.join(self.config_dir, "excel_sheet_mapping.json")
-            excel_config = load_json_config(excel_config_path) or {}
-            excel_config["selected_sheet"] = sheet_name
-            save_json_config(excel_config_path, excel_config)
-            logger.debug(f"Saved selected sheet: {sheet_name}")
+            self._writer.schedule(self._excel_mapping_path, lambda config: config.update(selected_sheet=sheet_name))
+            logger.debug("Saved selected sheet: %s", sheet_name)
     
+    @pyqtSlot()
     def _on_mapping_selection_changed(self) -> None:
         """
         Handle selection change in the mapping table.
@@ -837,55 +1280,156 @@ class SettingsDialog(QDialog):
         # Currently it doesn't need to do anything, but it's required for the signal connection
         pass
     
+    def _confirm_deletion(self, message: str) -> bool:
+        """
+        Ask the user to confirm a deletion.
+        
+        Args:
+            message: Question to show
+            
+        Returns:
+            True if the user chose Yes, False otherwise
+        """
+        self._confirm_box.setText(message)
+        return self._confirm_box.exec() == QMessageBox.StandardButton.Yes.value
+    
+    @pyqtSlot(str, bool)
+    def _on_config_write_finished(self, path: str, success: bool) -> None:
+        """
+        Report a configuration file that could not be written.
+        
+        Args:
+            path: Path to the JSON file
+            success: Whether the write succeeded
+        """
+        if not success:
+            QMessageBox.critical(self, "Error", f"Failed to save {os.path.basename(path)}.")
+    
+    @pyqtSlot()
     def _on_save(self) -> None:
         """
         Handle save button click without closing the dialog.
         """
         try:
-            # Save company name
-            company_name = self.company_name_edit.text().strip()
-            company_config_path = os.path.join(self.config_dir, "company_name.json")
-            company_config = {"companies": [company_name] if company_name else []}
-            save_json_config(company_config_path, company_config)
-            logger.info(f"Saved company name: {company_name}")
+            # Only tabs that have been shown hold edits to save
+            if self._COMPANY_TAB in self._tabs_built:
+                # Save company name
+                company_name = self.company_name_edit.text().strip()
+                self._writer.schedule(self._company_path,
+                                      lambda config: config.update(companies=[company_name] if company_name else []))
+                logger.info(f"Saved company name: {company_name}")
             
-            # Save incident codes
-            incident_codes = {}
-            for i in range(self.incident_table.rowCount()):
-                code = self.incident_table.item(i, 0).text()
-                desc = self.incident_table.item(i, 1).text() if self.incident_table.item(i, 1) else ""
-                incident_codes[code] = desc
+            if self._INCIDENT_TAB in self._tabs_built:
+                # Save incident codes
+                incident_codes = dict(_snapshot_table(self.incident_table, 2))
+                self._writer.schedule(self._incident_path, lambda config: config.update(incident_codes=incident_codes))
             
-            incident_config_path = os.path.join(self.config_dir, "incident_ref_code.json")
-            incident_config = {"incident_codes": incident_codes}
-            save_json_config(incident_config_path, incident_config)
-            
-            # Save keywords
-            categories = {}
-            for i in range(self.keywords_table.rowCount()):
-                category = self.keywords_table.item(i, 0).text()
-                keyword = self.keywords_table.item(i, 1).text()
-                
-                if category not in categories:
-                    categories[category] = []
+            if self._KEYWORD_TAB in self._tabs_built:
+                # Save keywords
+                # Dict keys drop duplicate keywords in O(1) while keeping table order
+                buckets = defaultdict(dict)
+                for category, keyword in _snapshot_table(self.keywords_table, 2):
+                    buckets[category][keyword] = None
+                categories = {category: list(keywords) for category, keywords in buckets.items()}
                 
-                if keyword not in categories[category]:
-                    categories[category].append(keyword)
+                self._writer.schedule(self._keywords_path, lambda config: config.update(categories=categories))
             
-            keywords_config = {"categories": categories}
-            keywords_config_path = os.path.join(self.config_dir, "pre_defined_keywords.json")
-            save_json_config(keywords_config_path, keywords_config)
+            if self._EXCEL_TAB in self._tabs_built:
+                # Save Excel file path and selected sheet
+                self._writer.schedule(self._excel_mapping_path, lambda config: config.update(
+                    file_path=self.excel_path_edit.text(),
+                    selected_sheet=self.sheet_combo.currentText()
+                ))
             
-            # Save Excel file path and selected sheet
-            excel_config_path = os.path.join(self.config_dir, "excel_sheet_mapping.json")
-            excel_config = load_json_config(excel_config_path) or {}
-            excel_config["file_path"] = self.excel_path_edit.text()
-            excel_config["selected_sheet"] = self.sheet_combo.currentText()
-            save_json_config(excel_config_path, excel_config)
-            
-            # Show success message
-            QMessageBox.information(self, "Success", "Settings saved successfully.")
-            logger.info("Settings saved successfully")
+            # Write everything now on the writer thread, including edits
+            # still waiting on the delay
+            self._writer.flush_all_async(self._on_save_finished)
         except Exception as e:
             QMessageBox.critical(self, "Error", f"Failed to save settings: {str(e)}")
             logger.error(f"Failed to save settings: {str(e)}")
+    
+    @pyqtSlot(bool)
+    def _on_save_finished(self, success: bool) -> None:
+        """
+        Report the result of saving the settings.
+        
+        Files that failed are reported individually by
+        _on_config_write_finished.
+        
+        Args:
+            success: Whether all configuration files were written
+        """
+        if success:
+            # Show the modal box after this slot returns, so the remaining
+            # write notifications are not held up behind it
+            logger.debug("Settings saved successfully")
+            QTimer.singleShot(0, self._show_save_success)
+        else:
+            logger.error("Failed to save settings")
+    
+    @pyqtSlot()
+    def _show_save_success(self) -> None:
+        """
+        Tell the user that the settings were saved.
+        """
+        QMessageBox.information(self, "Success", "Settings saved successfully.")
+    
+    @pyqtSlot(result=bool)
+    def force_flush(self) -> bool:
+        """
+        Write all pending configuration edits immediately.
+        
+        Returns:
+            True if all writes succeeded, False otherwise
+        """
+        return self._writer.flush_all()
+    
+    def done(self, result: int) -> None:
+        """
+        Write pending configuration edits before the dialog closes.
+        
+        Covers accept() and reject(), including Escape, the Cancel button and
+        closing the window. If a write fails the dialog stays open unless the
+        user chooses to discard the edits. The quit-time flush is then
+        disconnected, as nothing is left to write.
+        
+        Args:
+            result: Dialog result code
+        """
+        if not self.force_flush() and not self._confirm_discard():
+            return
+        
+        if self._quit_connection is not None:
+            QObject.disconnect(self._quit_connection)
+            self._quit_connection = None
+        super().done(result)
+    
+    def _confirm_discard(self) -> bool:
+        """
+        Ask whether to close the dialog although some edits could not be saved.
+        
+        Returns:
+            True if the user chose to discard the edits, False otherwise
+        """
+        reply = QMessageBox.question(
+            self,
+            "Unsaved Settings",
+            "Some settings could not be saved. Close anyway and discard them?",
+            QMessageBox.StandardButton.Yes | QMessageBox.StandardButton.No,
+            QMessageBox.StandardButton.No
+        )
+        return reply == QMessageBox.StandardButton.Yes
+    
+    def closeEvent(self, event: QCloseEvent) -> None:
+        """
+        Write pending configuration edits when the window is closed.
+        
+        A visible dialog is closed through reject(), so done() writes the
+        edits and keeps the dialog open if that fails.
+        
+        Args:
+            event: Close event
+        """
+        if not self.isVisible():
+            self.force_flush()
+        super().closeEvent(event)
@@ -8,17 +8,73 @@ JSON configuration files used by the application.
 """
 
 import os
+import copy
 import json
 import logging
-from typing import Dict, Any, Optional, List
+from concurrent.futures import ThreadPoolExecutor
+from typing import Dict, Any, Optional, List, Tuple, Union
+
+from src.utils.json_io import decode_config, encode_config
 
 # Logger setup
 logger = logging.getLogger(__name__)
 
+# Default configuration for each configuration type
+_DEFAULT_CONFIGS: Dict[str, Dict[str, Any]] = {
+    "company_names": {"companies": []},
+    "incident_codes": {"incident_codes": {}},
+    "keywords": {
+        "categories": {
+            "Incident Type": ["outage", "breach", "failure", "error"],
+            "Priority": ["high", "medium", "low", "critical", "urgent"],
+            "Status": ["resolved", "ongoing", "investigating", "mitigated"]
+        }
+    },
+    "excel_mapping": {
+        "incidents": {
+            "sheet_name": "Incidents",
+            "columns": {
+                "date": "Date",
+                "company": "Company",
+                "reference": "Reference",
+                "description": "Description",
+                "status": "Status",
+                "priority": "Priority"
+            }
+        }
+    }
+}
+
+# Required top-level entry and its type for the simple configuration types
+_REQUIRED_ENTRIES: Dict[str, Tuple[str, type]] = {
+    "company_names": ("companies", list),
+    "incident_codes": ("incident_codes", dict),
+    "keywords": ("categories", dict),
+}
+
+# Parsed configurations keyed by path, with the (mtime_ns, size) they were read at
+_CONFIG_CACHE: Dict[str, Tuple[Tuple[int, int], Dict[str, Any]]] = {}
+
+def _file_signature(file_path: Union[str, int]) -> Tuple[int, int]:
+    """
+    Get the modification time and size of a file.
+    
+    Args:
+        file_path: Path to the file, or the descriptor of an open file
+        
+    Returns:
+        Tuple of modification time in nanoseconds and size in bytes
+    """
+    stat = os.stat(file_path)
+    return stat.st_mtime_ns, stat.st_size
+
 def load_config(file_path: str) -> Optional[Dict[str, Any]]:
     """
     Load a JSON configuration file.
     
+    Parsed configurations are cached until the file's modification time or
+    size changes; callers get their own copy.
+    
     Args:
         file_path: Path to the JSON file
         
@@ -26,13 +82,24 @@ def load_config(file_path: str) -> Optional[Dict[str, Any]]:
         Dictionary containing the configuration or None if error
     """
     try:
-        if not os.path.exists(file_path):
+        try:
+            signature = _file_signature(file_path)
+        except FileNotFoundError:
+            _CONFIG_CACHE.pop(file_path, None)
             logger.warning(f"Configuration file not found: {file_path}")
             return None
+        
+        # Reuse the parsed configuration if the file is unchanged
+        cached = _CONFIG_CACHE.get(file_path)
+        if cached is not None and cached[0] == signature:
+            return copy.deepcopy(cached[1])
             
-        with open(file_path, 'r', encoding='utf-8') as f:
-            config = json.load(f)
+        # Key the cache on the opened file, so it always describes the bytes read
+        with open(file_path, 'rb') as f:
+            signature = _file_signature(f.fileno())
+            config = decode_config(f.read())
             
+        _CONFIG_CACHE[file_path] = (signature, copy.deepcopy(config))
         logger.debug(f"Loaded configuration from {file_path}")
         return config
     except json.JSONDecodeError as e:
@@ -63,11 +130,14 @@ def load_all_configs() -> Dict[str, Any]:
         "excel_mapping": "excel_sheet_mapping.json"
     }
     
-    # Load configurations
+    # Load configurations concurrently so cold reads overlap
+    file_paths = {config_key: os.path.join(config_dir, file_name) for config_key, file_name in config_files.items()}
+    with ThreadPoolExecutor(max_workers=len(file_paths)) as executor:
+        loaded = dict(zip(file_paths, executor.map(load_config, file_paths.values())))
+    
     configs = {}
-    for config_key, file_name in config_files.items():
-        file_path = os.path.join(config_dir, file_name)
-        config = load_config(file_path)
+    for config_key, file_path in file_paths.items():
+        config = loaded[config_key]
         
         # Create default configuration if file doesn't exist
         if config is None:
@@ -89,35 +159,13 @@ def create_default_config(config_type: str) -> Dict[str, Any]:
     Returns:
         Dictionary containing the default configuration
     """
-    if config_type == "company_names":
-        return {"companies": []}
-    elif config_type == "incident_codes":
-        return {"incident_codes": {}}
-    elif config_type == "keywords":
-        return {
-            "categories": {
-                "Incident Type": ["outage", "breach", "failure", "error"],
-                "Priority": ["high", "medium", "low", "critical", "urgent"],
-                "Status": ["resolved", "ongoing", "investigating", "mitigated"]
-            }
-        }
-    elif config_type == "excel_mapping":
-        return {
-            "incidents": {
-                "sheet_name": "Incidents",
-                "columns": {
-                    "date": "Date",
-                    "company": "Company",
-                    "reference": "Reference",
-                    "description": "Description",
-                    "status": "Status",
-                    "priority": "Priority"
-                }
-            }
-        }
-    else:
+    default = _DEFAULT_CONFIGS.get(config_type)
+    if default is None:
         logger.warning(f"Unknown configuration type: {config_type}")
         return {}
+    
+    # Return a copy so callers cannot modify the shared defaults
+    return copy.deepcopy(default)
 
 def save_config(file_path: str, config: Dict[str, Any]) -> bool:
     """
@@ -134,9 +182,11 @@ def save_config(file_path: str, config: Dict[str, Any]) -> bool:
         # Ensure the directory exists
         os.makedirs(os.path.dirname(file_path), exist_ok=True)
         
-        with open(file_path, 'w', encoding='utf-8') as f:
-            json.dump(config, f, indent=4, ensure_ascii=False)
+        with open(file_path, 'wb') as f:
+            f.write(encode_config(config))
             
+        # Remember what was written so the next load does not parse it again
+        _CONFIG_CACHE[file_path] = (_file_signature(file_path), copy.deepcopy(config))
         logger.debug(f"Saved configuration to {file_path}")
         return True
     except Exception as e:
@@ -154,29 +204,20 @@ def validate_config(config: Dict[str, Any], config_type: str) -> bool:
     Returns:
         True if valid, False otherwise
     """
-    if config_type == "company_names":
-        return "companies" in config and isinstance(config["companies"], list)
-    elif config_type == "incident_codes":
-        return "incident_codes" in config and isinstance(config["incident_codes"], dict)
-    elif config_type == "keywords":
-        return "categories" in config and isinstance(config["categories"], dict)
-    elif config_type == "excel_mapping":
-        # Check if at least one mapping exists
-        if not config:
-            return False
-            
-        # Check each mapping
-        for data_type, mapping in config.items():
-            if not isinstance(mapping, dict):
-                return False
-                
-            if "sheet_name" not in mapping or "columns" not in mapping:
-                return False
-                
-            if not isinstance(mapping["columns"], dict):
-                return False
-                
-        return True
-    else:
-        logger.warning(f"Unknown configuration type: {config_type}")
-        return False
+    # Configurations with a single required top-level entry
+    required = _REQUIRED_ENTRIES.get(config_type)
+    if required is not None:
+        key, expected_type = required
+        return isinstance(config.get(key), expected_type)
+    
+    if config_type == "excel_mapping":
+        # Check that at least one mapping exists and that each one has a sheet and columns
+        return bool(config) and all(
+            isinstance(mapping, dict)
+            and "sheet_name" in mapping
+            and isinstance(mapping.get("columns"), dict)
+            for mapping in config.values()
+        )
+    
+    logger.warning(f"Unknown configuration type: {config_type}")
+    return False
@@ -0,0 +1,58 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+JSON encoding and decoding for configuration files.
+
+This module provides the single encoder and decoder shared by the
+modules that read and write the application's JSON configurations.
+"""
+
+import json
+from typing import Dict, Any
+
+# orjson parses and encodes UTF-8 bytes directly and is much faster than json when installed
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+def decode_config(data: bytes) -> Any:
+    """
+    Decode a UTF-8 JSON document.
+    
+    Args:
+        data: Raw file contents
+        
+    Returns:
+        Decoded JSON value
+        
+    Raises:
+        json.JSONDecodeError: If the document is not valid JSON
+    """
+    if orjson is not None:
+        # orjson.JSONDecodeError is a subclass of json.JSONDecodeError
+        return orjson.loads(data)
+    return json.loads(data)
+
+def encode_config(config: Dict[str, Any]) -> bytes:
+    """
+    Encode a configuration as pretty-printed UTF-8 JSON.
+    
+    Uses orjson when installed and json otherwise; both write 2-space
+    indentation and unescaped UTF-8, so hand-edited files keep the same
+    layout whichever optional packages are installed.
+    
+    Args:
+        config: Dictionary containing the configuration
+        
+    Returns:
+        Encoded JSON document
+    """
+    if orjson is not None:
+        try:
+            return orjson.dumps(config, option=orjson.OPT_INDENT_2 | orjson.OPT_NON_STR_KEYS)
+        except TypeError:
+            # Fall back to json for values orjson does not serialize
+            pass
+    
+    return json.dumps(config, indent=2, ensure_ascii=False).encode('utf-8')
@@ -8,14 +8,145 @@ the application's logging system.
 """
 
 import os
+import queue
+import atexit
 import logging
 import datetime
+import functools
+from logging.handlers import QueueHandler, QueueListener, RotatingFileHandler
 from typing import Optional
 
+# Log file rotation size and number of rotated files kept
+LOG_MAX_BYTES = 10 * 1024 * 1024
+LOG_BACKUP_COUNT = 5
+
+# Write buffer for the log file; records below FLUSH_LEVEL wait in it
+LOG_BUFFER_SIZE = 64 * 1024
+FLUSH_LEVEL = logging.WARNING
+
+class _BufferedRotatingFileHandler(RotatingFileHandler):
+    """
+    Rotating file handler that only flushes the file for important records.
+    
+    Records below the flush level stay in a large write buffer instead of
+    costing a write() each; the buffer is written out with the next
+    important record, when it fills up, and when the handler is closed.
+    The file size is tracked in Python, so checking for rollover never
+    seeks in, and thereby flushes, the stream.
+    """
+    
+    def __init__(self, filename: str, flush_level: int = FLUSH_LEVEL, **kwargs):
+        """
+        Initialize the handler.
+        
+        Args:
+            filename: Path to the log file
+            flush_level: Lowest level that flushes the file immediately
+            **kwargs: Arguments passed on to RotatingFileHandler
+        """
+        self.flush_level = flush_level
+        self._bytes_written = 0
+        super().__init__(filename, **kwargs)
+    
+    def _open(self):
+        """
+        Open the log file with a large write buffer.
+        
+        Returns:
+            Text stream for the log file
+        """
+        stream = open(self.baseFilename, self.mode, buffering=LOG_BUFFER_SIZE,
+                      encoding=self.encoding, errors=self.errors)
+        
+        # Continue counting from the size of the existing file
+        self._bytes_written = os.fstat(stream.fileno()).st_size
+        return stream
+    
+    def shouldRollover(self, record: logging.LogRecord, size: Optional[int] = None) -> bool:
+        """
+        Check whether writing a record would take the file past maxBytes.
+        
+        Args:
+            record: Log record to write
+            size: Encoded size of the formatted record, computed if not given
+            
+        Returns:
+            True if the file should be rotated first, False otherwise
+        """
+        if self.maxBytes <= 0:
+            return False
+        
+        if self.stream is None:
+            self.stream = self._open()
+        if size is None:
+            size = len(self._encode(self.format(record) + self.terminator))
+        return self._bytes_written + size >= self.maxBytes
+    
+    def _encode(self, msg: str) -> bytes:
+        """
+        Encode a message the way the log file stream will.
+        
+        Args:
+            msg: Formatted message
+            
+        Returns:
+            Encoded message
+        """
+        return msg.encode(self.encoding or "utf-8", self.errors or "strict")
+    
+    def emit(self, record: logging.LogRecord) -> None:
+        """
+        Write a record, flushing only if it is at or above the flush level.
+        
+        Args:
+            record: Log record to write
+        """
+        try:
+            msg = self.format(record) + self.terminator
+            size = len(self._encode(msg))
+            
+            if self.shouldRollover(record, size):
+                self.doRollover()
+            if self.stream is None:
+                self.stream = self._open()
+            
+            self.stream.write(msg)
+            self._bytes_written += size
+            
+            if record.levelno >= self.flush_level:
+                self.flush()
+        except RecursionError:
+            raise
+        except Exception:
+            self.handleError(record)
+
+# Background thread that writes queued records to the file and console handlers
+_queue_listener: Optional[QueueListener] = None
+
+def _stop_queue_listener() -> None:
+    """
+    Stop the background log writer after it has handled all queued records.
+    """
+    global _queue_listener
+    if _queue_listener is None:
+        return
+    
+    _queue_listener.stop()
+    for handler in _queue_listener.handlers:
+        handler.close()
+    _queue_listener = None
+
+# Runs before logging's own shutdown, which was registered when logging was imported
+atexit.register(_stop_queue_listener)
+
 def setup_logger(log_level: int = logging.INFO) -> logging.Logger:
     """
     Set up and configure the application logger.
     
+    The root logger only queues records; a background thread writes them
+    to the log file and the console, so logging never blocks the caller
+    on I/O.
+    
     Args:
         log_level: Logging level (default: INFO)
         
@@ -34,12 +165,19 @@ def setup_logger(log_level: int = logging.INFO) -> logging.Logger:
     logger = logging.getLogger()
     logger.setLevel(log_level)
     
-    # Remove existing handlers to avoid duplicates
+    # Remove existing handlers to avoid duplicates, writing out anything queued for them
+    _stop_queue_listener()
     for handler in logger.handlers[:]:
         logger.removeHandler(handler)
     
-    # Create file handler
-    file_handler = logging.FileHandler(log_file)
+    # Create file handler; rotated by size and buffered, see _BufferedRotatingFileHandler
+    file_handler = _BufferedRotatingFileHandler(
+        log_file,
+        maxBytes=LOG_MAX_BYTES,
+        backupCount=LOG_BACKUP_COUNT,
+        encoding="utf-8",
+        delay=True
+    )
     file_handler.setLevel(log_level)
     
     # Create console handler
@@ -53,17 +191,24 @@ def setup_logger(log_level: int = logging.INFO) -> logging.Logger:
     file_handler.setFormatter(formatter)
     console_handler.setFormatter(formatter)
     
-    # Add handlers to logger
-    logger.addHandler(file_handler)
-    logger.addHandler(console_handler)
+    # Queue records on the logger and write them from a background thread
+    global _queue_listener
+    log_queue = queue.SimpleQueue()
+    logger.addHandler(QueueHandler(log_queue))
+    _queue_listener = QueueListener(log_queue, file_handler, console_handler, respect_handler_level=True)
+    _queue_listener.start()
     
     logger.info("Logger initialized")
     return logger
 
+@functools.lru_cache(maxsize=256)
 def get_logger(name: str) -> logging.Logger:
     """
     Get a logger with the specified name.
     
+    Loggers are never destroyed, so lookups are cached to avoid taking the
+    logging module lock on repeated calls.
+    
     Args:
         name: Logger name
         
@@ -16,6 +16,7 @@ sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..')
 from src.email_parser import (
     parse_email_content,
     extract_company_name,
+    compile_company_pattern,
     extract_incident_reference,
     match_predefined_keywords
 )
@@ -92,6 +93,33 @@ class TestEmailParser(unittest.TestCase):
         company = extract_company_name(no_match_content, self.company_names)
         self.assertIsNone(company)
     
+    def test_extract_company_name_with_pattern(self):
+        """
+        Test extracting company name with a precompiled company pattern.
+        """
+        company_names = ["ABC", "ABC Corporation", "Example Corp"]
+        company_pattern = compile_company_pattern(company_names)
+        
+        # Longer names win over names they contain
+        content = "We saw an outage reported by ABC Corporation today."
+        company = extract_company_name(content, company_names, company_pattern)
+        self.assertEqual(company, "ABC Corporation")
+        
+        # Names must be standalone words
+        content = "The ABCD team and example corp are both affected."
+        company = extract_company_name(content, company_names, company_pattern)
+        self.assertEqual(company, "Example Corp")
+        
+        # Results match the uncompiled path
+        for content in [self.email_content, "Nothing relevant here.", "abc abc corporation"]:
+            self.assertEqual(
+                extract_company_name(content, company_names, company_pattern),
+                extract_company_name(content, company_names)
+            )
+        
+        # No company names means no pattern
+        self.assertIsNone(compile_company_pattern([]))
+    
     def test_extract_incident_reference(self):
         """
         Test extracting incident reference from email content.
@@ -139,6 +167,23 @@ class TestEmailParser(unittest.TestCase):
         no_match_content = "This email doesn't contain any of the predefined keywords."
         matches = match_predefined_keywords(no_match_content, self.keywords)
         self.assertEqual(matches, {})
+    
+    def test_match_predefined_keywords_overlapping(self):
+        """
+        Test matching keywords that start at the same position.
+        """
+        keywords = {
+            "Priority": ["high", "high priority"],
+            "Impact": ["data"]
+        }
+        
+        # Both the short and the long keyword match, but not inside other words
+        matches = match_predefined_keywords("This is a HIGH priority issue about the database.", keywords)
+        self.assertEqual(matches, {"Priority": ["high", "high priority"]})
+        
+        # Only the short keyword matches when the long one is absent
+        matches = match_predefined_keywords("Highly unusual, but high.", keywords)
+        self.assertEqual(matches, {"Priority": ["high"]})
 
 if __name__ == "__main__":
     unittest.main()
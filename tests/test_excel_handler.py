@@ -9,8 +9,10 @@ This module contains unit tests for the Excel handling functionality.
 import unittest
 import os
 import sys
+import shutil
 import tempfile
 import pandas as pd
+from openpyxl import Workbook
 
 # Add the src directory to the path so we can import the modules
 sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
@@ -22,18 +24,17 @@ class TestExcelHandler(unittest.TestCase):
     Test cases for Excel handler functionality.
     """
     
-    def setUp(self):
+    @classmethod
+    def setUpClass(cls):
         """
-        Set up test data and temporary files.
+        Write the template workbook once for all tests.
         """
-        # Create a temporary directory for test files
-        self.temp_dir = tempfile.TemporaryDirectory()
-        
-        # Create a temporary Excel file path
-        self.excel_path = os.path.join(self.temp_dir.name, "test_data.xlsx")
+        # Create a temporary directory for the template
+        cls.template_dir = tempfile.TemporaryDirectory()
+        cls.template_path = os.path.join(cls.template_dir.name, "test_data.xlsx")
         
         # Define sheet mapping for testing
-        self.sheet_mapping = {
+        cls.sheet_mapping = {
             "incidents": {
                 "sheet_name": "Incidents",
                 "columns": {
@@ -71,10 +72,28 @@ class TestExcelHandler(unittest.TestCase):
             "Email": ["john@test.com", "jane@example.com"]
         })
         
-        # Create the Excel file with test data
-        with pd.ExcelWriter(self.excel_path, engine='openpyxl') as writer:
+        # Create the template Excel file with test data
+        with pd.ExcelWriter(cls.template_path, engine='openpyxl') as writer:
             incidents_df.to_excel(writer, sheet_name="Incidents", index=False)
             companies_df.to_excel(writer, sheet_name="Companies", index=False)
+    
+    @classmethod
+    def tearDownClass(cls):
+        """
+        Clean up the template workbook.
+        """
+        cls.template_dir.cleanup()
+    
+    def setUp(self):
+        """
+        Set up a private copy of the template workbook.
+        """
+        # Create a temporary directory for test files
+        self.temp_dir = tempfile.TemporaryDirectory()
+        
+        # Copy the template so each test can modify its own file
+        self.excel_path = os.path.join(self.temp_dir.name, "test_data.xlsx")
+        shutil.copyfile(self.template_path, self.excel_path)
         
         # Create the Excel handler
         self.excel_handler = ExcelHandler(self.excel_path, self.sheet_mapping)
@@ -158,12 +177,15 @@ class TestExcelHandler(unittest.TestCase):
         # Check that saving was successful
         self.assertTrue(result)
         
-        # Create a new Excel handler to verify the changes were saved
-        new_handler = ExcelHandler(self.excel_path, self.sheet_mapping)
-        new_handler.load_excel()
+        # Read back only the checked columns to verify the changes were saved
+        incidents_df = pd.read_excel(
+            self.excel_path,
+            sheet_name="Incidents",
+            engine='openpyxl',
+            usecols=["Reference", "Company"]
+        )
         
         # Check that the data was saved correctly
-        incidents_df = new_handler._dataframes["incidents"]
         self.assertEqual(len(incidents_df), 3)
         self.assertEqual(incidents_df.iloc[2]["Reference"], "INC-003")
         self.assertEqual(incidents_df.iloc[2]["Company"], "Demo Inc")
@@ -188,5 +210,161 @@ class TestExcelHandler(unittest.TestCase):
         invalid_df = self.excel_handler.get_sheet_data("invalid")
         self.assertIsNone(invalid_df)
 
+class TestExcelHandlerPreview(unittest.TestCase):
+    """
+    Test cases for reading previews and sheet names.
+    """
+    
+    @classmethod
+    def setUpClass(cls):
+        """
+        Write a template workbook with a data sheet and an empty sheet.
+        """
+        cls.template_dir = tempfile.TemporaryDirectory()
+        cls.template_path = os.path.join(cls.template_dir.name, "preview.xlsx")
+        
+        data_df = pd.DataFrame({
+            "Reference": [f"INC-{i:03d}" for i in range(1, 11)],
+            "Company": ["Test Company", "Example Corp"] * 5
+        })
+        
+        with pd.ExcelWriter(cls.template_path, engine='openpyxl') as writer:
+            data_df.to_excel(writer, sheet_name="Incidents", index=False)
+            data_df.head(0).to_excel(writer, sheet_name="Empty", index=False)
+    
+    @classmethod
+    def tearDownClass(cls):
+        """
+        Clean up the template workbook.
+        """
+        cls.template_dir.cleanup()
+    
+    def setUp(self):
+        """
+        Set up a private copy of the template workbook.
+        """
+        self.temp_dir = tempfile.TemporaryDirectory()
+        self.excel_path = os.path.join(self.temp_dir.name, "preview.xlsx")
+        shutil.copyfile(self.template_path, self.excel_path)
+        
+        self.excel_handler = ExcelHandler({"file_path": self.excel_path, "selected_sheet": "Incidents"}, {})
+    
+    def tearDown(self):
+        """
+        Clean up temporary files.
+        """
+        self.temp_dir.cleanup()
+    
+    def test_peek_tail(self):
+        """
+        Test reading the header and last rows of a sheet.
+        """
+        preview = self.excel_handler.peek_tail("Incidents", 3)
+        
+        # Check the header and the last three rows
+        self.assertEqual(preview[0], ["Reference", "Company"])
+        self.assertEqual([row[0] for row in preview[1:]], ["INC-008", "INC-009", "INC-010"])
+        
+        # Check that it matches the DataFrame-based preview
+        self.assertEqual(preview, self.excel_handler.get_sheet_preview("Incidents", 3))
+        
+        # Empty and missing sheets give no preview
+        self.assertIsNone(self.excel_handler.peek_tail("Empty"))
+        self.assertIsNone(self.excel_handler.peek_tail("Missing"))
+    
+    def _write_sheet(self, rows):
+        """
+        Write rows to a new single-sheet workbook.
+        
+        Args:
+            rows: Rows of cell values, None for blank cells
+            
+        Returns:
+            Path to the workbook
+        """
+        path = os.path.join(self.temp_dir.name, "rows.xlsx")
+        workbook = Workbook()
+        for row in rows:
+            workbook.active.append(row)
+        workbook.active.title = "Data"
+        workbook.save(path)
+        return path
+    
+    def test_read_sheet_tail_blank_header_cell(self):
+        """
+        Test that a column with data under a blank header is kept.
+        """
+        path = self._write_sheet([["A", "B", None], [1, 2, "z"], [3, 4, None]])
+        
+        self.assertEqual(ExcelHandler.read_sheet_tail(path, "Data"), [["A", "B", "Unnamed: 2"], [1, 2, "z"], [3, 4, None]])
+        self.assertEqual(pd.read_excel(path).columns.tolist(), ["A", "B", "Unnamed: 2"])
+    
+    def test_read_sheet_tail_blank_first_row(self):
+        """
+        Test that a blank first row is read as a header of unnamed columns.
+        """
+        path = self._write_sheet([[None, None, None], ["A", "B", "C"], [1, 2, 3]])
+        
+        header = ["Unnamed: 0", "Unnamed: 1", "Unnamed: 2"]
+        self.assertEqual(ExcelHandler.read_sheet_tail(path, "Data"), [header, ["A", "B", "C"], [1, 2, 3]])
+        self.assertEqual(pd.read_excel(path).columns.tolist(), header)
+    
+    def test_read_sheet_tail_duplicate_headers(self):
+        """
+        Test that duplicate headers get the same suffixes as in pandas.
+        """
+        path = self._write_sheet([["A", "A", "B", "A.1", "A"], [1, 2, 3, 4, 5]])
+        
+        preview = ExcelHandler.read_sheet_tail(path, "Data")
+        self.assertEqual(preview[0], ["A", "A.2", "B", "A.1", "A.3"])
+        self.assertEqual(preview[0], pd.read_excel(path).columns.tolist())
+    
+    def test_peek_tail_after_change(self):
+        """
+        Test that a cached preview is refreshed when the file changes.
+        """
+        self.assertEqual(self.excel_handler.peek_tail("Incidents", 1)[1], ["INC-010", "Example Corp"])
+        
+        # Rewrite the sheet with a different last row and a newer modification time
+        new_df = pd.DataFrame({"Reference": ["INC-999"], "Company": ["New Company"]})
+        new_df.to_excel(self.excel_path, sheet_name="Incidents", index=False)
+        mtime = os.path.getmtime(self.excel_path) + 1
+        os.utime(self.excel_path, (mtime, mtime))
+        
+        self.assertEqual(self.excel_handler.peek_tail("Incidents", 1)[1], ["INC-999", "New Company"])
+    
+    def test_get_sheet_names(self):
+        """
+        Test reading sheet names.
+        """
+        self.assertEqual(ExcelHandler.get_sheet_names(self.excel_path), ["Incidents", "Empty"])
+        
+        # Missing files give no sheet names
+        missing_path = os.path.join(self.temp_dir.name, "missing.xlsx")
+        self.assertEqual(ExcelHandler.get_sheet_names(missing_path), [])
+    
+    def test_get_excel_sheet_info(self):
+        """
+        Test counting the data rows of each sheet.
+        """
+        self.assertEqual(ExcelHandler.get_excel_sheet_info(self.excel_path), {"Incidents": 10, "Empty": 0})
+        
+        # Rewrite the file with fewer rows and a newer modification time
+        new_df = pd.DataFrame({"Reference": ["INC-999"], "Company": ["New Company"]})
+        new_df.to_excel(self.excel_path, sheet_name="Incidents", index=False)
+        mtime = os.path.getmtime(self.excel_path) + 1
+        os.utime(self.excel_path, (mtime, mtime))
+        
+        self.assertEqual(ExcelHandler.get_excel_sheet_info(self.excel_path), {"Incidents": 1})
+        
+        # A blank first row is the header, as in pandas
+        path = self._write_sheet([[None, None], ["A", "B"], [1, 2], [None, None]])
+        self.assertEqual(ExcelHandler.get_excel_sheet_info(path), {"Data": 2})
+        self.assertEqual(len(pd.read_excel(path)), 2)
+        
+        # Missing files give no sheet information
+        missing_path = os.path.join(self.temp_dir.name, "missing.xlsx")
+        self.assertEqual(ExcelHandler.get_excel_sheet_info(missing_path), {})
+
 if __name__ == "__main__":
     unittest.main()
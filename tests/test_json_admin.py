@@ -11,6 +11,8 @@ import os
 import sys
 import tempfile
 import json
+from pathlib import Path
+from types import MappingProxyType
 
 # Add the src directory to the path so we can import the modules
 sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
@@ -18,68 +20,150 @@ sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..')
 from src.json_admin import (
     load_json_config,
     save_json_config,
+    create_backup,
     add_company_name,
     add_incident_ref_code,
     add_predefined_keyword,
     update_excel_mapping
 )
 
+# Keep test files in memory-backed storage where available
+_TEMP_ROOT = "/dev/shm" if os.path.isdir("/dev/shm") and os.access("/dev/shm", os.W_OK) else None
+
+# Use orjson for the fixture files when it is installed
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+def _dumps(obj) -> bytes:
+    """
+    Encode an object as JSON.
+    
+    Args:
+        obj: Object to encode
+        
+    Returns:
+        UTF-8 encoded JSON document
+    """
+    if orjson is not None:
+        return orjson.dumps(obj)
+    return json.dumps(obj).encode('utf-8')
+
+def _loads(data: bytes):
+    """
+    Decode a JSON document.
+    
+    Args:
+        data: UTF-8 encoded JSON document
+        
+    Returns:
+        Decoded object
+    """
+    if orjson is not None:
+        return orjson.loads(data)
+    return json.loads(data)
+
+def _write_bytes(path: str, data: bytes) -> None:
+    """
+    Write bytes to a file with a single raw write, bypassing Python's buffered IO.
+    
+    Args:
+        path: Path to the file
+        data: File contents
+    """
+    fd = os.open(path, os.O_WRONLY | os.O_CREAT | os.O_TRUNC, 0o644)
+    try:
+        os.write(fd, data)
+    finally:
+        os.close(fd)
+
+# Initial test configurations, read-only so no test can change them for the others
+_COMPANY_CONFIG = MappingProxyType({"companies": ["Test Company", "Example Corp"]})
+_INCIDENT_CONFIG = MappingProxyType({"incident_codes": {"INC-001": "Test incident", "INC-002": "Example incident"}})
+_KEYWORDS_CONFIG = MappingProxyType({
+    "categories": {
+        "Incident Type": ["outage", "breach"],
+        "Priority": ["high", "medium", "low"]
+    }
+})
+_EXCEL_CONFIG = MappingProxyType({
+    "incidents": {
+        "sheet_name": "Incidents",
+        "columns": {
+            "date": "Date",
+            "company": "Company",
+            "reference": "Reference"
+        }
+    }
+})
+
+# Fixture file contents, encoded once at import
+_COMPANY_BYTES = _dumps(_COMPANY_CONFIG.copy())
+_INCIDENT_BYTES = _dumps(_INCIDENT_CONFIG.copy())
+_KEYWORDS_BYTES = _dumps(_KEYWORDS_CONFIG.copy())
+_EXCEL_BYTES = _dumps(_EXCEL_CONFIG.copy())
+
 class TestJsonAdmin(unittest.TestCase):
     """
     Test cases for JSON administration functions.
     """
     
+    # Initial test configurations, for assertions against the fixture files
+    company_config = _COMPANY_CONFIG
+    incident_config = _INCIDENT_CONFIG
+    keywords_config = _KEYWORDS_CONFIG
+    excel_config = _EXCEL_CONFIG
+    
+    @classmethod
+    def setUpClass(cls):
+        """
+        Create one temporary directory for the whole class.
+        """
+        cls.class_temp_dir = tempfile.TemporaryDirectory(dir=_TEMP_ROOT)
+    
     def setUp(self):
         """
-        Set up test data and temporary files.
+        Set up temporary files with the initial configurations.
         """
-        # Create a temporary directory for test files
-        self.temp_dir = tempfile.TemporaryDirectory()
+        # Give each test its own subdirectory of the class directory
+        self.test_dir = os.path.join(self.class_temp_dir.name, self._testMethodName)
+        os.mkdir(self.test_dir)
         
         # Create paths for test configuration files
-        self.company_config_path = os.path.join(self.temp_dir.name, "company_name.json")
-        self.incident_config_path = os.path.join(self.temp_dir.name, "incident_ref_code.json")
-        self.keywords_config_path = os.path.join(self.temp_dir.name, "pre_defined_keywords.json")
-        self.excel_config_path = os.path.join(self.temp_dir.name, "excel_sheet_mapping.json")
-        
-        # Create initial test configurations
-        self.company_config = {"companies": ["Test Company", "Example Corp"]}
-        self.incident_config = {"incident_codes": {"INC-001": "Test incident", "INC-002": "Example incident"}}
-        self.keywords_config = {
-            "categories": {
-                "Incident Type": ["outage", "breach"],
-                "Priority": ["high", "medium", "low"]
-            }
-        }
-        self.excel_config = {
-            "incidents": {
-                "sheet_name": "Incidents",
-                "columns": {
-                    "date": "Date",
-                    "company": "Company",
-                    "reference": "Reference"
-                }
-            }
-        }
+        self.company_config_path = os.path.join(self.test_dir, "company_name.json")
+        self.incident_config_path = os.path.join(self.test_dir, "incident_ref_code.json")
+        self.keywords_config_path = os.path.join(self.test_dir, "pre_defined_keywords.json")
+        self.excel_config_path = os.path.join(self.test_dir, "excel_sheet_mapping.json")
         
-        # Save initial configurations to files
-        with open(self.company_config_path, 'w') as f:
-            json.dump(self.company_config, f)
-            
-        with open(self.incident_config_path, 'w') as f:
-            json.dump(self.incident_config, f)
-            
-        with open(self.keywords_config_path, 'w') as f:
-            json.dump(self.keywords_config, f)
-            
-        with open(self.excel_config_path, 'w') as f:
-            json.dump(self.excel_config, f)
+        # Write each pre-serialized configuration in a single call
+        payloads = [
+            (self.company_config_path, _COMPANY_BYTES),
+            (self.incident_config_path, _INCIDENT_BYTES),
+            (self.keywords_config_path, _KEYWORDS_BYTES),
+            (self.excel_config_path, _EXCEL_BYTES)
+        ]
+        for path, payload in payloads:
+            _write_bytes(path, payload)
     
-    def tearDown(self):
+    @classmethod
+    def tearDownClass(cls):
         """
-        Clean up temporary files.
+        Clean up the temporary files of all tests.
         """
-        self.temp_dir.cleanup()
+        cls.class_temp_dir.cleanup()
+    
+    def _reload(self, path: str):
+        """
+        Read a saved configuration back from disk.
+        
+        Args:
+            path: Path to the JSON file
+            
+        Returns:
+            Decoded configuration
+        """
+        return _loads(Path(path).read_bytes())
     
     def test_load_json_config(self):
         """
@@ -95,15 +179,14 @@ class TestJsonAdmin(unittest.TestCase):
         self.assertIn("Test Company", config["companies"])
         
         # Test loading non-existent file
-        non_existent_path = os.path.join(self.temp_dir.name, "non_existent.json")
+        non_existent_path = os.path.join(self.test_dir, "non_existent.json")
         config = load_json_config(non_existent_path)
         self.assertIsNone(config)
         
         # Test loading invalid JSON
-        invalid_path = os.path.join(self.temp_dir.name, "invalid.json")
-        with open(invalid_path, 'w') as f:
-            f.write("This is not valid JSON")
-            
+        invalid_path = os.path.join(self.test_dir, "invalid.json")
+        Path(invalid_path).write_bytes(b"This is not valid JSON")
+        
         config = load_json_config(invalid_path)
         self.assertIsNone(config)
     
@@ -113,7 +196,7 @@ class TestJsonAdmin(unittest.TestCase):
         """
         # Create new configuration
         new_config = {"test": "value"}
-        new_path = os.path.join(self.temp_dir.name, "new_config.json")
+        new_path = os.path.join(self.test_dir, "new_config.json")
         
         # Save the configuration
         result = save_json_config(new_path, new_config)
@@ -123,11 +206,71 @@ class TestJsonAdmin(unittest.TestCase):
         self.assertTrue(os.path.exists(new_path))
         
         # Load the saved configuration and check it
-        with open(new_path, 'r') as f:
-            loaded_config = json.load(f)
-            
+        loaded_config = self._reload(new_path)
+        
         self.assertEqual(loaded_config, new_config)
     
+    def test_save_json_config_unicode(self):
+        """
+        Test that non-ASCII text is saved as UTF-8 rather than escaped.
+        """
+        # Save a configuration with non-ASCII text
+        new_config = {"companies": ["Société Générale", "東京電力"]}
+        new_path = os.path.join(self.test_dir, "unicode_config.json")
+        self.assertTrue(save_json_config(new_path, new_config))
+        
+        # Check the raw text and the round trip
+        text = Path(new_path).read_bytes().decode('utf-8')
+        
+        self.assertIn("Société Générale", text)
+        self.assertEqual(json.loads(text), new_config)
+    
+    def test_save_json_config_layout(self):
+        """
+        Test that saved files use the same layout whether or not orjson is installed.
+        """
+        new_config = {"companies": ["Société Générale"], "mappings": {"empty": {}, "columns": []}}
+        new_path = os.path.join(self.test_dir, "layout_config.json")
+        self.assertTrue(save_json_config(new_path, new_config))
+        
+        # The file matches what json itself writes with 2-space indentation
+        expected = json.dumps(new_config, indent=2, ensure_ascii=False).encode('utf-8')
+        self.assertEqual(Path(new_path).read_bytes(), expected)
+    
+    def test_save_json_config_replaces_file(self):
+        """
+        Test that saving over an existing file leaves no temporary file behind.
+        """
+        # Overwrite an existing configuration
+        new_config = {"companies": ["Replaced Corp"]}
+        result = save_json_config(self.company_config_path, new_config)
+        self.assertTrue(result)
+        
+        # Check the new content and that the temporary file is gone
+        config = self._reload(self.company_config_path)
+        
+        self.assertEqual(config, new_config)
+        self.assertFalse(os.path.exists(self.company_config_path + ".tmp"))
+    
+    def test_create_backup(self):
+        """
+        Test creating a backup of a configuration file.
+        """
+        # Create the backup
+        result = create_backup(self.company_config_path)
+        
+        # Check that the backup was created in the backups directory
+        self.assertTrue(result)
+        backup_dir = os.path.join(self.test_dir, "backups")
+        backups = os.listdir(backup_dir)
+        self.assertEqual(len(backups), 1)
+        self.assertTrue(backups[0].startswith("company_name_"))
+        
+        # Check that the backup content matches the original
+        config = self._reload(os.path.join(backup_dir, backups[0]))
+        
+        self.assertEqual(config, self.company_config)
+    
     def test_add_company_name(self):
         """
         Test adding a company name.
@@ -139,9 +282,8 @@ class TestJsonAdmin(unittest.TestCase):
         self.assertTrue(result)
         
         # Load the updated configuration and check it
-        with open(self.company_config_path, 'r') as f:
-            config = json.load(f)
-            
+        config = self._reload(self.company_config_path)
+        
         self.assertIn("New Company", config["companies"])
         self.assertEqual(len(config["companies"]), 3)
         
@@ -150,9 +292,8 @@ class TestJsonAdmin(unittest.TestCase):
         self.assertTrue(result)  # Should still return True for duplicates
         
         # Check that no duplicate was added
-        with open(self.company_config_path, 'r') as f:
-            config = json.load(f)
-            
+        config = self._reload(self.company_config_path)
+        
         self.assertEqual(len(config["companies"]), 3)
     
     def test_add_incident_ref_code(self):
@@ -166,9 +307,8 @@ class TestJsonAdmin(unittest.TestCase):
         self.assertTrue(result)
         
         # Load the updated configuration and check it
-        with open(self.incident_config_path, 'r') as f:
-            config = json.load(f)
-            
+        config = self._reload(self.incident_config_path)
+        
         self.assertIn("INC-003", config["incident_codes"])
         self.assertEqual(config["incident_codes"]["INC-003"], "New incident")
         self.assertEqual(len(config["incident_codes"]), 3)
@@ -178,9 +318,8 @@ class TestJsonAdmin(unittest.TestCase):
         self.assertTrue(result)  # Should still return True for duplicates
         
         # Check that no duplicate was added
-        with open(self.incident_config_path, 'r') as f:
-            config = json.load(f)
-            
+        config = self._reload(self.incident_config_path)
+        
         self.assertEqual(len(config["incident_codes"]), 3)
     
     def test_add_predefined_keyword(self):
@@ -194,9 +333,8 @@ class TestJsonAdmin(unittest.TestCase):
         self.assertTrue(result)
         
         # Load the updated configuration and check it
-        with open(self.keywords_config_path, 'r') as f:
-            config = json.load(f)
-            
+        config = self._reload(self.keywords_config_path)
+        
         self.assertIn("failure", config["categories"]["Incident Type"])
         self.assertEqual(len(config["categories"]["Incident Type"]), 3)
         
@@ -207,9 +345,8 @@ class TestJsonAdmin(unittest.TestCase):
         self.assertTrue(result)
         
         # Load the updated configuration and check it
-        with open(self.keywords_config_path, 'r') as f:
-            config = json.load(f)
-            
+        config = self._reload(self.keywords_config_path)
+        
         self.assertIn("Status", config["categories"])
         self.assertIn("resolved", config["categories"]["Status"])
         self.assertEqual(len(config["categories"]["Status"]), 1)
@@ -219,9 +356,8 @@ class TestJsonAdmin(unittest.TestCase):
         self.assertTrue(result)  # Should still return True for duplicates
         
         # Check that no duplicate was added
-        with open(self.keywords_config_path, 'r') as f:
-            config = json.load(f)
-            
+        config = self._reload(self.keywords_config_path)
+        
         self.assertEqual(len(config["categories"]["Incident Type"]), 3)
     
     def test_update_excel_mapping(self):
@@ -242,9 +378,8 @@ class TestJsonAdmin(unittest.TestCase):
         self.assertTrue(result)
         
         # Load the updated configuration and check it
-        with open(self.excel_config_path, 'r') as f:
-            config = json.load(f)
-            
+        config = self._reload(self.excel_config_path)
+        
         self.assertEqual(config["incidents"]["columns"], new_mapping)
         self.assertEqual(len(config["incidents"]["columns"]), 4)
         
@@ -263,9 +398,8 @@ class TestJsonAdmin(unittest.TestCase):
         self.assertTrue(result)
         
         # Load the updated configuration and check it
-        with open(self.excel_config_path, 'r') as f:
-            config = json.load(f)
-            
+        config = self._reload(self.excel_config_path)
+        
         self.assertIn(new_data_type, config)
         self.assertEqual(config[new_data_type]["sheet_name"], new_sheet)
         self.assertEqual(config[new_data_type]["columns"], new_mapping)
@@ -0,0 +1,93 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+Tests for the logger module.
+
+This module contains unit tests for the buffered log file handler.
+"""
+
+import unittest
+import os
+import sys
+import logging
+import tempfile
+
+# Add the src directory to the path so we can import the modules
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+
+from src.utils.logger import _BufferedRotatingFileHandler
+
+class TestBufferedRotatingFileHandler(unittest.TestCase):
+    """
+    Test cases for the buffered rotating file handler.
+    """
+    
+    def setUp(self):
+        """
+        Set up a handler writing to a temporary log file.
+        """
+        self.temp_dir = tempfile.TemporaryDirectory()
+        self.log_path = os.path.join(self.temp_dir.name, "test.log")
+        self.handler = _BufferedRotatingFileHandler(self.log_path, maxBytes=1024 * 1024, backupCount=1, encoding="utf-8")
+        self.handler.setFormatter(logging.Formatter("%(levelname)s %(message)s"))
+    
+    def tearDown(self):
+        """
+        Close the handler and clean up temporary files.
+        """
+        self.handler.close()
+        self.temp_dir.cleanup()
+    
+    def _log(self, level: int, message: str) -> None:
+        """
+        Pass a record to the handler.
+        
+        Args:
+            level: Record level
+            message: Record message
+        """
+        self.handler.handle(logging.LogRecord("test", level, __file__, 1, message, None, None))
+    
+    def test_info_waits_for_warning(self):
+        """
+        Test that INFO records stay buffered until a WARNING record.
+        """
+        for i in range(5):
+            self._log(logging.INFO, f"info {i}")
+        self.assertEqual(os.path.getsize(self.log_path), 0)
+        
+        # A warning writes out everything buffered before it
+        self._log(logging.WARNING, "warning")
+        with open(self.log_path, encoding="utf-8") as f:
+            lines = f.read().splitlines()
+        
+        self.assertEqual(lines, [f"INFO info {i}" for i in range(5)] + ["WARNING warning"])
+    
+    def test_info_written_on_close(self):
+        """
+        Test that buffered INFO records are written when the handler closes.
+        """
+        self._log(logging.INFO, "info")
+        self.assertEqual(os.path.getsize(self.log_path), 0)
+        
+        self.handler.close()
+        with open(self.log_path, encoding="utf-8") as f:
+            self.assertEqual(f.read(), "INFO info\n")
+    
+    def test_rollover(self):
+        """
+        Test that the file is rotated once the tracked size reaches maxBytes.
+        """
+        self.handler.maxBytes = 100
+        
+        # Each record is 16 bytes, so the seventh one starts a new file
+        for i in range(7):
+            self._log(logging.INFO, f"message {i:02d}")
+        self.handler.flush()
+        
+        self.assertEqual(os.path.getsize(self.log_path + ".1"), 96)
+        with open(self.log_path, encoding="utf-8") as f:
+            self.assertEqual(f.read(), "INFO message 06\n")
+
+if __name__ == "__main__":
+    unittest.main()